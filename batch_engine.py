@@ -0,0 +1,420 @@
+import numpy as np
+from timer_scheduler import TIME_EPSILON
+
+# 속도 전환(이징) 유형 코드 - FrontCarModel.speed_transition_type 문자열에 대응
+LINEAR = 0
+EASE_IN = 1
+EASE_OUT = 2
+EASE_IN_OUT = 3
+
+class FrontCarBatch:
+    """N개 에피소드의 앞 차량을 NumPy 배열로 한 번에 진행하는 엔진
+
+    브레이크 상태 기계, 속도 이징, 브레이크 후효과, 차선 내 좌우 움직임까지
+    FrontCarModel.update와 같은 규칙을 같은 순서로 적용한다.
+    타이머는 TimerScheduler와 같이 만료 시각(*_at) 배열로 두고, 경과 시간 time이 그 시각에 닿으면 만료된 것으로 본다.
+    """
+    # FrontCarModel과 같은 상수
+    min_speed = 80
+    max_speed = 160
+    cruise_speed = 120
+    move_speed = 3.0
+    max_lane_deviation = 40
+    deceleration_threshold = 1.0
+
+    def __init__(self, n, x=400, rng=None, width=60):
+        self.n = n
+        # 난수 생성기 (numpy Generator 또는 시드 값)
+        self.rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+        self.all = np.ones(n, dtype=bool)
+        self.time = 0.0  # 경과 시간 (초, 타이머 기준)
+        self.width = np.full(n, width, dtype=np.int64)
+
+        # 위치 및 속도 (FrontCarModel.__init__과 같은 순서로 난수 사용)
+        self.x = np.full(n, x, dtype=np.float64)
+        self.speed = self._uniform(self.all, 100, 140)
+        self.target_speed = self.speed.copy()
+        self.prev_speed = self.speed.copy()
+
+        # 이징(easing) 관련 변수
+        self.is_speed_transitioning = np.zeros(n, dtype=bool)
+        self.speed_transition_timer = np.zeros(n)
+        self.speed_transition_duration = np.zeros(n)
+        self.speed_transition_start = self.speed.copy()
+        self.speed_transition_type = np.full(n, LINEAR, dtype=np.int8)
+
+        # 브레이크 관련 변수
+        self.is_braking = np.zeros(n, dtype=bool)
+        self.brake_duration = np.zeros(n)
+        self.brake_intensity = np.zeros(n, dtype=np.int8)
+        self.next_brake_time = self._uniform(self.all, 1.5, 3.0)
+        self.brake_at = self.next_brake_time.copy()  # 다음 브레이크 시각
+        self.brake_end_at = np.full(n, np.inf)  # 브레이크 종료 시각
+
+        # 브레이크 후효과
+        self.brake_afterglow = np.zeros(n, dtype=bool)
+        self.afterglow_duration = np.zeros(n)
+        self.afterglow_end_at = np.full(n, np.inf)  # 후효과 종료 시각
+
+        # 브레이크등
+        self.brake_lights_on = np.zeros(n, dtype=bool)
+        self.is_decelerating = np.zeros(n, dtype=bool)
+
+        # 좌우 움직임
+        self.lane_change_interval = self._uniform(self.all, 1.0, 2.5)
+        self.lane_change_at = self.lane_change_interval.copy()  # 다음 목표 위치 변경 시각
+        self.target_x = self.x + self._uniform(self.all, -30, 30)
+
+        # 속도 변화 랜덤화
+        self.next_speed_change = self._uniform(self.all, 3, 6)
+        self.speed_change_at = self.next_speed_change.copy()  # 다음 속도 변화 시각
+
+    def _due(self, at):
+        """만료 시각이 지난 에피소드 (TimerScheduler.advance와 같은 여유 적용)"""
+        return at <= self.time + TIME_EPSILON
+
+    def _random(self, mask):
+        """mask에 해당하는 에피소드마다 [0, 1) 난수 하나씩 뽑기 (결과는 길이 n 배열)"""
+        values = np.zeros(self.n)
+        count = np.count_nonzero(mask)
+        if count:
+            values[mask] = self.rng.random(count)
+        return values
+
+    def _uniform(self, mask, a, b):
+        """random.uniform과 같은 방식(a + (b - a) * u)으로 균등 난수 생성"""
+        return a + (b - a) * self._random(mask)
+
+    def update(self, road_left, road_right, dt=1/60):
+        """모든 에피소드의 앞 차량 상태를 dt초만큼 업데이트"""
+        # 시간 진행 및 이전 속도 저장 (감속 감지용)
+        self.time += dt
+        self.prev_speed[:] = self.speed
+
+        # 랜덤 속도 변화 적용 (평소 운전 패턴)
+        change = ~self.is_braking & self._due(self.speed_change_at)
+        if change.any():
+            self.next_speed_change = np.where(change, self._uniform(change, 2.5, 5.5), self.next_speed_change)
+            self.speed_change_at = np.where(change, self.time + self.next_speed_change, self.speed_change_at)
+
+            cruise_deviation = self._uniform(change, -15, 15)
+            new_target_speed = np.clip(self.cruise_speed + cruise_deviation, self.min_speed, self.max_speed)
+
+            # 작은 변화는 무시하고, 가속은 더 빠르게 (0.6~1.2초)
+            significant = change & (np.abs(new_target_speed - self.target_speed) > 3)
+            speeding_up = new_target_speed > self.speed
+            duration = np.clip(0.6 + (np.abs(new_target_speed - self.speed) / 60) * 0.6, 0.6, 1.2)
+            self.start_speed_transition(significant & speeding_up, new_target_speed, EASE_IN_OUT, duration)
+            self.start_speed_transition(significant & ~speeding_up, new_target_speed, EASE_IN_OUT)
+
+            # 큰 속도 변화일 경우 브레이크 효과 추가 (100km/h 이상에서만)
+            self.apply_brake(change & (new_target_speed < self.speed - 5) & (self.speed >= 100))
+
+        # 다음 브레이크 시간이 됐을 때 (100km/h 이상에서만)
+        self.apply_brake(~self.is_braking & ~self.brake_afterglow &
+                         self._due(self.brake_at) & (self.speed >= 100))
+
+        braking = self.is_braking.copy()
+        afterglow = ~braking & self.brake_afterglow
+
+        # 브레이크 중인 경우
+        if braking.any():
+            # 브레이크 세기에 따라 속도 감소 (매 프레임 전환을 다시 시작)
+            weak = braking & (self.brake_intensity == 1)
+            strong = braking & (self.brake_intensity != 1)
+            self.start_speed_transition(weak, np.maximum(self.min_speed, self.speed - 60), EASE_OUT, 2)
+            self.start_speed_transition(strong, np.maximum(self.min_speed, self.speed - 150), EASE_OUT, 4)
+            self.brake_lights_on[braking] = True
+
+            # 브레이크 시간이 끝났을 때 후효과 활성화
+            finished = braking & self._due(self.brake_end_at)
+            if finished.any():
+                self.brake_end_at[finished] = np.inf
+                self.release_brake(finished)
+                self.brake_afterglow[finished] = True
+                self.afterglow_duration = np.where(finished, self._uniform(finished, 1.5, 2.5),
+                                                   self.afterglow_duration)
+                self.afterglow_end_at = np.where(finished, self.time + self.afterglow_duration,
+                                                 self.afterglow_end_at)
+
+        # 브레이크 후효과 업데이트
+        if afterglow.any():
+            finished = afterglow & self._due(self.afterglow_end_at)
+            if finished.any():
+                self.afterglow_end_at[finished] = np.inf
+                self.brake_afterglow[finished] = False
+                self.next_brake_time = np.where(finished, self._uniform(finished, 1.0, 2.5), self.next_brake_time)
+                self.brake_at = np.where(finished, self.time + self.next_brake_time, self.brake_at)
+                self.brake_lights_on[finished & ~self.is_decelerating] = False
+
+                # 브레이크 후 순항 속도로 복귀하는 경향
+                slow = finished & (self.speed < self.cruise_speed - 20)
+                return_target = np.minimum(self.cruise_speed, self.speed + self._uniform(slow, 20, 40))
+                self.start_speed_transition(slow, return_target, EASE_IN, 1.0)
+
+        self.update_speed_with_easing(dt)
+        self.update_lane_position(road_left, road_right, dt)
+        self.check_deceleration()
+
+    def update_speed_with_easing(self, dt=1/60):
+        """이징(easing) 방식으로 속도 업데이트"""
+        active = self.is_speed_transitioning
+        if not active.any():
+            return
+
+        self.speed_transition_timer[active] += dt
+        progress = np.minimum(1.0, self.speed_transition_timer / np.where(active, self.speed_transition_duration, 1.0))
+
+        # 전환 유형별 이징 함수 적용
+        kind = self.speed_transition_type
+        eased = progress.copy()
+        ease_in = kind == EASE_IN
+        p = progress[ease_in]
+        eased[ease_in] = p * p * p
+        ease_out = kind == EASE_OUT
+        eased[ease_out] = 1 - (1 - progress[ease_out]) ** 3
+        in_out = kind == EASE_IN_OUT
+        p = progress[in_out]
+        eased[in_out] = np.where(p < 0.5, 4 * p * p * p, 1 - (-2 * p + 2) ** 3 / 2)
+
+        speed = self.speed_transition_start + (self.target_speed - self.speed_transition_start) * eased
+        speed = np.clip(speed, self.min_speed, self.max_speed)
+
+        # 이징 완료 확인
+        done = active & (progress >= 1.0)
+        speed = np.where(done, self.target_speed, speed)
+        self.speed = np.where(active, speed, self.speed)
+        self.is_speed_transitioning = active & ~done
+
+    def start_speed_transition(self, mask, target_speed, transition_type=EASE_IN_OUT, duration=None):
+        """mask에 해당하는 에피소드의 속도 이징 전환 시작"""
+        if not mask.any():
+            return
+        target = np.clip(target_speed, self.min_speed, self.max_speed)
+        self.target_speed = np.where(mask, target, self.target_speed)
+        self.speed_transition_start = np.where(mask, self.speed, self.speed_transition_start)
+        self.speed_transition_type[mask] = transition_type
+
+        # 전환 지속 시간 - 지정되지 않으면 속도 차이에 따라 동적 조정
+        if duration is None:
+            speed_ratio = np.abs(target - self.speed) / (self.max_speed - self.min_speed)
+            duration = np.where(target > self.speed,
+                                np.clip(0.5 + speed_ratio * 1.0, 0.5, 1.5),
+                                np.clip(0.5 + speed_ratio * 1.5, 0.5, 2.0))
+        self.speed_transition_duration = np.where(mask, duration, self.speed_transition_duration)
+
+        self.speed_transition_timer[mask] = 0
+        self.is_speed_transitioning |= mask
+
+    def check_deceleration(self):
+        """감속 여부 확인 및 브레이크등 관리"""
+        self.is_decelerating = (self.prev_speed - self.speed) > self.deceleration_threshold
+        self.brake_lights_on |= self.is_decelerating
+        self.brake_lights_on &= self.is_decelerating | self.is_braking | self.brake_afterglow
+
+    def update_lane_position(self, road_left, road_right, dt=1/60):
+        """차선 내에서 좌우 움직임 업데이트"""
+        road_center = (road_left + road_right) // 2
+
+        # 새로운 목표 위치 설정
+        change = self._due(self.lane_change_at)
+        if change.any():
+            self.lane_change_interval = np.where(change, self._uniform(change, 1.0, 2.5), self.lane_change_interval)
+            self.lane_change_at = np.where(change, self.time + self.lane_change_interval, self.lane_change_at)
+            max_deviation = np.minimum(self.max_lane_deviation,
+                                       (road_right - road_left) // 2 - self.width // 2 - 5)
+            self.target_x = np.where(change, road_center + self._uniform(change, -max_deviation, max_deviation),
+                                     self.target_x)
+
+        # 부드럽게 목표 위치로 이동
+        move_step = self.move_speed * (dt * 60)
+        moving = np.abs(self.x - self.target_x) > move_step
+        self.x = np.where(moving, np.where(self.x < self.target_x, self.x + move_step, self.x - move_step), self.x)
+
+        # 도로 경계 확인 및 수정 (경계에 닿으면 안쪽으로 방향 전환)
+        half_width = self.width // 2
+        left_hit = self.x - half_width < road_left + 5
+        right_hit = ~left_hit & (self.x + half_width > road_right - 5)
+        hit = left_hit | right_hit
+        if hit.any():
+            bounce = self._uniform(hit, 15, 30)
+            self.x = np.where(left_hit, road_left + half_width + 5, self.x)
+            self.x = np.where(right_hit, road_right - half_width - 5, self.x)
+            self.target_x = np.where(left_hit, self.x + bounce, np.where(right_hit, self.x - bounce, self.target_x))
+
+    def apply_brake(self, mask):
+        """mask에 해당하는 에피소드에 브레이크 적용 (100km/h 미만은 제외)"""
+        mask = mask & (self.speed >= 100)
+        if not mask.any():
+            return
+
+        self.is_braking |= mask
+
+        # 브레이크 단계 1 또는 2 (70% 확률로 강한 브레이크) - random.choices와 같은 판정
+        intensity = np.where(self._random(mask) * 100 < 30, 1, 2)
+        self.brake_intensity = np.where(mask, intensity, self.brake_intensity).astype(np.int8)
+
+        # 브레이크 강도에 따라 지속 시간 차별화
+        u = self._random(mask)
+        duration = np.where(intensity == 1, 1.5 + 0.5 * u, 2.5 + 1.5 * u)
+        self.brake_duration = np.where(mask, duration, self.brake_duration)
+
+        # 브레이크 종료 예약, 다음 브레이크 시각은 지금부터 다시 계산
+        self.brake_end_at = np.where(mask, self.time + duration, self.brake_end_at)
+        self.brake_at = np.where(mask, self.time + self.next_brake_time, self.brake_at)
+
+        # 목표 속도 감소 (이징을 통해 점진적으로 적용)
+        brake_amount = np.where(intensity == 1, 60, 130)
+        self.start_speed_transition(mask, np.maximum(self.min_speed, self.speed - brake_amount), EASE_OUT,
+                                    np.where(intensity == 1, 1.2, 1.8))
+        self.brake_lights_on |= mask
+
+    def release_brake(self, mask):
+        """mask에 해당하는 에피소드의 브레이크 해제"""
+        self.is_braking &= ~mask
+        u = self._random(mask)
+
+        # 약한 브레이크 후 복귀 - 순항 속도 기준으로 조정
+        weak = mask & (self.brake_intensity == 1)
+        below_cruise = self.speed < self.cruise_speed
+        weak_target = np.where(below_cruise,
+                               np.minimum(self.cruise_speed + 10, self.speed + (20 + 10 * u)),
+                               np.maximum(self.cruise_speed, self.speed - (5 + 10 * u)))
+        self.start_speed_transition(weak, np.clip(weak_target, self.min_speed, self.max_speed), EASE_IN, 0.8)
+
+        # 강한 브레이크 후 강한 가속
+        strong = mask & (self.brake_intensity != 1)
+        far_below = self.speed < self.cruise_speed - 30
+        self.start_speed_transition(strong & far_below,
+                                    np.minimum(self.cruise_speed + 20, self.speed + (40 + 20 * u)), EASE_IN, 1.2)
+        self.start_speed_transition(strong & ~far_below,
+                                    np.minimum(self.max_speed, self.cruise_speed + (-10 + 30 * u)), EASE_IN_OUT, 1.5)
+
+        # 감속 중이 아니라면 브레이크등 끄기
+        self.brake_lights_on &= ~(mask & ~self.is_decelerating)
+
+class CarPairBatch:
+    """N개의 앞 차량/플레이어 차량 쌍을 한 번에 진행하는 엔진
+
+    앞 차량은 FrontCarBatch, 플레이어 차량은 PlayerCarModel과 같은 가속/감속 이징을 따른다.
+    CarSimulation의 운전 모드나 충돌 회복 연출은 포함하지 않으며,
+    차간 거리가 최소 거리 이하로 줄어들면 충돌로 기록한다. 단계 동안 차간 거리는 선형으로 변하므로
+    충돌 시각은 단계 안에서 최소 거리에 닿은 정확한 시각으로 기록한다 (큰 시간 간격에서도 같은 값).
+    """
+    # PlayerCarModel과 같은 상수
+    player_min_speed = 10
+    player_max_speed = 180
+    speed_change = 5
+    acceleration_factor = 2.5
+    min_car_distance = 8
+
+    def __init__(self, n, rng=None, player_speed=60, car_distance=250, road_left=200, road_right=600):
+        self.n = n
+        self.road_left = road_left
+        self.road_right = road_right
+        self.initial_player_speed = player_speed
+        self.initial_car_distance = car_distance
+        self.front = FrontCarBatch(n, x=(road_left + road_right) // 2, rng=rng)
+
+        # 플레이어 차량 상태
+        self.speed = np.full(n, player_speed, dtype=np.float64)
+        self.target_speed = self.speed.copy()
+        self.prev_target_speed = self.speed.copy()
+        self.is_accelerating = np.zeros(n, dtype=bool)
+        self.acceleration_timer = np.zeros(n)
+        self.acceleration_duration = np.ones(n)
+
+        # 쌍 상태
+        self.car_distance = np.full(n, car_distance, dtype=np.float64)
+        self.traveled_distance = np.zeros(n)
+        self.crash_count = np.zeros(n, dtype=np.int64)
+        self.in_contact = np.zeros(n, dtype=bool)  # 직전 단계에 최소 거리에 닿아 있었는지
+        self.impact_time = np.full(n, np.nan)  # 마지막 충돌 시각 (초, 충돌이 없으면 NaN)
+        self.impact_speed = np.zeros(n)  # 마지막 충돌 순간의 접근 속도 (플레이어 속도 - 앞차 속도)
+        self.sim_time = 0.0
+
+    def reset(self, mask):
+        """mask에 해당하는 쌍만 처음 상태로 되돌림 (같은 난수 생성기로 새 쌍을 만들어 복사)
+
+        타이머 만료 시각(*_at)은 경과 시간 기준이므로 새 쌍의 값에 현재 경과 시간을 더한다.
+        """
+        count = np.count_nonzero(mask)
+        if count == 0:
+            return
+        fresh = CarPairBatch(count, self.front.rng, self.initial_player_speed, self.initial_car_distance,
+                             self.road_left, self.road_right)
+        for target, source in ((self, fresh), (self.front, fresh.front)):
+            for name, value in vars(source).items():
+                if isinstance(value, np.ndarray) and value.shape == (count,):
+                    if name.endswith("_at"):
+                        value = value + target.time
+                    getattr(target, name)[mask] = value
+
+    def accelerate(self, mask):
+        """mask에 해당하는 플레이어 차량 가속 (PlayerCarModel.accelerate와 같은 계산)"""
+        acceleration = self.speed_change * (1 + (self.speed / self.player_max_speed) * self.acceleration_factor)
+        acceleration = np.where(self.speed < 80, acceleration * 1.5, acceleration)
+        self.target_speed = np.where(mask, np.minimum(self.player_max_speed, self.target_speed + acceleration),
+                                     self.target_speed)
+
+    def decelerate(self, mask):
+        """mask에 해당하는 플레이어 차량 감속 (PlayerCarModel.decelerate와 같은 계산)"""
+        deceleration = self.speed_change * (1 + (1 - self.speed / self.player_max_speed) * self.acceleration_factor)
+        deceleration = np.where(self.speed > 120, deceleration * 1.5, deceleration)
+        self.target_speed = np.where(mask, np.maximum(self.player_min_speed, self.target_speed - deceleration),
+                                     self.target_speed)
+
+    def update_player_speed(self, dt=1/60):
+        """이징(easing) 방식으로 플레이어 속도 업데이트"""
+        moving = np.abs(self.speed - self.target_speed) > 0.5
+
+        # 새로운 목표 속도로 바뀌었다면 이징 과정 재시작
+        restart = moving & (~self.is_accelerating | (np.abs(self.target_speed - self.prev_target_speed) > 0.5))
+        if restart.any():
+            speed_ratio = np.abs(self.target_speed - self.speed) / self.player_max_speed
+            duration = np.where(self.target_speed > self.speed,
+                                np.clip(0.5 + speed_ratio * 1.5, 0.5, 2.0),
+                                np.clip(0.3 + speed_ratio * 1.2, 0.3, 1.5))
+            self.acceleration_duration = np.where(restart, duration, self.acceleration_duration)
+            self.acceleration_timer[restart] = 0
+            self.prev_target_speed = np.where(restart, self.target_speed, self.prev_target_speed)
+
+        self.acceleration_timer[moving] += dt
+        progress = np.minimum(1.0, self.acceleration_timer / self.acceleration_duration)
+        # 가속은 cubic, 감속은 quadratic 이징
+        p = progress
+        cubic = np.where(p < 0.5, 4 * p * p * p, 1 - (-2 * p + 2) ** 3 / 2)
+        quad = np.where(p < 0.5, 2 * p * p, 1 - (-2 * p + 2) ** 2 / 2)
+        eased = np.where(self.target_speed > self.speed, cubic, quad)
+        speed = self.speed + (self.target_speed - self.speed) * eased
+
+        done = ~moving | (progress >= 1.0)
+        self.speed = np.where(done, self.target_speed, speed)
+        self.is_accelerating = moving & ~done
+
+    def update(self, dt=1/60, player_target_speed=None):
+        """모든 쌍을 dt초만큼 진행 (player_target_speed로 플레이어 목표 속도를 직접 지정 가능)"""
+        if player_target_speed is not None:
+            self.target_speed = np.clip(np.broadcast_to(player_target_speed, (self.n,)).astype(np.float64),
+                                        self.player_min_speed, self.player_max_speed)
+        self.sim_time += dt
+        self.update_player_speed(dt)
+        self.front.update(self.road_left, self.road_right, dt)
+
+        # 차량 간 거리 업데이트 및 최소 거리 제한
+        closing = self.speed - self.front.speed
+        start_distance = self.car_distance
+        self.car_distance = start_distance - closing * dt
+        contact = self.car_distance <= self.min_car_distance
+        crashed = contact & ~self.in_contact
+        self.crash_count += crashed
+        self.in_contact = contact
+
+        # 새 충돌은 최소 거리에 닿은 시각과 그때의 접근 속도 기록
+        if crashed.any():
+            reach = (start_distance[crashed] - self.min_car_distance) / closing[crashed]
+            self.impact_time[crashed] = self.sim_time - dt + np.clip(reach, 0.0, dt)
+            self.impact_speed[crashed] = closing[crashed]
+        np.maximum(self.car_distance, self.min_car_distance, out=self.car_distance)
+
+        self.traveled_distance += self.speed * dt
@@ -0,0 +1,123 @@
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+from car_simulation import CarSimulation, FRAME_DT
+from drivers import DRIVERS, make_driver
+from session_stats import GOAL_DISTANCE, SAFE_GAP_MIN, SAFE_GAP_MAX, RunningStats
+
+def episode_rng(master_seed, episode):
+    """에피소드별 독립 난수 생성기 - 작업자 수와 상관없이 같은 에피소드는 같은 난수열을 사용"""
+    return random.Random(f"{master_seed}:{episode}")
+
+def run_episode(task):
+    """화면 없이 에피소드 하나를 실행하고 결과를 사전으로 반환"""
+    episode, master_seed, driver_name, dt, max_time = task
+    sim = CarSimulation(input_source=make_driver(driver_name), rng=episode_rng(master_seed, episode))
+
+    steps = 0
+    gap_stats = RunningStats()  # 단계별 차간 거리
+    safe_time = 0.0
+    goal_time = None
+
+    while sim.sim_time < max_time:
+        sim.update(dt)
+        steps += 1
+
+        # 차간 거리 통계 누적
+        gap = sim.car_distance
+        gap_stats.add(gap)
+        if SAFE_GAP_MIN <= gap <= SAFE_GAP_MAX:
+            safe_time += dt
+
+        if sim.traveled_distance >= GOAL_DISTANCE:
+            goal_time = sim.sim_time
+            break
+
+    return {
+        "episode": episode,
+        "crashes": sim.crash_count,
+        "goal_time": goal_time,
+        "steps": steps,
+        "gap": gap_stats,
+        "safe_time": safe_time,
+        "sim_time": sim.sim_time
+    }
+
+def percentile(sorted_values, q):
+    """정렬된 값 목록의 q 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def summarize(results):
+    """에피소드 결과 목록을 하나의 요약으로 합침 (에피소드 번호 순으로 합산해 결과가 항상 같음)"""
+    results = sorted(results, key=lambda r: r["episode"])
+    gap = RunningStats()
+    for r in results:
+        gap.merge(r["gap"])
+    total_time = sum(r["sim_time"] for r in results)
+    crashes = [r["crashes"] for r in results]
+    goal_times = sorted(r["goal_time"] for r in results if r["goal_time"] is not None)
+
+    return {
+        "episodes": len(results),
+        "crashes": {
+            "total": sum(crashes),
+            "episodes_with_crash": sum(1 for c in crashes if c > 0),
+            "mean_per_episode": sum(crashes) / len(results) if results else 0.0
+        },
+        "headway": {
+            "mean": gap.mean,
+            "std": gap.std(),
+            "min": gap.min if gap.weight > 0 else None,
+            "safe_band_ratio": sum(r["safe_time"] for r in results) / total_time if total_time else 0.0
+        },
+        "goal": {
+            "reached": len(goal_times),
+            "mean_time": sum(goal_times) / len(goal_times) if goal_times else None,
+            "median_time": percentile(goal_times, 50),
+            "p90_time": percentile(goal_times, 90)
+        }
+    }
+
+def run_batch(episodes, seed=0, driver="follower", workers=1, dt=FRAME_DT, max_time=600):
+    """여러 에피소드를 프로세스 풀에서 실행하고 요약 반환"""
+    tasks = [(episode, seed, driver, dt, max_time) for episode in range(episodes)]
+    if workers <= 1:
+        results = [run_episode(task) for task in tasks]
+    else:
+        chunksize = max(1, episodes // (workers * 8))
+        with multiprocessing.Pool(workers) as pool:
+            results = list(pool.imap_unordered(run_episode, tasks, chunksize=chunksize))
+    return summarize(results)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="화면 없이 CarGame 규칙으로 몬테카를로 에피소드를 실행합니다.")
+    parser.add_argument("-n", "--episodes", type=int, default=100, help="실행할 에피소드 수")
+    parser.add_argument("-j", "--workers", type=int, default=multiprocessing.cpu_count(), help="작업 프로세스 수")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="마스터 시드")
+    parser.add_argument("-d", "--driver", choices=sorted(DRIVERS), default="follower", help="플레이어 운전자")
+    parser.add_argument("--dt", type=float, default=FRAME_DT, help="시뮬레이션 시간 간격 (초)")
+    parser.add_argument("--max-time", type=float, default=600, help="에피소드 최대 시뮬레이션 시간 (초)")
+    parser.add_argument("-o", "--output", help="요약을 저장할 JSON 파일 (없으면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    summary = run_batch(args.episodes, args.seed, args.driver, args.workers, args.dt, args.max_time)
+    summary["seed"] = args.seed
+    summary["driver"] = args.driver
+
+    text = json.dumps(summary, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
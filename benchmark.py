@@ -0,0 +1,143 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# 디스플레이 없이 실행 (pygame import 전에 설정해야 함)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from car_game import CarGame
+from front_car import FrontCar
+from player_car import PlayerCar
+from render_budget import HALF_RESOLUTION
+
+def measure(func, min_time=0.2, repeats=5):
+    """func를 반복 호출해 초당 실행 횟수 측정 (repeats번 중 가장 빠른 값)
+
+    한 번의 측정이 min_time초 이상 걸리도록 호출 횟수를 두 배씩 늘려 정한다.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed / number
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return 1.0 / best
+
+def build_benchmarks():
+    """측정할 항목 이름 -> 인자 없는 함수"""
+    game = CarGame(seed=0)
+    game.stats.goal_distance = float("inf")  # 반복 측정 중 목표 지점에 도달해 멈추지 않도록
+    surface = pygame.Surface((game.width, game.height))
+
+    front_car = FrontCar(400, 150, rng=random.Random(0))
+    player_car = PlayerCar(400, 500)
+    player_car.press("up")
+
+    crash_game = CarGame(seed=0)
+    crash_game.show_crash_effect = True
+    crash_game.last_crash_time = crash_game.sim_clock()
+    
+    # 가장 낮은 상세도 단계 (절반 해상도 도로와 번쩍임)
+    low_detail_game = CarGame(seed=0)
+    low_detail_game.show_crash_effect = True
+    low_detail_game.last_crash_time = low_detail_game.sim_clock()
+    low_detail_game.render_budget.set_level(HALF_RESOLUTION)
+
+    return {
+        # 시뮬레이션
+        "FrontCar.update": lambda: front_car.update(200, 600),
+        "PlayerCar.update": lambda: player_car.update(200, 600),
+        "CarGame.update": game.update,
+        "CarGame.update_speed_change_pattern": game.update_speed_change_pattern,
+        "CarGame.adjust_front_car_behavior": game.adjust_front_car_behavior,
+        "CarGame.check_collision": game.check_collision,
+        # 그리기 (디스플레이가 아닌 서피스에)
+        "FrontCar.draw": lambda: front_car.draw(surface),
+        "PlayerCar.draw": lambda: player_car.draw(surface),
+        "CarGame.draw": game.draw,
+        "CarGame.draw (crash effect)": crash_game.draw,
+        "CarGame.draw (crash, low detail)": low_detail_game.draw
+    }
+
+def run_benchmarks(names=None, min_time=0.2, repeats=5):
+    """벤치마크를 실행하고 항목별 결과 사전 반환"""
+    results = {}
+    for name, func in build_benchmarks().items():
+        if names and not any(pattern in name for pattern in names):
+            continue
+        ops = measure(func, min_time, repeats)
+        results[name] = {"ops_per_sec": ops, "us_per_op": 1e6 / ops}
+    return results
+
+def compare(baseline, results, threshold):
+    """기준 결과와 비교해 (이름, 기준, 현재, 변화율, 회귀 여부) 목록 반환"""
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+        rows.append((name, base["ops_per_sec"], result["ops_per_sec"], change, change < -threshold))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시뮬레이션과 그리기 핵심 경로의 초당 실행 횟수를 측정합니다.")
+    parser.add_argument("-o", "--output", help="결과를 기준 파일(JSON)로 저장")
+    parser.add_argument("-c", "--compare", help="비교할 기준 파일 (JSON)")
+    parser.add_argument("-t", "--threshold", type=float, default=0.1, help="회귀로 판단할 속도 저하 비율 (기본 0.1 = 10%%)")
+    parser.add_argument("-k", "--filter", action="append", help="이름에 이 문자열이 들어간 항목만 실행 (여러 번 지정 가능)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="측정 한 번의 최소 시간 (초)")
+    parser.add_argument("--repeats", type=int, default=5, help="측정 반복 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    results = run_benchmarks(args.filter, args.min_time, args.repeats)
+
+    for name, result in results.items():
+        print(f"{name:<36} {result['ops_per_sec']:>12.0f} /s {result['us_per_op']:>10.2f} us")
+
+    if args.output:
+        data = {
+            "meta": {
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "platform": platform.platform(),
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S")
+            },
+            "results": results
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+
+    status = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        print()
+        for name, base, current, change, regressed in compare(baseline, results, args.threshold):
+            mark = "  회귀" if regressed else ""
+            print(f"{name:<36} {base:>12.0f} -> {current:>12.0f} /s {change:>+8.1%}{mark}")
+            if regressed:
+                status = 1
+
+    pygame.quit()
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,908 @@
+import random
+import math
+import copy
+from operator import attrgetter
+import numpy as np
+from player_car_model import PlayerCarModel
+from front_car_model import FrontCarModel
+from timer_scheduler import TimerScheduler
+from platoon_model import PlatoonModel
+from highway_model import HighwayModel, sweep_and_prune
+
+# 기본 시뮬레이션 시간 간격 (60fps 한 프레임, 초)
+FRAME_DT = 1/60
+
+# 충돌 후 회복 중에 멈추는 속도 패턴 타이머
+PATTERN_TIMERS = ("game.speed_change", "game.driving_pattern", "game.traffic_flow",
+                  "game.road_condition", "game.sudden_brake")
+
+class NullInput:
+    """아무 조작도 하지 않는 기본 입력 소스"""
+    
+    def poll(self, simulation):
+        """이번 프레임의 조작 입력 목록 반환 ((action, pressed) 튜플)"""
+        return ()
+
+class CarSimulation:
+    """CarGame 규칙의 시뮬레이션 코어 (pygame 없이 동작)
+    
+    clock: 밀리초 단위 시간을 반환하는 함수 (없으면 시뮬레이션 시간 사용)
+    input_source: poll(simulation)으로 조작 입력을 돌려주는 객체
+    rng: random.Random 호환 난수 생성기 (없으면 전역 random 모듈 사용)
+    recorder: 매 단계 상태를 기록할 객체 (record(simulation) 메서드, 없으면 기록하지 않음)
+    platoon_size: 앞 차량 앞에 늘어설 선행 차량 수 (대열 주행 모드, 0이면 사용하지 않음)
+    lanes: 도로의 차선 수 (도로 폭을 나눔, 1이면 차선 구분 없음)
+    traffic_size: 여러 차선을 함께 달리는 주변 차량 수 (0이면 사용하지 않음)
+    
+    속도 변경 주기, 운전 모드 변경, 교통 흐름/도로 상태/급제동/충돌 회복의 종료 시점은
+    앞 차량과 함께 쓰는 타이머 스케줄러(self.timers)에 예약되고, 매 단계 sim_time까지 진행된다.
+    
+    세션 상태는 state_fields, 두 차량의 state_fields, 타이머 예약, 난수 생성기 상태가 전부이므로
+    snapshot()/restore()는 이 값들만 복사하고, fork()는 같은 상태에서 갈라지는 세션을 만든다.
+    """
+    # 생성할 차량 클래스 (화면 출력용 게임에서는 그리기 가능한 클래스로 교체)
+    player_car_class = PlayerCarModel
+    front_car_class = FrontCarModel
+    platoon_class = PlatoonModel
+    traffic_class = HighwayModel
+    
+    # snapshot()/restore()로 저장하는 시뮬레이션 상태 (나머지 속성은 설정 값과 차량/입력 객체 참조)
+    state_fields = ("frame_count", "sim_time", "time_accumulator", "traveled_distance", "car_distance",
+                    "current_driving_mode", "mode_duration", "driving_pattern_due",
+                    "speed_change_interval", "speed_change_due", "target_speed_factor",
+                    "traffic_flow_active", "traffic_flow_phase", "traffic_flow_phase_start",
+                    "traffic_flow_phase_due", "traffic_flow_initial_speed",
+                    "road_condition_active", "road_condition_duration", "road_condition_factor",
+                    "road_condition_end_due", "sudden_brake_active", "sudden_brake_end_due",
+                    "collision_recovery", "collision_recovery_duration", "collision_recovery_end_due",
+                    "collision_recovery_start",
+                    "game_over", "crash_time", "crash_count", "last_crash_time", "last_impact_speed",
+                    "show_crash_effect", "last_update_time")
+    __slots__ = state_fields + ("width", "height", "rng", "sim_clock", "input_source", "recorder", "timers",
+                                "road_width", "road_left", "road_right", "player_car", "front_car",
+                                "min_car_distance", "max_visual_distance", "driving_modes",
+                                "crash_effect_duration", "platoon", "lanes", "traffic",
+                                "contact_distance", "step_start_distance", "step_start_player_x",
+                                "step_start_front_x")
+    _get_state = attrgetter(*state_fields)
+    
+    def __init__(self, width=800, height=600, clock=None, input_source=None, rng=None, recorder=None, platoon_size=0,
+                 lanes=1, traffic_size=0):
+        self.width = width
+        self.height = height
+        self.rng = rng if rng is not None else random
+        
+        # 시간 및 입력 소스 설정
+        self.sim_clock = clock if clock is not None else self.simulated_ticks
+        self.input_source = input_source if input_source is not None else NullInput()
+        self.recorder = recorder
+        
+        # 타이머 스케줄러 (앞 차량과 공유, 시뮬레이션 시간 기준)
+        self.timers = TimerScheduler()
+        self.register_timers()
+        
+        # 도로 설정
+        self.road_width = 400
+        self.road_left = (self.width - self.road_width) // 2
+        self.road_right = self.road_left + self.road_width
+        self.lanes = lanes
+        
+        # 세션이 바뀌어도 그대로인 설정 값
+        self.min_car_distance = 8  # 최소 차량 간 거리 감소 (10 → 8)
+        self.max_visual_distance = self.height * 0.7  # 화면에 표시할 최대 시각적 거리
+        self.driving_modes = ["normal", "aggressive", "cautious"]
+        self.crash_effect_duration = 2000  # 충돌 효과 지속 시간 (2초)
+        
+        # 차량과 대열/주변 차량은 세션을 시작할 때 만듦
+        self.player_car = None
+        self.front_car = None
+        self.platoon = None
+        self.traffic = None
+        self._start_session(platoon_size, traffic_size)
+    
+    def reset(self, rng=None, input_source=None):
+        """같은 설정(화면, 도로, 대열/주변 차량 수, 시계, 기록기)으로 처음부터 새 세션 시작
+        
+        차량 객체와 타이머 스케줄러는 그대로 두고 상태만 처음으로 되돌린다. rng와 input_source를 주면 새 세션에서
+        그것을 쓴다. 난수는 생성자와 같은 순서로 뽑으므로 같은 시드의 rng로 되돌린 세션은 새로 만든 세션과 같다.
+        """
+        if rng is not None:
+            self.rng = rng
+        if input_source is not None:
+            self.input_source = input_source
+        self.timers.reset()
+        self._start_session(self.platoon.n if self.platoon is not None else 0,
+                            self.traffic.n if self.traffic is not None else 0)
+    
+    def _start_session(self, platoon_size, traffic_size):
+        """세션 상태 초기화 (생성자와 reset()이 함께 씀, 타이머 스케줄러는 비어 있어야 함)"""
+        # 시간
+        self.frame_count = 0  # 진행된 시뮬레이션 프레임 수
+        self.sim_time = 0.0  # 진행된 시뮬레이션 시간 (초)
+        self.time_accumulator = 0.0  # advance()에서 아직 진행하지 않은 시간 (초)
+        
+        # 게임 변수
+        self.traveled_distance = 0  # 이동한 거리 (미터)
+        
+        # 차량 초기화 (다시 시작할 때는 같은 차량 객체의 주행 상태만 되돌림)
+        if self.player_car is None:
+            self.player_car = self.player_car_class(self.width // 2, self.height - 100)
+            self.front_car = self.front_car_class(self.width // 2, 150, rng=self.rng, timers=self.timers)  # y 위치를 200에서 150으로 변경하여 더 위쪽에 배치
+        else:
+            self.player_car.reset(self.width // 2, self.height - 100)
+            self.front_car.rng = self.rng
+            self.front_car.reset(self.width // 2, 150)
+        
+        # 거리 관련 변수
+        self.car_distance = 250  # 초기 차량 간 실제 거리를 100m에서 250m로 증가
+        self.contact_distance = self._contact_distance()  # 두 차량이 세로로 겹치기 시작하는 차간 거리
+        
+        # 연속 충돌 판정용 단계 시작 값 (매 단계 update() 시작 시 갱신)
+        self.step_start_distance = self.car_distance
+        self.step_start_player_x = self.player_car.x
+        self.step_start_front_x = self.front_car.x
+        
+        # 대열 주행 모드: 앞 차량 앞에 한 줄로 늘어선 선행 차량 (앞 차량은 대열 맨 뒤 차량을 따라감)
+        self.platoon = None
+        if platoon_size > 0:
+            self.platoon = self.platoon_class(platoon_size, self.car_distance, x=self.width // 2,
+                                              rng=self.rng.getrandbits(64))
+        
+        # 여러 차선 모드: 차선마다 늘어선 주변 차량 (플레이어 앞쪽부터 배치)
+        self.traffic = None
+        if traffic_size > 0:
+            self.traffic = self.traffic_class(traffic_size, self.lanes, self.road_left, self.road_width,
+                                              rng=self.rng.getrandbits(64))
+        
+        # 앞 차량의 운전 행동 패턴
+        self.current_driving_mode = "normal"
+        self.mode_duration = self.rng.randint(5000, 15000)  # 5~15초마다 운전 스타일 변경
+        self.driving_pattern_due = False
+        self.timers.start("game.driving_pattern", self.mode_duration / 1000)
+        
+        # 앞차 속도 변화 패턴 관련 변수
+        self.speed_change_interval = self.rng.randint(2000, 5000)  # 2~5초마다 속도 변경
+        self.speed_change_due = False
+        self.timers.start("game.speed_change", self.speed_change_interval / 1000)
+        self.target_speed_factor = 1.0  # 목표 속도 계수
+        
+        # 교통 흐름 패턴 (감속 후 점진적 회복)
+        self.traffic_flow_active = False
+        self.traffic_flow_phase = "slowdown"  # "slowdown" 또는 "recovery"
+        self.traffic_flow_phase_start = 0.0  # 현재 단계 시작 시간 (초)
+        self.traffic_flow_phase_due = False
+        self.traffic_flow_initial_speed = 0.0
+        
+        # 도로 상태에 따른 일시적 속도 변화
+        self.road_condition_active = False
+        self.road_condition_duration = 0.0
+        self.road_condition_factor = 1.0
+        self.road_condition_end_due = False
+        
+        # 급제동 (공격적 운전)
+        self.sudden_brake_active = False
+        self.sudden_brake_end_due = False
+        
+        # 충돌 후 회복
+        self.collision_recovery = False
+        self.collision_recovery_duration = 2.0  # 충돌 후 회복에 걸리는 시간(초)
+        self.collision_recovery_end_due = False
+        self.collision_recovery_start = 0.0  # 회복을 시작한 시뮬레이션 시간 (초)
+        
+        # 게임 상태
+        self.game_over = False
+        self.crash_time = 0
+        self.crash_count = 0  # 충돌 횟수 기록
+        self.last_crash_time = 0  # 마지막 충돌 시간 (단계 안의 정확한 충돌 시각, 밀리초)
+        self.last_impact_speed = 0.0  # 마지막 충돌 순간의 접근 속도 (플레이어 속도 - 앞차 속도)
+        self.show_crash_effect = False  # 충돌 효과 표시 여부
+        
+        # 시간 설정
+        self.last_update_time = self.sim_clock()
+    
+    def register_timers(self):
+        """타이머 만료 콜백을 스케줄러에 등록 (fork로 새 스케줄러를 받았을 때 다시 호출)"""
+        self.timers.register("game.speed_change", self._on_speed_change_due)
+        self.timers.register("game.driving_pattern", self._on_driving_pattern_due)
+        self.timers.register("game.traffic_flow", self._on_traffic_flow_phase_end)
+        self.timers.register("game.road_condition", self._on_road_condition_end)
+        self.timers.register("game.sudden_brake", self._on_sudden_brake_end)
+        self.timers.register("game.collision_recovery", self._on_collision_recovery_end)
+    
+    def snapshot(self):
+        """세션 상태를 튜플로 저장 (시뮬레이션, 두 차량, 타이머 예약, 난수 생성기, 대열, 주변 차량 상태)"""
+        return (self._get_state(self), self.player_car.snapshot(), self.front_car.snapshot(),
+                self.timers.snapshot(), self.rng.getstate(),
+                self.platoon.snapshot() if self.platoon is not None else None,
+                self.traffic.snapshot() if self.traffic is not None else None)
+    
+    def restore(self, state):
+        """snapshot()으로 저장한 세션 상태로 되돌림 (같은 입력이면 저장 이후와 같은 궤적을 다시 만듦)"""
+        values, player, front, timers, rng_state, platoon, traffic = state
+        for name, value in zip(self.state_fields, values):
+            setattr(self, name, value)
+        self.player_car.restore(player)
+        self.front_car.restore(front)
+        self.timers.restore(timers)
+        self.rng.setstate(rng_state)
+        if platoon is not None:
+            self.platoon.restore(platoon)
+        if traffic is not None:
+            self.traffic.restore(traffic)
+    
+    def fork(self, input_source=None, recorder=None):
+        """현재 상태에서 갈라지는 새 세션 반환 ("지금 브레이크를 밟았다면" 같은 분기용)
+        
+        새 세션은 난수 생성기, 타이머 스케줄러, 차량을 따로 가지므로 원래 세션과 독립적으로 진행되며,
+        조작 입력은 input_source(없으면 조작 없음)에서 받고 기록기는 공유하지 않는다.
+        """
+        clone = copy.copy(self)
+        clone.rng = random.Random()
+        clone.timers = TimerScheduler()
+        clone.register_timers()
+        clone.player_car = copy.copy(self.player_car)
+        clone.front_car = copy.copy(self.front_car)
+        clone.front_car.rng = clone.rng
+        clone.front_car.timers = clone.timers
+        clone.front_car.own_timers = False
+        clone.front_car.register_timers()
+        if self.platoon is not None:
+            clone.platoon = copy.deepcopy(self.platoon)
+        if self.traffic is not None:
+            clone.traffic = copy.deepcopy(self.traffic)
+        clone.input_source = input_source if input_source is not None else NullInput()
+        clone.recorder = recorder
+        if self.sim_clock == self.simulated_ticks:
+            clone.sim_clock = clone.simulated_ticks
+        clone.restore(self.snapshot())
+        return clone
+    
+    def _on_speed_change_due(self):
+        self.speed_change_due = True
+    
+    def _on_driving_pattern_due(self):
+        self.driving_pattern_due = True
+    
+    def _on_traffic_flow_phase_end(self):
+        self.traffic_flow_phase_due = True
+    
+    def _on_road_condition_end(self):
+        self.road_condition_end_due = True
+    
+    def _on_sudden_brake_end(self):
+        self.sudden_brake_end_due = True
+    
+    def _on_collision_recovery_end(self):
+        self.collision_recovery_end_due = True
+    
+    def simulated_ticks(self):
+        """시뮬레이션 시간으로 계산한 경과 시간 (밀리초)"""
+        return int(round(self.sim_time * 1000))
+    
+    def step(self, dt=FRAME_DT):
+        """dt초만큼 시뮬레이션을 한 단계 진행"""
+        self.update(dt)
+    
+    def advance(self, seconds, dt=FRAME_DT):
+        """주어진 시간만큼 고정 간격 dt로 시뮬레이션 진행 (빨리 감기)
+        
+        같은 dt를 쓰는 한 실시간 플레이와 동일한 궤적을 만든다.
+        남은 자투리 시간은 다음 호출로 이월되며, 진행한 단계 수를 반환한다.
+        """
+        self.time_accumulator += seconds
+        steps = 0
+        # 부동소수점 오차로 마지막 단계를 놓치지 않도록 약간의 여유를 둠
+        while self.time_accumulator >= dt * (1 - 1e-9) and not self.game_over:
+            self.update(dt)
+            self.time_accumulator -= dt
+            steps += 1
+        return steps
+    
+    def _scale_per_frame(self, probability, dt):
+        """60fps 한 프레임 기준 확률(또는 비율)을 dt 동안의 값으로 변환"""
+        frames = dt * 60
+        if frames == 1:
+            return probability
+        return 1 - (1 - probability) ** frames
+    
+    def poll_input(self):
+        """입력 소스의 조작 입력을 플레이어 차량에 적용"""
+        for action, pressed in self.input_source.poll(self):
+            if pressed:
+                self.player_car.press(action)
+            else:
+                self.player_car.release(action)
+    
+    def on_crash(self):
+        """새로운 충돌이 기록될 때 호출 (하위 클래스에서 재정의)"""
+        pass
+    
+    def update(self, dt=FRAME_DT):
+        """게임 상태 업데이트 (dt: 시뮬레이션 시간 간격, 초)"""
+        if self.game_over:
+            return
+        
+        # 연속 충돌 판정을 위해 단계 시작 시점의 차간 거리와 좌우 위치 저장
+        self.step_start_distance = self.car_distance
+        self.step_start_player_x = self.player_car.x
+        self.step_start_front_x = self.front_car.x
+        
+        # 시뮬레이션 시간 진행 및 조작 입력 반영
+        self.frame_count += 1
+        self.sim_time += dt
+        self.timers.advance(self.sim_time)
+        self.poll_input()
+        
+        # 플레이어 차량 업데이트
+        self.player_car.update(self.road_left, self.road_right, dt)
+        
+        # 속도 값 안전 확인 (무한대 방지)
+        self.player_car.speed = min(max(self.player_car.speed, self.player_car.min_speed), self.player_car.max_speed)
+        self.player_car.target_speed = min(max(self.player_car.target_speed, self.player_car.min_speed), self.player_car.max_speed)
+        
+        # 앞 차량 업데이트
+        self.front_car.update(self.road_left, self.road_right, dt)
+        
+        # 앞차 속도 안전 확인 (무한대 방지)
+        self.front_car.speed = min(max(self.front_car.speed, self.front_car.min_speed), self.front_car.max_speed)
+        self.front_car.target_speed = min(max(self.front_car.target_speed, self.front_car.min_speed), self.front_car.max_speed)
+        
+        # 충돌 후 회복 상태에서는 속도 패턴을 적용하지 않음
+        if not self.collision_recovery:
+            # 앞차 속도 변화 패턴 업데이트
+            self.update_speed_change_pattern(dt)
+            
+            # 운전 패턴 업데이트
+            self.update_driving_pattern(dt)
+            
+            # 앞 차량 행동 조정 - 안전 거리 기반 로직 제거하고 단순화
+            self.adjust_front_car_behavior(dt)
+        
+        # 대열 주행: 선행 차량을 진행하고, 앞 차량은 대열 맨 뒤 차량과의 간격이 허용하는 속도로 제한
+        if self.platoon is not None:
+            self.platoon.update(self.road_left, self.road_right, dt)
+            front_position = self.traveled_distance + self.car_distance
+            self.front_car.speed = float(self.platoon.follower_speed(front_position, self.front_car.speed))
+        
+        # 여러 차선 모드: 플레이어와 앞 차량을 앞차로 인식하게 하여 주변 차량을 진행하고,
+        # 앞 차량은 자기 차선의 바로 앞 차량과의 간격이 허용하는 속도로 제한
+        if self.traffic is not None:
+            front_position = self.traveled_distance + self.car_distance
+            front_lane = self.traffic.lane_of(self.front_car.x)
+            self.traffic.update(dt, ((self.traffic.lane_of(self.player_car.x), self.traveled_distance, self.player_car.speed),
+                                     (front_lane, front_position, self.front_car.speed)))
+            self.front_car.speed = float(self.traffic.follower_speed(front_lane, front_position, self.front_car.speed))
+        
+        # 차량 간 거리 업데이트 (속도차이에 따른 거리 변화)
+        distance_change = (self.front_car.speed - self.player_car.speed) * dt  # 초당 거리 변화
+        self.car_distance += distance_change
+        
+        # 최소 거리 제한
+        self.car_distance = max(self.car_distance, self.min_car_distance)
+        
+        # 충돌 검사
+        self.check_collision(dt)
+        
+        # 충돌 효과 업데이트
+        current_time = self.sim_clock()
+        if self.show_crash_effect and current_time - self.last_crash_time > self.crash_effect_duration:
+            self.show_crash_effect = False
+        
+        # 이동 거리 누적 - 무한대 방지
+        if not math.isinf(self.player_car.speed) and not math.isnan(self.player_car.speed):
+            self.traveled_distance += self.player_car.speed * dt  # 초당 거리 누적
+        
+        # 대열 주행: 충돌로 밀려난 앞 차량은 대열을 지나치지 않고 뒤에서 밀어냄
+        if self.platoon is not None:
+            self.platoon.push(self.traveled_distance + self.car_distance, self.front_car.speed)
+        
+        # 거리에 따른 앞 차량의 시각적 위치 계산
+        front_car_visual_y = self._calculate_front_car_visual_position()
+        
+        # 원근감에 따른 앞 차량의 크기 조정
+        size_ratio = self._calculate_size_ratio()
+        self.front_car.set_visual_size(size_ratio)
+        
+        # 앞 차량의 시각적 위치 업데이트
+        self.front_car.y = front_car_visual_y
+        
+        # 주행 궤적 기록
+        if self.recorder is not None:
+            self.recorder.record(self)
+    
+    def update_speed_change_pattern(self, dt=FRAME_DT):
+        """앞차의 속도 변화 패턴을 관리"""
+        # 속도 변화 간격에 도달하면 새로운 목표 속도 설정
+        if self.speed_change_due:
+            self.speed_change_due = False
+            
+            # 운전 모드에 따른 속도 변화 간격 설정
+            if self.current_driving_mode == "aggressive":
+                self.speed_change_interval = self.rng.randint(2000, 4000)  # 2~4초 (1.5~3초 → 2~4초)
+            elif self.current_driving_mode == "cautious":
+                self.speed_change_interval = self.rng.randint(5000, 8000)  # 5~8초 (변경 없음)
+            else:  # normal
+                self.speed_change_interval = self.rng.randint(3000, 6000)  # 3~6초 (3~5초 → 3~6초)
+            self.timers.start("game.speed_change", self.speed_change_interval / 1000)
+            
+            # 현재 속도를 기준으로 새로운 목표 속도 설정
+            base_speed = self.front_car.speed
+            
+            # 운전 모드에 따른 속도 변화 특성 (변화폭 축소)
+            if self.current_driving_mode == "aggressive":
+                # 공격적 운전: 약간 빠른 속도 변화
+                if self.rng.random() < 0.15:  # 15% 확률로 조금 더 큰 변화
+                    # 급가속 또는 급감속 (변화폭 축소)
+                    if self.rng.random() < 0.5:  # 급가속
+                        target_factor = self.rng.uniform(1.1, 1.2)  # 10~20% 속도 변화 (1.3~1.5 → 1.1~1.2)
+                    else:  # 급감속
+                        target_factor = self.rng.uniform(0.7, 0.85)  # 15~30% 속도 변화 (0.5~0.7 → 0.7~0.85)
+                else:
+                    # 일반적인 공격적 패턴 (변화폭 축소)
+                    target_factor = self.rng.uniform(0.9, 1.15)  # 10~15% 속도 변화 (0.8~1.3 → 0.9~1.15)
+                
+                # 플레이어 차량 추월 시도 (20% 확률)
+                if self.rng.random() < 0.2 and self.car_distance > 50:
+                    player_based_factor = self.player_car.speed / base_speed * 1.05  # 5% 더 빠르게 (1.1 → 1.05)
+                    target_factor = max(target_factor, player_based_factor)
+            
+            elif self.current_driving_mode == "cautious":
+                # 조심스러운 운전: 매우 점진적인 속도 변화
+                target_factor = self.rng.uniform(0.95, 1.03)  # 더 작은 폭 (0.9~1.05 → 0.95~1.03)
+                
+                # 안전거리 확보를 위한 속도 조절
+                player_speed_kph = self.player_car.speed * 3.6  # m/s에서 km/h로 변환
+                safe_speed_factor = 0.95  # 플레이어보다 약간 느리게 (0.9 → 0.95)
+                
+                # 거리가 가까우면 더 느리게
+                if self.car_distance < 100:
+                    safe_speed_factor = 0.9  # 더 높게 설정 (0.8 → 0.9)
+                
+                # 플레이어 속도 기반 목표 설정 (조심스러운 추종)
+                player_based_target = self.player_car.speed * safe_speed_factor
+                player_weight = 0.7  # 플레이어 속도에 대한 가중치
+                
+                # 플레이어 속도와 랜덤 요소를 조합
+                target_speed_from_player = player_based_target
+                target_speed_from_random = base_speed * target_factor
+                
+                # 가중 평균 계산
+                target_speed = (target_speed_from_player * player_weight + 
+                               target_speed_from_random * (1 - player_weight))
+                
+                # 최종 목표 속도 계수 계산
+                target_factor = target_speed / base_speed if base_speed > 0 else 1.0
+            
+            else:  # normal
+                # 일반 운전: 안정적인 속도 변화
+                target_factor = self.rng.uniform(0.9, 1.1)  # 더 작은 폭 (0.85~1.15 → 0.9~1.1)
+                
+                # 가끔 플레이어 속도에 맞추기 (40% 확률)
+                if self.rng.random() < 0.4:
+                    # 플레이어와 비슷한 속도로 조정하되 약간의 변동성 추가
+                    player_based_target = self.player_car.speed * self.rng.uniform(0.95, 1.03)  # 더 작은 폭 (0.9~1.05 → 0.95~1.03)
+                    random_based_target = base_speed * target_factor
+                    
+                    # 두 요소를 혼합
+                    mix_ratio = self.rng.uniform(0.4, 0.6)  # 혼합 비율 안정화 (0.3~0.7 → 0.4~0.6)
+                    target_speed = (player_based_target * mix_ratio + 
+                                  random_based_target * (1 - mix_ratio))
+                    
+                    target_factor = target_speed / base_speed if base_speed > 0 else 1.0
+                
+                # 교통 흐름 시뮬레이션 (주기적으로 속도 감소 후 회복)
+                if self.rng.random() < 0.1:  # 10% 확률
+                    # 패턴 시작: 감속 후 점진적 회복
+                    self.traffic_flow_active = True
+                    self.traffic_flow_phase = "slowdown"
+                    self.traffic_flow_phase_start = self.sim_time
+                    self.traffic_flow_phase_due = False
+                    self.timers.start("game.traffic_flow", 2.0)  # 2초 감속
+                    self.traffic_flow_initial_speed = base_speed
+                    target_factor = self.rng.uniform(0.7, 0.85)  # 더 높게 설정 (0.6~0.8 → 0.7~0.85)
+            
+            # 목표 속도 제한 (최대/최소 속도 범위 내에서 설정)
+            target_speed = base_speed * target_factor
+            
+            # 속도 변화가 너무 급격하지 않도록 제한
+            max_change = 15  # 최대 속도 변화를 15km/h로 제한
+            if abs(target_speed - base_speed) > max_change:
+                if target_speed > base_speed:
+                    target_speed = base_speed + max_change
+                else:
+                    target_speed = base_speed - max_change
+            
+            target_speed = min(max(target_speed, self.front_car.min_speed), self.front_car.max_speed)
+            self.front_car.target_speed = target_speed
+            
+            # 도로 상태에 따른 무작위 속도 변화 (요철, 커브 등)
+            if self.rng.random() < 0.05:  # 5% 확률
+                # 일시적인 속도 변화 (커브, 장애물 등)
+                self.road_condition_active = True
+                self.road_condition_duration = self.rng.uniform(1.0, 3.0)  # 1~3초
+                self.road_condition_factor = self.rng.uniform(0.9, 1.05)  # 변화폭 축소 (0.85~1.1 → 0.9~1.05)
+                self.road_condition_end_due = False
+                self.timers.start("game.road_condition", self.road_condition_duration)
+        
+        # 교통 흐름 패턴 처리 (감속 후 점진적 회복)
+        if self.traffic_flow_active:
+            if self.traffic_flow_phase == "slowdown" and self.traffic_flow_phase_due:
+                # 감속 후 회복 단계로 전환
+                self.traffic_flow_phase = "recovery"
+                self.traffic_flow_phase_start = self.sim_time
+                self.traffic_flow_phase_due = False
+                self.timers.start("game.traffic_flow", 5.0)  # 5초 회복
+            
+            elif self.traffic_flow_phase == "recovery":
+                # 점진적 회복 (5초에 걸쳐 원래 속도로)
+                if self.traffic_flow_phase_due:
+                    self.traffic_flow_phase_due = False
+                    self.traffic_flow_active = False
+                else:
+                    # 회복 비율 계산 (0에서 1 사이로 증가)
+                    recovery_ratio = min(1.0, (self.sim_time - self.traffic_flow_phase_start) / 5.0)
+                    target_speed = (self.traffic_flow_initial_speed * 0.8 +  # 더 높게 설정 (0.7 → 0.8)
+                                  recovery_ratio * (self.traffic_flow_initial_speed * 0.2))  # 더 작게 설정 (0.3 → 0.2)
+                    self.front_car.target_speed = target_speed
+        
+        # 도로 상태에 따른 일시적 속도 변화
+        if self.road_condition_active:
+            if self.road_condition_end_due:
+                self.road_condition_end_due = False
+                self.road_condition_active = False
+            else:
+                # 도로 상태로 인한 일시적 속도 조정 (부드럽게)
+                speed_adjust = (self.road_condition_factor - 1.0) * 0.5  # 절반의 효과만 적용
+                adjusted_factor = 1.0 + speed_adjust
+                # 프레임마다 곱해지던 계수를 dt에 맞게 거듭제곱으로 적용
+                self.front_car.speed = self.front_car.speed * adjusted_factor ** (dt * 60)
+        
+        # 현재 속도를 목표 속도에 서서히 접근시킴
+        speed_diff = self.front_car.target_speed - self.front_car.speed
+        if abs(speed_diff) > 0.1:  # 0.1 m/s 이상 차이가 있을 때만 조정
+            # 운전 모드에 따른 가속/감속 비율 조정 (더 부드럽게)
+            if self.current_driving_mode == "aggressive":
+                adjustment_rate = 0.5 * dt  # 중간 속도 변화 (0.8 → 0.5)
+            elif self.current_driving_mode == "cautious":
+                adjustment_rate = 0.25 * dt  # 더 느린 속도 변화 (0.3 → 0.25)
+            else:  # normal
+                adjustment_rate = 0.35 * dt  # 중간 속도 변화 (0.5 → 0.35)
+                
+            # 가속과 감속의 비율 차별화 (실제 차량처럼)
+            if speed_diff > 0:  # 가속
+                # 점진적 가속 구현
+                accel_factor = min(1.0, abs(speed_diff) / 10)  # 속도 차이가 클수록 더 빠르게 가속
+                self.front_car.speed += speed_diff * adjustment_rate * accel_factor
+            else:  # 감속
+                # 점진적 감속 구현
+                decel_factor = min(1.0, abs(speed_diff) / 8)  # 속도 차이가 클수록 더 빠르게 감속
+                self.front_car.speed += speed_diff * (adjustment_rate * 1.1) * decel_factor  # 감속은 약간 빠르게 (1.2 → 1.1)
+    
+    def update_driving_pattern(self, dt=FRAME_DT):
+        """앞 차량의 운전 패턴을 주기적으로 변경"""
+        # 패턴 변경 시간이 되면 새 패턴 설정
+        if self.driving_pattern_due:
+            self.driving_pattern_due = False
+            
+            # 다음 패턴 변경까지의 시간 (5초~15초 사이 랜덤)
+            self.mode_duration = self.rng.randint(5000, 15000)
+            self.timers.start("game.driving_pattern", self.mode_duration / 1000)
+            
+            # 운전 모드 랜덤 선택 (확률: 일반 50%, 공격적 30%, 조심스러운 20%)
+            self.current_driving_mode = self.rng.choices(self.driving_modes, [50, 30, 20], k=1)[0]
+    
+    def adjust_front_car_behavior(self, dt=FRAME_DT):
+        """앞 차량 행동 조정 (단순화된 버전)"""
+        # 운전 스타일에 따른 행동 조정
+        if self.current_driving_mode == "aggressive":
+            # 공격적 운전 스타일 - 급제동, 갑작스러운 가속, 지그재그 운전
+            
+            # 급제동 확률 (10%)
+            if self.rng.random() < self._scale_per_frame(0.005, dt):  # 프레임 당 확률 (60fps 기준 약 1/3초에 한번)
+                self.front_car.apply_brake()
+                self.sudden_brake_active = True
+                self.sudden_brake_end_due = False
+                self.timers.start("game.sudden_brake", self.rng.uniform(0.5, 1.0))
+            
+            # 급제동 해제 (0.5~1초 지속)
+            if self.sudden_brake_active:
+                if self.sudden_brake_end_due:
+                    self.sudden_brake_end_due = False
+                    self.front_car.release_brake()
+                    self.sudden_brake_active = False
+            
+            # 급가속 확률 (8%)
+            if not self.sudden_brake_active:
+                if self.rng.random() < self._scale_per_frame(0.004, dt):
+                    boost_factor = self.rng.uniform(1.1, 1.3)
+                    self.front_car.speed = min(self.front_car.speed * boost_factor, self.front_car.max_speed)
+            
+            # 차선 이탈 확률 (차선 내에서 좌우 이동)
+            if self.rng.random() < self._scale_per_frame(0.01, dt):
+                lateral_shift = self.rng.uniform(-20, 20)
+                self.front_car.x = max(self.road_left + 30, min(self.road_right - 30, self.front_car.x + lateral_shift))
+        
+        elif self.current_driving_mode == "cautious":
+            # 조심스러운 운전 스타일 - 천천히 가속/감속
+            
+            # 차선 중앙 유지 경향
+            center_x = (self.road_left + self.road_right) / 2
+            self.front_car.x += (center_x - self.front_car.x) * self._scale_per_frame(0.02, dt)  # 부드럽게 중앙으로 이동
+        
+        else:  # normal
+            # 일반 운전 스타일 - 균형 잡힌 가속/감속
+            
+            # 차선 내에서 약간의 자연스러운 움직임
+            if self.rng.random() < self._scale_per_frame(0.005, dt):
+                drift = self.rng.uniform(-10, 10)
+                self.front_car.x = max(self.road_left + 30, min(self.road_right - 30, self.front_car.x + drift))
+        
+        # 앞 차량이 도로 경계를 넘지 않도록 함
+        self.front_car.x = max(self.road_left + 30, min(self.road_right - 30, self.front_car.x))
+    
+    def _calculate_front_car_visual_position(self):
+        """거리에 따른 앞 차량의 시각적 위치 계산"""
+        # 일반 상태에서는 거리만으로 계산
+        if not self.collision_recovery:
+            return self._visual_position_for_distance(self.car_distance)
+        
+        # 화면 내에서 두 차량 사이의 시각적 최대 거리
+        visual_distance = (self.height - 200) * 0.8
+        
+        # 충돌 회복 중일 때는 더 빠르게 분리되도록 시각적 거리 확대
+        distance_ratio = min(1.0, (self.car_distance / 250))  # 거리 계수를 더 민감하게 설정 (350 → 250)
+        front_car_y = self.player_car.y - distance_ratio * visual_distance * 1.5  # 시각적 거리를 50% 확대
+        
+        # 최소/최대 제한
+        min_y = 100  # 화면 상단 제한
+        max_y = self.player_car.y - 80  # 플레이어 차량에 너무 가깝지 않도록
+        
+        return max(min_y, min(front_car_y, max_y))
+    
+    def _visual_position_for_distance(self, distance):
+        """플레이어 앞 distance m에 있는 차량의 화면 y 위치 (350m 이상은 화면 상단에 겹침)"""
+        # 화면 내에서 두 차량 사이의 시각적 최대 거리
+        visual_distance = (self.height - 200) * 0.8
+        distance_ratio = min(1.0, distance / 350)
+        front_car_y = self.player_car.y - distance_ratio * visual_distance
+        
+        # 최소/최대 제한 (화면 상단, 플레이어 차량에 너무 가깝지 않도록)
+        return max(100, min(front_car_y, self.player_car.y - 80))
+    
+    def _calculate_size_ratio(self):
+        """거리에 따른 앞 차량의 크기 비율 계산"""
+        return self._size_ratio_for_distance(self.car_distance)
+    
+    def _size_ratio_for_distance(self, distance):
+        """플레이어 앞 distance m에 있는 차량의 크기 비율"""
+        # 거리에 따른 크기 조정 (멀면 작게, 가까우면 크게) - 더 극적인 크기 변화
+        perspective_factor = 0.75  # 원근감 계수 증가 (0.6 → 0.75)
+        distance_ratio = min(1.0, distance / 350)  # 최대 거리 증가 (300 → 350)
+        size_ratio = 1.0 - distance_ratio * perspective_factor
+        
+        return size_ratio
+    
+    def check_collision(self, dt=FRAME_DT):
+        """차량 간 충돌 확인 - 스윕 앤 프룬 광역 단계와 사각형 겹침 판정, 단계 안의 연속 충돌 판정"""
+        # 단계 사이에 지나친 충돌도 찾도록 단계 안의 충돌 시각 계산 (회복 중에는 위치 계산 방식이 달라 생략)
+        impact = None if self.collision_recovery else self._time_of_impact(dt)
+        closing_speed = self.player_car.speed - self.front_car.speed
+        
+        # 각 차량의 사각형 영역 계산
+        player_rect = self._car_rect(self.player_car)
+        front_rect = self._car_rect(self.front_car)
+        
+        # 사각형이 겹치는지 확인 (두 대뿐이면 겹침 판정 한 번이 곧 스윕 앤 프룬 결과)
+        if self.traffic is None:
+            front_hit = self._rects_overlap(player_rect, front_rect)
+        else:
+            front_hit, player_hits, front_hits = self._traffic_collisions(player_rect, front_rect)
+            self._on_traffic_collisions(player_hits, front_hits)
+        
+        if front_hit or impact is not None:
+            # 충돌 시각은 단계 끝이 아니라 단계 안에서 처음 닿은 시각 (단계 끝에서만 겹치면 단계 끝)
+            impact_time = self.sim_clock() - (dt - (impact if impact is not None else dt)) * 1000
+            # 충돌 간격이 1초 이상일 때만 새로운 충돌로 카운트 (연속 충돌 방지)
+            if impact_time - self.last_crash_time > 1000:
+                self.crash_count += 1
+                self.last_crash_time = impact_time
+                self.last_impact_speed = closing_speed
+                self.show_crash_effect = True
+                self.on_crash()
+                
+                # 충돌 상태 설정 - 충돌 후 회복 시간 관리
+                # 회복 중에는 속도 패턴을 적용하지 않으므로 그 타이머들도 멈췄다가 회복 후 남은 시간부터 이어감
+                if not self.collision_recovery:
+                    self.collision_recovery_start = self.sim_time
+                    for name in PATTERN_TIMERS:
+                        self.timers.pause(name)
+                self.collision_recovery = True
+                self.collision_recovery_end_due = False
+                self.timers.start("game.collision_recovery", self.collision_recovery_duration)
+                
+                # 충돌 직후 앞 차의 y 위치를 강제로 조정하여 사각형이 겹치지 않도록 함
+                # 플레이어 차 위쪽으로 최소한의 간격을 확보
+                self.front_car.y = self.player_car.y - self.player_car.height - 20
+            
+            # 차량 사이에 최소 거리 유지 (밀착 방지)
+            self.car_distance = self.min_car_distance + 50  # 더 큰 간격으로 분리 (20 → 50)
+            
+            # 충돌 후 앞 차 속도 증가 (빠른 분리를 위함) - 변화폭 축소
+            accel_factor = self.rng.uniform(1.2, 1.4)  # 20~40% 가속 (1.5~2.0 → 1.2~1.4)
+            new_speed = min(self.front_car.max_speed, self.front_car.speed * accel_factor)
+            # 최소 속도 보장 (플레이어보다 빠르게)
+            min_escape_speed = self.player_car.speed * 1.3  # 플레이어보다 30% 빠르게 (1.5 → 1.3)
+            self.front_car.speed = max(new_speed, min_escape_speed)
+            
+            # 플레이어 속도 감소 (충돌 효과)
+            self.player_car.speed = max(self.player_car.min_speed, self.player_car.speed * 0.8)  # 속도 감소 조정 (0.7 → 0.8)
+            
+            # 앞 차가 좌우로 약간 이동하여 충돌 위치에서 벗어나도록 함
+            if self.player_car.x > self.front_car.x:
+                # 플레이어가 앞 차의 오른쪽에 있으면 앞 차는 왼쪽으로 이동
+                new_x = max(self.road_left + 40, self.front_car.x - self.rng.uniform(20, 35))  # 이동 거리 축소 (30~50 → 20~35)
+                self.front_car.x = new_x
+            else:
+                # 플레이어가 앞 차의 왼쪽에 있으면 앞 차는 오른쪽으로 이동
+                new_x = min(self.road_right - 40, self.front_car.x + self.rng.uniform(20, 35))  # 이동 거리 축소 (30~50 → 20~35)
+                self.front_car.x = new_x
+            
+            # 강제로 충돌 상태에서 벗어나기 위해 차량 간 거리를 시각적으로도 즉시 반영
+            front_car_visual_y = self._calculate_front_car_visual_position()
+            self.front_car.y = front_car_visual_y
+        
+        # 충돌 후 회복 처리
+        if self.collision_recovery:
+
+            # 회복 시간 동안 앞 차는 플레이어보다 빠르게 유지
+            min_speed = self.player_car.speed * 1.2  # 플레이어보다 20% 빠르게 (1.3 → 1.2)
+            self.front_car.speed = max(self.front_car.speed, min_speed)
+            
+            # 충돌 중에는 강제로 차량 사이 거리를 확보
+            if front_hit or impact is not None:
+                # y축 방향으로 강제 분리
+                self.front_car.y = self.player_car.y - self.player_car.height - 20
+                # 좌우 방향으로 추가 이동
+                if self.player_car.x > self.front_car.x:
+                    self.front_car.x = max(self.road_left + 40, self.front_car.x - 10)
+                else:
+                    self.front_car.x = min(self.road_right - 40, self.front_car.x + 10)
+            
+            # 회복 시간이 끝나면 정상 상태로 복귀
+            if self.collision_recovery_end_due:
+                self.collision_recovery_end_due = False
+                self.collision_recovery = False
+                for name in PATTERN_TIMERS:
+                    self.timers.resume(name)
+                # 교통 흐름 회복 단계의 경과 시간도 멈춘 동안은 세지 않음
+                self.traffic_flow_phase_start += self.sim_time - self.collision_recovery_start
+                
+    
+    def _contact_distance(self):
+        """앞 차량이 플레이어 차량과 세로로 겹치기 시작하는 차간 거리 (m)
+        
+        원근감 위치와 크기로 그린 앞 차량의 아래쪽 끝은 거리가 멀수록 위로 올라가므로(단조 감소) 이분 탐색으로 찾는다.
+        """
+        player_top = self.player_car.y - self.player_car.height / 2
+        low, high = 0.0, 350.0
+        for _ in range(60):
+            middle = (low + high) / 2
+            size = max(0.3, self._size_ratio_for_distance(middle))
+            bottom = self._visual_position_for_distance(middle) + self.front_car.orig_height * size / 2
+            if bottom > player_top:
+                low = middle
+            else:
+                high = middle
+        return low
+    
+    def _time_of_impact(self, dt):
+        """이번 단계 안에서 앞 차량과 처음 닿은 시각 (단계 시작부터의 초, 닿지 않았으면 None)
+        
+        단계 동안 두 차량 속도는 이번 단계 값으로 일정하므로(차간 거리 적분과 같은 가정) 차간 거리와 좌우 위치는
+        시간에 대해 선형이다. 차간 거리가 contact_distance 아래로 내려간 구간에서 좌우 간격이 두 차량 폭의 절반 합보다
+        좁아지는 가장 이른 시각을 구한다. 최소 거리에 닿은 뒤에는 차간 거리가 그대로 유지된다.
+        """
+        start = self.step_start_distance
+        rate = self.front_car.speed - self.player_car.speed  # 차간 거리 변화율 (음수면 가까워짐)
+        
+        # 세로로 겹치는 구간 [contact, leave]와 최소 거리에 닿는 시각
+        if start < self.contact_distance:
+            contact = 0.0
+        elif rate < 0 and start + rate * dt < self.contact_distance:
+            contact = (start - self.contact_distance) / -rate
+        else:
+            return None
+        leave = min(dt, (self.contact_distance - start) / rate) if rate > 0 else dt
+        clamp = (start - self.min_car_distance) / -rate if rate < 0 else leave
+        clamp = max(contact, min(leave, clamp))
+        
+        # 좌우 간격과 두 차량 폭의 절반 합 (구간 양 끝 값, 구간 안에서는 선형)
+        dx_start = self.step_start_player_x - self.step_start_front_x
+        dx_rate = ((self.player_car.x - self.front_car.x) - dx_start) / dt
+        
+        def reach(t):
+            distance = max(self.min_car_distance, start + rate * t)
+            half_width = (self.player_car.width + self.front_car.orig_width * max(0.3, self._size_ratio_for_distance(distance))) / 2
+            dx = dx_start + dx_rate * t
+            return half_width - dx, half_width + dx
+        
+        # 최소 거리에 닿기 전과 후 두 구간에서 좌우로도 겹치는 가장 이른 시각
+        for t0, t1 in ((contact, clamp), (clamp, leave)):
+            if t1 <= t0:
+                continue
+            impact = self._first_overlap(t0, t1, reach(t0), reach(t1))
+            if impact is not None:
+                return impact
+        return None
+    
+    def _first_overlap(self, t0, t1, start, end):
+        """[t0, t1]에서 선형 함수 두 개(양 끝 값 start, end)가 모두 양수가 되는 가장 이른 시각 (없으면 None)"""
+        low, high = t0, t1
+        for a, b in zip(start, end):
+            if a > 0 and b > 0:
+                continue
+            if a <= 0 and b <= 0:
+                return None
+            cross = t0 + (t1 - t0) * a / (a - b)
+            if a <= 0:
+                low = max(low, cross)  # 증가하는 함수: 교차 시각 이후 양수
+            else:
+                high = min(high, cross)  # 감소하는 함수: 교차 시각 이전 양수
+        return low if low < high else None
+    
+    def _traffic_rect(self, x, distance):
+        """플레이어 앞 distance m, 가로 위치 x에 있는 주변 차량의 사각형 영역 (Highway.draw와 같은 원근감 크기)"""
+        size = max(0.3, self._size_ratio_for_distance(distance))
+        width = int(60 * size)
+        height = int(100 * size)
+        y = self._visual_position_for_distance(distance)
+        return (int(x - width // 2), int(y - height // 2), width, height)
+    
+    def _traffic_collisions(self, player_rect, front_rect):
+        """플레이어, 앞 차량, 화면에 보이는 주변 차량의 사각형을 스윕 앤 프룬으로 한 번에 검사
+        
+        (플레이어와 앞 차량의 충돌 여부, 플레이어와 겹친 주변 차량 번호, 앞 차량과 겹친 주변 차량 번호)를 반환한다.
+        """
+        ids = self.traffic.visible(self.traveled_distance, 350)
+        rects = [player_rect, front_rect]
+        for x, position in zip(self.traffic.x[ids].tolist(), self.traffic.position[ids].tolist()):
+            rects.append(self._traffic_rect(x, position - self.traveled_distance))
+        rects = np.array(rects, dtype=np.float64)
+        pairs = sweep_and_prune(rects[:, 1], rects[:, 1] + rects[:, 3], rects[:, 0], rects[:, 0] + rects[:, 2])
+        
+        # 주변 차량끼리 화면에서 겹친 쌍은 무시 (차량 간 충돌은 HighwayModel이 도로 좌표로 처리)
+        first = pairs.min(axis=1)
+        other = pairs.max(axis=1)
+        front_hit = bool(np.any((first == 0) & (other == 1)))
+        player_hits = ids[other[(first == 0) & (other >= 2)] - 2]
+        front_hits = ids[other[(first == 1) & (other >= 2)] - 2]
+        return front_hit, player_hits, front_hits
+    
+    def _on_traffic_collisions(self, player_hits, front_hits):
+        """주변 차량과의 충돌 처리 - 플레이어와 부딪히면 충돌로 기록하고, 부딪힌 차량은 앞으로 밀어냄"""
+        if len(player_hits) > 0:
+            current_time = self.sim_clock()
+            # 앞 차량과의 충돌과 같은 규칙: 1초 이내의 연속 충돌은 한 번으로 셈
+            if current_time - self.last_crash_time > 1000:
+                self.crash_count += 1
+                self.last_crash_time = current_time
+                self.last_impact_speed = self.player_car.speed - float(self.traffic.speed[player_hits].min())
+                self.show_crash_effect = True
+                self.on_crash()
+            self.traffic.push(player_hits, self.traveled_distance + 50, self.player_car.speed * 1.3)
+            self.player_car.speed = max(self.player_car.min_speed, self.player_car.speed * 0.8)
+        
+        # 앞 차량에 밀린 주변 차량은 앞 차량 앞으로 비켜남
+        if len(front_hits) > 0:
+            self.traffic.push(front_hits, self.traveled_distance + self.car_distance, self.front_car.speed)
+    
+    def _car_rect(self, car):
+        """차량의 사각형 영역 (left, top, width, height) 계산 - pygame.Rect와 같은 정수 좌표"""
+        return (int(car.x - car.width // 2), int(car.y - car.height // 2),
+                int(car.width), int(car.height))
+    
+    def _rects_overlap(self, a, b):
+        """두 사각형이 겹치는지 확인 (pygame.Rect.colliderect와 동일한 판정)"""
+        return (a[2] > 0 and a[3] > 0 and b[2] > 0 and b[3] > 0 and
+                a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and
+                a[1] < b[1] + b[3] and b[1] < a[1] + a[3])
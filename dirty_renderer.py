@@ -0,0 +1,47 @@
+import pygame
+
+class DirtyRectRenderer:
+    """바뀐 영역만 화면에 반영하는 렌더러 (pygame.display.update(rects) 사용)
+
+    매 프레임 그린 영역을 mark()로 기록해 두고, present()에서 이번 프레임과
+    직전 프레임의 영역을 함께 갱신한다 (이전 위치를 지우기 위해).
+    갱신할 면적이 화면의 full_flip_ratio 이상이면 전체 flip으로 대체한다.
+    """
+
+    def __init__(self, screen, full_flip_ratio=0.5):
+        self.screen = screen
+        self.full_flip_ratio = full_flip_ratio
+        self.current_rects = []
+        self.previous_rects = []
+        self.full_redraw = True  # 첫 프레임은 전체 갱신
+        self.full_flips = 0
+        self.partial_updates = 0
+
+    def mark(self, rect):
+        """이번 프레임에 바뀐 영역 기록"""
+        if rect is None:
+            return
+        rect = pygame.Rect(rect).clip(self.screen.get_rect())
+        if rect.width > 0 and rect.height > 0:
+            self.current_rects.append(rect)
+
+    def invalidate(self):
+        """다음 present()에서 화면 전체를 갱신하도록 설정"""
+        self.full_redraw = True
+
+    def present(self):
+        """기록된 영역을 화면에 반영하고 다음 프레임 준비"""
+        rects = self.previous_rects + self.current_rects
+        screen_area = self.screen.get_width() * self.screen.get_height()
+        dirty_area = sum(rect.width * rect.height for rect in rects)
+
+        if self.full_redraw or dirty_area >= screen_area * self.full_flip_ratio:
+            pygame.display.flip()
+            self.full_flips += 1
+        elif rects:
+            pygame.display.update(rects)
+            self.partial_updates += 1
+
+        self.full_redraw = False
+        self.previous_rects = self.current_rects
+        self.current_rects = []
@@ -0,0 +1,93 @@
+class ScriptedDriver:
+    """플레이어 차량을 자동으로 조작하는 입력 소스의 기본 클래스
+
+    하위 클래스는 choose()에서 이번 프레임에 누르고 있을 키("up", "down" 또는 None)를 고르고,
+    poll()은 이전 프레임과 비교해 키 누름/해제 입력으로 바꿔 돌려준다.
+    """
+
+    def __init__(self):
+        self.held = None  # 현재 누르고 있는 키
+
+    def choose(self, simulation):
+        """이번 프레임에 누르고 있을 키 선택 (하위 클래스에서 재정의)"""
+        return None
+
+    def poll(self, simulation):
+        """CarSimulation 입력 소스 인터페이스 - (action, pressed) 목록 반환"""
+        action = self.choose(simulation)
+        if action == self.held:
+            return ()
+        events = []
+        if self.held is not None:
+            events.append((self.held, False))
+        if action is not None:
+            events.append((action, True))
+        self.held = action
+        return events
+
+class IdleDriver(ScriptedDriver):
+    """아무 조작도 하지 않는 운전자 (초기 속도 유지)"""
+
+class CruiseDriver(ScriptedDriver):
+    """앞차와 상관없이 일정한 목표 속도를 유지하는 운전자"""
+
+    def __init__(self, cruise_speed=110, tolerance=5):
+        super().__init__()
+        self.cruise_speed = cruise_speed
+        self.tolerance = tolerance
+
+    def choose(self, simulation):
+        target = simulation.player_car.target_speed
+        if target < self.cruise_speed - self.tolerance:
+            return "up"
+        if target > self.cruise_speed + self.tolerance:
+            return "down"
+        return None
+
+class FollowerDriver(ScriptedDriver):
+    """앞차와의 거리를 안전거리 구간(min_gap~max_gap) 안에 유지하려는 운전자"""
+
+    def __init__(self, min_gap=25, max_gap=50):
+        super().__init__()
+        self.min_gap = min_gap
+        self.max_gap = max_gap
+
+    def choose(self, simulation):
+        player = simulation.player_car
+        front_speed = simulation.front_car.speed
+        gap = simulation.car_distance
+
+        # 너무 가까우면 앞차보다 느려질 때까지 감속
+        if gap < self.min_gap and player.target_speed > front_speed - 10:
+            return "down"
+        # 너무 멀면 앞차보다 조금 빠르게 가속
+        if gap > self.max_gap and player.target_speed < front_speed + 15:
+            return "up"
+        # 구간 안에서는 앞차 속도에 맞춤
+        if self.min_gap <= gap <= self.max_gap:
+            if player.target_speed > front_speed + 5:
+                return "down"
+            if player.target_speed < front_speed - 5:
+                return "up"
+        return None
+
+class CautiousDriver(FollowerDriver):
+    """앞차와 넉넉한 거리를 두고 따라가는 운전자"""
+
+    def __init__(self):
+        super().__init__(min_gap=90, max_gap=150)
+
+# 이름으로 선택할 수 있는 운전자 목록
+DRIVERS = {
+    "idle": IdleDriver,
+    "cruise": CruiseDriver,
+    "follower": FollowerDriver,
+    "cautious": CautiousDriver
+}
+
+def make_driver(name):
+    """이름에 해당하는 운전자 객체 생성"""
+    try:
+        return DRIVERS[name]()
+    except KeyError:
+        raise ValueError(f"알 수 없는 운전자: {name} (가능한 값: {', '.join(DRIVERS)})")
@@ -0,0 +1,71 @@
+import pygame
+
+class EffectLayers:
+    """충돌 번쩍임과 브레이크등 발광 효과용 반투명 레이어 모음
+
+    충돌 효과용 전체 화면 레이어와 겹침 영역 레이어는 한 번만 만들어 재사용하고
+    (투명도는 서피스 알파로 조절), 브레이크등 발광/반사 스프라이트는
+    차량 크기(픽셀 폭)별로 미리 만들어 둔다. 매 프레임 새 서피스를 만들지 않는다.
+    """
+    flash_color = (255, 0, 0)
+    overlap_color = (255, 0, 0)
+    overlap_alpha = 150
+    glow_color = (255, 0, 0)
+    reflection_alpha = 180
+    glow_layers = 3
+
+    def __init__(self):
+        self.flash_layer = None
+        self.overlap_layer = None
+        self.glow_sprites = {}  # (폭, 높이) -> 발광 스프라이트
+        self.reflection_sprites = {}  # (폭, 높이) -> 반사 스프라이트
+
+    def draw_flash(self, screen, alpha):
+        """화면 전체에 반투명 붉은색 오버레이 그리기"""
+        size = screen.get_size()
+        if self.flash_layer is None or self.flash_layer.get_size() != size:
+            self.flash_layer = pygame.Surface(size)
+            self.flash_layer.fill(self.flash_color)
+        self.flash_layer.set_alpha(int(alpha))
+        screen.blit(self.flash_layer, (0, 0))
+
+    def draw_overlap(self, screen, rect):
+        """겹치는 영역을 반투명 붉은색으로 강조"""
+        if (self.overlap_layer is None or self.overlap_layer.get_width() < rect.width or
+                self.overlap_layer.get_height() < rect.height):
+            # 더 큰 영역이 필요할 때만 레이어를 키워서 다시 만듦
+            width = max(rect.width, self.overlap_layer.get_width() if self.overlap_layer else 0)
+            height = max(rect.height, self.overlap_layer.get_height() if self.overlap_layer else 0)
+            self.overlap_layer = pygame.Surface((width, height))
+            self.overlap_layer.fill(self.overlap_color)
+            self.overlap_layer.set_alpha(self.overlap_alpha)
+        screen.blit(self.overlap_layer, rect.topleft, (0, 0, rect.width, rect.height))
+
+    def brake_glow(self, base_width, light_height):
+        """브레이크등 주변 발광 스프라이트 (바깥으로 갈수록 투명, 여백 glow_layers*2 픽셀)"""
+        key = (base_width, light_height)
+        sprite = self.glow_sprites.get(key)
+        if sprite is None:
+            margin = (self.glow_layers - 1) * 2
+            sprite = pygame.Surface((base_width + margin * 2, light_height + margin * 2), pygame.SRCALPHA)
+            for i in range(self.glow_layers):
+                glow_alpha = 150 - i * 40  # 점점 투명해지는 효과
+                pygame.draw.rect(sprite, self.glow_color + (glow_alpha,),
+                                 (margin - i * 2, margin - i * 2,
+                                  base_width + i * 4, light_height + i * 4),
+                                 1)  # 테두리만 그리기
+            self.glow_sprites[key] = sprite
+        return sprite
+
+    def brake_reflection(self, base_width, reflection_height):
+        """브레이크등 바닥 반사 스프라이트"""
+        key = (base_width, reflection_height)
+        sprite = self.reflection_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((base_width, reflection_height), pygame.SRCALPHA)
+            sprite.fill(self.glow_color + (self.reflection_alpha,))
+            self.reflection_sprites[key] = sprite
+        return sprite
+
+# 게임 전체에서 함께 쓰는 효과 레이어
+shared_effects = EffectLayers()
@@ -0,0 +1,244 @@
+import heapq
+import itertools
+from batch_engine import LINEAR, EASE_IN, EASE_OUT, EASE_IN_OUT
+from car_simulation import FRAME_DT
+from timer_scheduler import TIME_EPSILON
+
+# 플레이어 감속용 quadratic in-out 이징 (PlayerCarModel.ease_in_out_quad)
+EASE_IN_OUT_QUAD = 4
+
+def ease(kind, u):
+    """진행률 u(0~1)에서의 이징 값 (FrontCarModel/PlayerCarModel의 이징 함수와 같음)"""
+    if kind == LINEAR:
+        return u
+    if kind == EASE_IN:
+        return u * u * u
+    if kind == EASE_OUT:
+        return 1 - (1 - u) ** 3
+    if kind == EASE_IN_OUT:
+        return 4 * u * u * u if u < 0.5 else 1 - (2 - 2 * u) ** 3 / 2
+    return 2 * u * u if u < 0.5 else 1 - (2 - 2 * u) ** 2 / 2
+
+def ease_integral(kind, u):
+    """이징 값을 0부터 u까지 적분한 값 (닫힌 형식)"""
+    if kind == LINEAR:
+        return u * u / 2
+    if kind == EASE_IN:
+        return u ** 4 / 4
+    if kind == EASE_OUT:
+        return u + ((1 - u) ** 4 - 1) / 4
+    if kind == EASE_IN_OUT:
+        return u ** 4 if u < 0.5 else u - 0.5 + (2 - 2 * u) ** 4 / 16
+    return 2 * u ** 3 / 3 if u < 0.5 else u - 0.5 + (2 - 2 * u) ** 3 / 12
+
+class SpeedTrack:
+    """한 차량의 속도 곡선 - 현재 이징 구간과 그 시작까지의 누적 거리
+
+    구간 안에서 속도는 start_speed + (end_speed - start_speed) * ease(진행률)이고,
+    전환이 끝난 뒤에는 end_speed로 일정하다. 거리는 이 곡선의 적분으로 계산한다.
+    """
+
+    def __init__(self, speed):
+        self.start_time = 0.0
+        self.start_distance = 0.0  # 구간 시작 시점까지 이동한 거리
+        self.start_speed = speed
+        self.end_speed = speed
+        self.duration = 0.0
+        self.kind = LINEAR
+
+    def speed_at(self, t):
+        elapsed = t - self.start_time
+        if elapsed >= self.duration:
+            return self.end_speed
+        return self.start_speed + (self.end_speed - self.start_speed) * ease(self.kind, elapsed / self.duration)
+
+    def distance_at(self, t):
+        """0초부터 t초까지 이동한 거리"""
+        elapsed = t - self.start_time
+        distance = self.start_distance + self.start_speed * elapsed
+        change = self.end_speed - self.start_speed
+        if elapsed >= self.duration:
+            # 전환 구간 전체의 적분 + 끝난 뒤 일정 속도 구간
+            return distance + change * (self.duration * ease_integral(self.kind, 1.0) + elapsed - self.duration)
+        return distance + change * self.duration * ease_integral(self.kind, elapsed / self.duration)
+
+    def transition(self, t, target_speed, kind, duration):
+        """t초에 현재 속도에서 target_speed로 가는 새 이징 구간 시작"""
+        self.start_distance = self.distance_at(t)
+        self.start_speed = self.speed_at(t)
+        self.start_time = t
+        self.end_speed = target_speed
+        self.duration = duration
+        self.kind = kind
+
+class EventDrivenDrive:
+    """스크립트 주행을 행동 이벤트 사이마다 닫힌 형식으로 적분해 진행하는 엔진
+
+    앞 차량과 플레이어 차량의 속도는 예약된 이벤트(목표 속도, 이징 유형, 지속 시간) 사이에서
+    이징 곡선을 따르므로, 차간 거리와 이동 거리는 곡선의 적분으로 다음 이벤트까지 한 번에 계산한다.
+    구간 안에서 차간 거리가 최소 거리에 닿을 수 있으면(속도가 구간 끝점에서 최대/최소이므로
+    최대 접근 속도로 하한을 잡음) 구간을 반으로 나누고, step 길이까지 줄어들면
+    CarPairBatch와 같은 규칙(최소 거리 제한, 닿는 순간 충돌 1회)으로 한 단계씩 진행한다.
+    충돌 판정은 단계 끝의 차간 거리만 보지 않고 단계 안에서 최소 거리에 처음 닿는 시각을 찾으므로,
+    단계를 크게 잡아도 단계 사이에 닿았다 벌어지는 충돌을 놓치지 않는다.
+    """
+    # FrontCarModel / PlayerCarModel / CarPairBatch와 같은 상수
+    front_min_speed = 80
+    front_max_speed = 160
+    player_min_speed = 10
+    player_max_speed = 180
+    min_car_distance = 8
+
+    def __init__(self, front_speed=120, player_speed=60, car_distance=250, step=FRAME_DT):
+        self.front = SpeedTrack(front_speed)
+        self.player = SpeedTrack(player_speed)
+        self.step = step
+        self.time = 0.0
+        self.car_distance = car_distance
+        self.in_contact = False
+        self.crash_count = 0
+        self.crash_times = []
+        self.impact_speeds = []  # 충돌 순간의 접근 속도 (플레이어 속도 - 앞차 속도)
+        self.gap_min = car_distance
+        self.goal_distance = 5000  # 목표 지점 (m)
+        self.goal_time = None
+        self.stop_at_goal = True
+        self.events = []  # (시간, 순번, 차량, 목표 속도, 이징 유형, 지속 시간)
+        self.sequence = itertools.count()  # 같은 시간의 이벤트는 예약한 순서대로 (꺼낸 뒤에도 번호가 겹치지 않음)
+        self.evaluations = 0  # 구간 계산 횟수 (건너뛴 구간 + 단계 진행)
+
+    def schedule(self, time, vehicle, target_speed, kind=None, duration=None):
+        """time초에 vehicle("front" 또는 "player")의 속도 전환 예약
+
+        kind와 duration을 생략하면 각 차량 모델과 같은 규칙으로 정한다
+        (앞 차량: ease-in-out과 속도 차이 기반 지속 시간, 플레이어: 가속 cubic/감속 quad 이징).
+        """
+        heapq.heappush(self.events, (time, next(self.sequence), vehicle, target_speed, kind, duration))
+
+    def _front_transition(self, t, target_speed, kind, duration):
+        """FrontCarModel.start_speed_transition과 같은 규칙으로 앞 차량 전환 시작"""
+        speed = self.front.speed_at(t)
+        target_speed = max(self.front_min_speed, min(self.front_max_speed, target_speed))
+        if duration is None:
+            speed_ratio = abs(target_speed - speed) / (self.front_max_speed - self.front_min_speed)
+            if target_speed > speed:
+                duration = max(0.5, min(1.5, 0.5 + speed_ratio * 1.0))
+            else:
+                duration = max(0.5, min(2.0, 0.5 + speed_ratio * 1.5))
+        self.front.transition(t, target_speed, EASE_IN_OUT if kind is None else kind, duration)
+
+    def _player_transition(self, t, target_speed, kind, duration):
+        """PlayerCarModel.update_speed_with_easing과 같은 규칙으로 플레이어 전환 시작"""
+        speed = self.player.speed_at(t)
+        target_speed = max(self.player_min_speed, min(self.player_max_speed, target_speed))
+        speed_ratio = abs(target_speed - speed) / self.player_max_speed
+        if target_speed > speed:
+            default_kind, default_duration = EASE_IN_OUT, max(0.5, min(2.0, 0.5 + speed_ratio * 1.5))
+        else:
+            default_kind, default_duration = EASE_IN_OUT_QUAD, max(0.3, min(1.5, 0.3 + speed_ratio * 1.2))
+        self.player.transition(t, target_speed,
+                               default_kind if kind is None else kind,
+                               default_duration if duration is None else duration)
+
+    def _gap_change(self, t0, t1):
+        """t0~t1 동안 차간 거리 변화 (앞차 이동 거리 - 플레이어 이동 거리)"""
+        return ((self.front.distance_at(t1) - self.front.distance_at(t0)) -
+                (self.player.distance_at(t1) - self.player.distance_at(t0)))
+
+    def _clear(self, t0, t1, distance=None):
+        """t0~t1 동안 차간 거리(t0에 distance, 생략하면 현재 값)가 최소 거리에 닿을 수 없는지 (보수적 판정)"""
+        if distance is None:
+            distance = self.car_distance
+        closing = (max(self.player.speed_at(t0), self.player.speed_at(t1)) -
+                   min(self.front.speed_at(t0), self.front.speed_at(t1)))
+        return distance - max(0.0, closing) * (t1 - t0) > self.min_car_distance
+
+    def _move(self, t1, stepping):
+        """t1초까지 진행 (stepping이면 최소 거리 제한과 충돌 판정 적용)"""
+        t0 = self.time
+        traveled_before = self.player.distance_at(t0)
+        start_distance = self.car_distance
+        self.car_distance += self._gap_change(t0, t1)
+        self.time = t1
+        self.evaluations += 1
+
+        if stepping:
+            contact = self.car_distance <= self.min_car_distance
+            impact = None if self.in_contact else self._impact_time(t0, t1, start_distance)
+            if impact is not None:
+                self.crash_count += 1
+                self.crash_times.append(impact)
+                self.impact_speeds.append(self.player.speed_at(impact) - self.front.speed_at(impact))
+            self.in_contact = contact
+            self.car_distance = max(self.car_distance, self.min_car_distance)
+        else:
+            self.in_contact = False
+        self.gap_min = min(self.gap_min, self.car_distance)
+
+        # 목표 거리 도달 시각 (이동 거리는 단조 증가하므로 이분 탐색)
+        if self.goal_time is None and self.player.distance_at(t1) >= self.goal_distance > traveled_before:
+            low, high = t0, t1
+            for _ in range(60):
+                middle = (low + high) / 2
+                if self.player.distance_at(middle) >= self.goal_distance:
+                    high = middle
+                else:
+                    low = middle
+            self.goal_time = high
+
+    def _impact_time(self, t0, t1, start_distance):
+        """t0~t1 동안 차간 거리(t0에 start_distance)가 처음 최소 거리에 닿는 시각 (닿지 않으면 None)
+
+        닿을 수 없다고 판정되는(_clear) 구간은 건너뛰고, 나머지는 반으로 나눠 앞쪽 구간부터 찾는다.
+        """
+        if start_distance <= self.min_car_distance:
+            return t0
+        if self._clear(t0, t1, start_distance):
+            return None
+        if t1 - t0 < TIME_EPSILON:
+            return t0
+        middle = (t0 + t1) / 2
+        impact = self._impact_time(t0, middle, start_distance)
+        if impact is None:
+            impact = self._impact_time(middle, t1, start_distance + self._gap_change(t0, middle))
+        return impact
+
+    def _advance(self, t_end):
+        """다음 이벤트 시각까지 진행 (안전한 구간은 한 번에, 위험한 구간은 단계별로)"""
+        while self.time < t_end and not (self.stop_at_goal and self.goal_time is not None):
+            span = t_end - self.time
+            if not self.in_contact:
+                while span > self.step and not self._clear(self.time, self.time + span):
+                    span /= 2
+                if self._clear(self.time, self.time + span):
+                    self._move(t_end if span == t_end - self.time else self.time + span, False)
+                    continue
+            self._move(min(t_end, self.time + self.step), True)
+
+    def run(self, max_time=600, goal_distance=5000, stop_at_goal=True):
+        """예약된 이벤트를 차례로 적용하며 진행하고 결과 사전 반환"""
+        self.goal_distance = goal_distance
+        self.stop_at_goal = stop_at_goal
+        while self.time < max_time and not (stop_at_goal and self.goal_time is not None):
+            next_time = self.events[0][0] if self.events else max_time
+            self._advance(min(next_time, max_time))
+
+            # 이 시각에 예약된 이벤트 적용
+            while self.events and self.events[0][0] <= self.time:
+                _, _, vehicle, target_speed, kind, duration = heapq.heappop(self.events)
+                if vehicle == "front":
+                    self._front_transition(self.time, target_speed, kind, duration)
+                else:
+                    self._player_transition(self.time, target_speed, kind, duration)
+
+        return {
+            "crashes": self.crash_count,
+            "crash_times": self.crash_times,
+            "impact_speeds": self.impact_speeds,
+            "goal_time": self.goal_time,
+            "gap_min": self.gap_min,
+            "car_distance": self.car_distance,
+            "traveled_distance": self.player.distance_at(self.time),
+            "sim_time": self.time,
+            "evaluations": self.evaluations
+        }
@@ -0,0 +1,146 @@
+import json
+import os
+import sys
+import pygame
+from telemetry import telemetry, FONT_FALLBACK
+
+# 한글 정보 표시용 폰트 후보 (앞에서부터 찾음, 게임 폴더의 fonts 다음 Windows 기본 폰트)
+GAME_FONT_FILES = ("HANCOM GOTHIC REGULAR.ttf", "NanumGothic.ttf", "gulim.ttc", "malgun.ttf")
+WINDOWS_FONT_FILES = ("malgun.ttf", "gulim.ttc")
+
+def game_font_paths():
+    """한글 폰트 후보 경로 목록"""
+    paths = [os.path.join("fonts", name) for name in GAME_FONT_FILES]
+    paths.extend(os.path.join(os.environ.get('WINDIR', ''), 'Fonts', name) for name in WINDOWS_FONT_FILES)
+    return paths
+
+def system_font_dirs():
+    """pygame.font.SysFont가 훑는 시스템 폰트 폴더 (바뀌었는지 수정 시각으로 확인하는 용도)"""
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        return [os.path.join(os.environ.get('WINDIR', ''), 'Fonts'),
+                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts')]
+    if sys.platform == "darwin":
+        return ["/Library/Fonts", "/System/Library/Fonts", os.path.join(home, "Library", "Fonts")]
+    return ["/usr/share/fonts", "/usr/local/share/fonts", os.path.join(home, ".fonts"),
+            os.path.join(home, ".local", "share", "fonts")]
+
+def default_cache_path():
+    """폰트 찾기 결과를 저장할 파일 (사용자별 캐시 폴더)"""
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "carfollowing", "fonts.json")
+
+def _mtime(path):
+    """파일/폴더 수정 시각 (없으면 None)"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+class FontCache:
+    """폰트 파일 찾기 결과는 디스크에 저장해 두고, 폰트 객체는 처음 글자를 그릴 때 만드는 캐시
+
+    한글 폰트 후보 경로 확인과 pygame.font.SysFont의 시스템 전체 폰트 검색은 실행할 때마다 느리므로,
+    찾은 경로를 검색 경로와 그 수정 시각(폰트 폴더에 파일을 더하거나 빼면 바뀜)을 키로 파일에 저장한다.
+    다음 실행에서 키가 같으면 저장된 경로로 바로 폰트를 열고, 다르면 다시 찾는다.
+    폰트 객체는 (이름, 크기, 굵게)별로 한 번만 만들며, pygame.font는 처음 폰트를 만들 때 초기화한다.
+    캐시 파일을 읽거나 쓸 수 없으면(읽기 전용 폴더 등) 저장 없이 매번 찾는다.
+    """
+
+    def __init__(self, path=None):
+        self.path = path if path is not None else default_cache_path()
+        self.resolved = None  # 폰트 이름 -> [경로, 굵게 흉내 여부] (처음 쓸 때 디스크에서 읽음)
+        self.fonts = {}  # (이름, 크기, 굵게) -> Font
+        self.key = None
+        self.searches = 0  # 이번 실행에서 직접 찾은 횟수 (디스크 캐시를 못 쓴 경우)
+
+    def search_key(self):
+        """검색 경로와 수정 시각으로 만든 캐시 키"""
+        paths = ["fonts"] + game_font_paths() + system_font_dirs()
+        return [pygame.version.ver] + [[path, _mtime(path)] for path in paths]
+
+    def _load(self):
+        """디스크에 저장된 찾기 결과 읽기 (키가 다르면 버림)"""
+        self.key = self.search_key()
+        self.resolved = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("key") == self.key and isinstance(data.get("fonts"), dict):
+            self.resolved = data["fonts"]
+
+    def _save(self):
+        """찾기 결과를 디스크에 저장 (다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일 후 교체)"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": self.key, "fonts": self.resolved}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def resolve(self, name, bold=False):
+        """폰트 이름의 [경로, 굵게 흉내 여부] (경로가 None이면 pygame 기본 폰트)
+
+        name이 None이면 한글 정보 표시용 폰트 후보에서, 아니면 시스템 폰트에서 찾는다.
+        """
+        if self.resolved is None:
+            self._load()
+        cache_name = f"{name}:{int(bold)}"
+        entry = self.resolved.get(cache_name)
+        if entry is None:
+            entry = self._search_game_font() if name is None else self._search_sys_font(name, bold)
+            self.searches += 1
+            self.resolved[cache_name] = entry
+            self._save()
+        return entry
+
+    def _search_game_font(self):
+        """한글 폰트 후보 중 처음으로 열리는 파일 (없으면 기본 폰트로 대신한다고 기록)"""
+        found = failed = 0
+        for path in game_font_paths():
+            if os.path.exists(path):
+                found += 1
+                try:
+                    pygame.font.Font(path, 16)
+                    return [path, False]
+                except Exception:
+                    failed += 1
+        telemetry.info(FONT_FALLBACK, found, failed)
+        return [None, False]
+
+    def _search_sys_font(self, name, bold):
+        """pygame.font.SysFont와 같은 규칙으로 시스템 폰트 경로 찾기 (굵은 글꼴 파일이 없으면 굵게 흉내)"""
+        try:
+            path = pygame.font.match_font(name, bold=bold)
+            plain_path = pygame.font.match_font(name) if bold else path
+        except Exception:
+            path = plain_path = None
+        return [path, bold and (path is None or path == plain_path)]
+
+    def get(self, name, size, bold=False):
+        """폰트 객체 반환 (처음이면 찾은 경로로 만듦, 열 수 없으면 기본 폰트)"""
+        key = (name, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            path, emulate_bold = self.resolve(name, bold)
+            try:
+                font = pygame.font.Font(path, size)
+            except Exception:
+                font = pygame.font.Font(None, size)
+            if emulate_bold:
+                font.set_bold(True)
+            self.fonts[key] = font
+        return font
+
+    def game_font(self, size):
+        """한글 정보 표시용 폰트"""
+        return self.get(None, size)
+
+# 게임 전체에서 함께 쓰는 폰트 캐시
+shared_fonts = FontCache()
\ No newline at end of file
@@ -0,0 +1,429 @@
+import random
+from operator import attrgetter
+from timer_scheduler import TimerScheduler
+
+class FrontCarModel:
+    """앞 차량의 주행 로직 (pygame 없이 동작하는 시뮬레이션 코어)
+    
+    속도 변화, 브레이크 시작/종료, 브레이크 후효과, 좌우 목표 위치 변경은 타이머 스케줄러에 예약되고,
+    만료된 타이머가 해당 *_due 표시를 켜면 update()가 원래 순서대로 처리한다.
+    timers를 주지 않으면 자체 스케줄러를 만들어 update()에서 dt만큼 진행한다.
+    """
+    # snapshot()/restore()로 저장하는 주행 상태 (나머지 속성은 생성 후 바뀌지 않는 설정 값)
+    state_fields = ("x", "y", "width", "height", "visual_size", "speed", "target_speed", "prev_speed",
+                    "is_speed_transitioning", "speed_transition_timer", "speed_transition_duration",
+                    "speed_transition_start", "speed_transition_type",
+                    "is_braking", "brake_duration", "brake_intensity", "next_brake_time", "brake_due", "brake_end_due",
+                    "brake_afterglow", "afterglow_duration", "afterglow_end_due",
+                    "brake_lights_on", "is_decelerating",
+                    "lane_change_interval", "lane_change_due", "target_x",
+                    "next_speed_change", "speed_change_due")
+    __slots__ = state_fields + ("rng", "timers", "own_timers", "orig_width", "orig_height", "color",
+                                "min_speed", "max_speed", "cruise_speed", "speed_smoothing",
+                                "deceleration_threshold", "max_lane_deviation", "move_speed")
+    _get_state = attrgetter(*state_fields)
+
+    def __init__(self, x, y, rng=None, timers=None):
+        # 난수 생성기 (random.Random 호환 객체, 지정하지 않으면 전역 random 모듈 사용)
+        self.rng = rng if rng is not None else random
+        
+        # 타이머 스케줄러 (CarSimulation과 공유하면 시뮬레이션이 시간을 진행)
+        self.own_timers = timers is None
+        self.timers = TimerScheduler() if timers is None else timers
+        self.register_timers()
+        
+        self.orig_width = 60  # 원래 크기 저장
+        self.orig_height = 100  # 원래 크기 저장
+        self.color = (0, 0, 200)  # 파란색
+        
+        # 속도 관련 변수 (km/h)
+        self.min_speed = 80  # 최소 속도 (30 → 80)
+        self.max_speed = 160  # 최대 속도 (180 → 160)
+        self.cruise_speed = 120  # 평균 주행 속도
+        
+        # 이징(easing) 관련 변수
+        self.speed_smoothing = 0.8  # 속도 변화 부드러움 계수
+        
+        # 브레이크등 추가 변수
+        self.deceleration_threshold = 1.0  # 감속 감지 임계값 (km/h)
+        
+        # 좌우 움직임 관련 변수
+        self.move_speed = 3.0  # 좌우 이동 속도 크게 증가 (2.0 → 3.0)
+        self.max_lane_deviation = 40  # 중앙에서 최대 이탈 거리
+        
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """(x, y)에서 출발하는 처음 주행 상태로 되돌리고 행동 타이머를 새로 예약 (설정 값은 그대로)
+        
+        난수는 생성할 때와 같은 순서로 뽑으므로 같은 난수 상태에서 되돌리면 새로 만든 차량과 같다.
+        공유 스케줄러는 소유한 시뮬레이션이 먼저 비워야 한다.
+        """
+        if self.own_timers:
+            self.timers.reset()
+        
+        self.x = x
+        self.y = y
+        self.width = 60
+        self.height = 100
+        self.visual_size = 1.0  # 시각적 크기 비율
+        
+        # 속도 관련 변수 (km/h)
+        self.speed = self.rng.uniform(100, 140)  # 초기 속도를 100~140km/h 사이로 설정 (110~130 → 100~140)
+        self.target_speed = self.speed
+        self.prev_speed = self.speed  # 이전 속도 저장 (감속 감지용)
+        
+        # 이징(easing) 관련 변수
+        self.is_speed_transitioning = False  # 속도 전환 중인지 여부
+        self.speed_transition_timer = 0  # 속도 전환 타이머
+        self.speed_transition_duration = 0  # 속도 전환 지속 시간
+        self.speed_transition_start = self.speed  # 전환 시작 속도
+        self.speed_transition_type = "linear"  # 전환 유형 (linear, ease-in, ease-out, ease-in-out)
+        
+        # 브레이크 관련 변수
+        self.is_braking = False
+        self.brake_duration = 0
+        self.brake_intensity = 0  # 0: 브레이크 없음, 1: 약한 브레이크, 2: 강한 브레이크
+        self.next_brake_time = self.rng.uniform(1.5, 3.0)  # 더 자주 브레이크를 밟도록 변경 (2-4 → 1.5-3.0)
+        self.brake_due = False  # 다음 브레이크 시간이 됐는지
+        self.brake_end_due = False  # 브레이크 지속 시간이 끝났는지
+        self.timers.start("front.brake", self.next_brake_time)
+        
+        # 브레이크 후효과 추가
+        self.brake_afterglow = False  # 브레이크 후효과 활성화 여부
+        self.afterglow_duration = 0  # 브레이크 후효과 지속 시간
+        self.afterglow_end_due = False  # 후효과 시간이 끝났는지
+        
+        # 브레이크등 추가 변수
+        self.brake_lights_on = False  # 브레이크등 상태
+        self.is_decelerating = False  # 감속 중인지 여부
+        
+        # 좌우 움직임 관련 변수
+        self.lane_change_interval = self.rng.uniform(1.0, 2.5)  # 더 자주 차선 변경 (1.5-3 → 1.0-2.5)
+        self.lane_change_due = False
+        self.timers.start("front.lane_change", self.lane_change_interval)
+        self.target_x = x + self.rng.uniform(-30, 30)  # 초기에 랜덤한 위치로 설정
+        
+        # 속도 변화 랜덤화 (갑작스러운 속도 변화 추가)
+        self.next_speed_change = self.rng.uniform(3, 6)  # 더 자주 속도 변화 발생 (4-8 → 3-6)
+        self.speed_change_due = False
+        self.timers.start("front.speed_change", self.next_speed_change)
+    
+    def register_timers(self):
+        """타이머 만료 콜백을 스케줄러에 등록 (fork로 새 스케줄러를 받았을 때 다시 호출)"""
+        self.timers.register("front.speed_change", self._on_speed_change_due)
+        self.timers.register("front.brake", self._on_brake_due)
+        self.timers.register("front.brake_end", self._on_brake_end_due)
+        self.timers.register("front.afterglow", self._on_afterglow_end_due)
+        self.timers.register("front.lane_change", self._on_lane_change_due)
+    
+    def snapshot(self):
+        """주행 상태를 튜플로 저장 (자체 스케줄러를 쓰면 예약 상태 포함, 난수 상태는 포함하지 않음)"""
+        return self._get_state(self), self.timers.snapshot() if self.own_timers else None
+    
+    def restore(self, state):
+        """snapshot()으로 저장한 주행 상태로 되돌림"""
+        values, timers = state
+        for name, value in zip(self.state_fields, values):
+            setattr(self, name, value)
+        if timers is not None:
+            self.timers.restore(timers)
+    
+    def _on_speed_change_due(self):
+        self.speed_change_due = True
+    
+    def _on_brake_due(self):
+        self.brake_due = True
+    
+    def _on_brake_end_due(self):
+        self.brake_end_due = True
+    
+    def _on_afterglow_end_due(self):
+        self.afterglow_end_due = True
+    
+    def _on_lane_change_due(self):
+        self.lane_change_due = True
+    
+    def set_visual_size(self, size_ratio):
+        """원근감을 위한 시각적 크기 설정"""
+        self.visual_size = max(0.3, min(1.0, size_ratio))  # 너무 작아지지 않도록 제한
+        self.width = int(self.orig_width * self.visual_size)
+        self.height = int(self.orig_height * self.visual_size)
+    
+    def update(self, road_left, road_right, dt=1/60):
+        """앞 차량 상태 업데이트 (dt: 시뮬레이션 시간 간격, 초)"""
+        # 자체 스케줄러를 쓰면 시간 진행 (만료된 타이머의 *_due 표시가 켜짐)
+        if self.own_timers:
+            self.timers.advance(self.timers.now + dt)
+        
+        # 이전 속도 저장 (감속 감지용)
+        self.prev_speed = self.speed
+        
+        # 랜덤 속도 변화 적용 (평소 운전 패턴)
+        if self.speed_change_due and not self.is_braking:
+            self.speed_change_due = False
+            self.next_speed_change = self.rng.uniform(2.5, 5.5)  # 더 자주 속도 변화 발생 (3-7 → 2.5-5.5)
+            self.timers.start("front.speed_change", self.next_speed_change)
+            
+            # 속도 변화 - 기본적으로 순항 속도(120) 주변에서 변동
+            cruise_deviation = self.rng.uniform(-15, 15)  # 순항 속도 기준 ±15km/h 변동
+            new_target_speed = max(self.min_speed, min(self.max_speed, self.cruise_speed + cruise_deviation))
+            
+            # 새로운 목표 속도를 향해 이징(easing) 전환 시작
+            if abs(new_target_speed - self.target_speed) > 3:  # 작은 변화는 무시
+                # 브레이크 없는 가속은 더 빠르게 (0.6~1.2초)
+                if new_target_speed > self.speed:
+                    speed_diff = abs(new_target_speed - self.speed)
+                    duration = max(0.6, min(1.2, 0.6 + (speed_diff / 60) * 0.6))
+                    self.start_speed_transition(new_target_speed, "ease-in-out", duration)
+                else:
+                    # 감속은 조금 더 길게 (상대적으로)
+                    self.start_speed_transition(new_target_speed, "ease-in-out")
+            
+            # 큰 속도 변화일 경우 브레이크 효과 추가 (100km/h 이상에서만)
+            if new_target_speed < self.speed - 5 and self.speed >= 100:  # 100km/h 이상에서만 브레이크 적용
+                self.apply_brake()
+        
+        # 브레이크 상태가 아니고 다음 브레이크 시간이 됐을 때 (100km/h 이상에서만)
+        if self.brake_due and not self.is_braking and not self.brake_afterglow and self.speed >= 100:
+            self.apply_brake()
+        
+        # 브레이크 중인 경우
+        if self.is_braking:
+            # 브레이크 세기에 따라 속도 감소
+            if self.brake_intensity == 1:  # 약한 브레이크
+                target_brake_speed = max(self.min_speed, self.speed - 60)  # 약한 브레이크 감속 효과 (60km/h 감소)
+                self.start_speed_transition(target_brake_speed, "ease-out", 2)
+            else:  # 강한 브레이크
+                target_brake_speed = max(self.min_speed, self.speed - 150)  # 강한 브레이크 감속 효과 (150km/h 감소)
+                self.start_speed_transition(target_brake_speed, "ease-out", 4)
+            
+            # 브레이크 등 켜기
+            self.brake_lights_on = True
+            
+            # 브레이크 시간이 끝났을 때
+            if self.brake_end_due:
+                self.brake_end_due = False
+                self.release_brake()
+                # 브레이크 후효과 활성화
+                self.brake_afterglow = True
+                self.afterglow_duration = self.rng.uniform(1.5, 2.5)  # 후효과 지속 시간 단축 (2.0-3.5 → 1.5-2.5)
+                self.afterglow_end_due = False
+                self.timers.start("front.afterglow", self.afterglow_duration)
+        
+        # 브레이크 후효과 업데이트
+        elif self.brake_afterglow:
+            # 후효과 시간이 끝났을 때
+            if self.afterglow_end_due:
+                self.afterglow_end_due = False
+                self.brake_afterglow = False
+                self.next_brake_time = self.rng.uniform(1.0, 2.5)  # 다음 브레이크까지 시간 단축 (1.5-3.0 → 1.0-2.5)
+                self.brake_due = False
+                self.timers.start("front.brake", self.next_brake_time)
+                
+                # 감속 중이 아니면 브레이크등 끄기
+                if not self.is_decelerating:
+                    self.brake_lights_on = False
+                    
+                # 브레이크 후 순항 속도로 복귀하는 경향 추가
+                if self.speed < self.cruise_speed - 20:
+                    return_target = min(self.cruise_speed, self.speed + self.rng.uniform(20, 40))
+                    self.start_speed_transition(return_target, "ease-in", 1.0)  # 빠르게 가속으로 복귀
+        
+        # 속도 이징(easing) 업데이트
+        self.update_speed_with_easing(dt)
+        
+        # 좌우 움직임 업데이트
+        self.update_lane_position(road_left, road_right, dt)
+        
+        # 감속 여부 확인 (브레이크등 관리용)
+        self.check_deceleration()
+    
+    def update_speed_with_easing(self, dt=1/60):
+        """이징(easing) 방식으로 속도 업데이트"""
+        if not self.is_speed_transitioning:
+            return
+            
+        # 진행 시간 업데이트
+        self.speed_transition_timer += dt
+        
+        # 진행률 계산 (0~1)
+        progress = min(1.0, self.speed_transition_timer / self.speed_transition_duration)
+        
+        # 이징 함수 적용
+        if self.speed_transition_type == "linear":
+            eased_progress = progress  # 선형 변화
+        elif self.speed_transition_type == "ease-in":
+            eased_progress = self.ease_in_cubic(progress)  # 시작 천천히
+        elif self.speed_transition_type == "ease-out":
+            eased_progress = self.ease_out_cubic(progress)  # 끝에 천천히
+        else:  # "ease-in-out"
+            eased_progress = self.ease_in_out_cubic(progress)  # 시작과 끝에 천천히
+        
+        # 현재 속도 계산
+        target_diff = self.target_speed - self.speed_transition_start
+        self.speed = self.speed_transition_start + target_diff * eased_progress
+        
+        # 속도 제한 적용 (80~160km/h 범위로 제한)
+        self.speed = max(self.min_speed, min(self.max_speed, self.speed))
+        
+        # 이징 완료 확인
+        if progress >= 1.0:
+            self.is_speed_transitioning = False
+            self.speed = self.target_speed
+    
+    def start_speed_transition(self, target_speed, transition_type="ease-in-out", duration=None):
+        """속도 이징(easing) 전환 시작"""
+        # 목표 속도를 80~160 범위로 제한
+        self.target_speed = max(self.min_speed, min(self.max_speed, target_speed))
+        self.speed_transition_start = self.speed
+        self.speed_transition_type = transition_type
+        
+        # 전환 지속 시간 - 속도 차이에 따라 동적 조정 (지정된 값이 없을 경우)
+        if duration is None:
+            speed_diff = abs(self.target_speed - self.speed)
+            speed_ratio = speed_diff / (self.max_speed - self.min_speed)  # 변경된 속도 범위 기준
+            
+            # 가속/감속에 따라 다른 지속 시간
+            if self.target_speed > self.speed:  # 가속
+                # 가속은 빠르게 (0.5~1.5초로 조정)
+                self.speed_transition_duration = max(0.5, min(1.5, 0.5 + speed_ratio * 1.0))
+            else:  # 감속
+                # 감속은 더 빠르게 (0.5~2.0초)
+                self.speed_transition_duration = max(0.5, min(2.0, 0.5 + speed_ratio * 1.5))
+        else:
+            self.speed_transition_duration = duration
+        
+        # 전환 시작
+        self.speed_transition_timer = 0
+        self.is_speed_transitioning = True
+    
+    def ease_in_cubic(self, t):
+        """Cubic 이징 함수 (In) - 시작 천천히"""
+        return t * t * t
+    
+    def ease_out_cubic(self, t):
+        """Cubic 이징 함수 (Out) - 끝에 천천히"""
+        return 1 - pow(1 - t, 3)
+    
+    def ease_in_out_cubic(self, t):
+        """Cubic 이징 함수 (In/Out) - 시작과 끝에 천천히"""
+        if t < 0.5:
+            return 4 * t * t * t
+        else:
+            return 1 - pow(-2 * t + 2, 3) / 2
+
+    def check_deceleration(self):
+        """감속 여부 확인 및 브레이크등 관리"""
+        # 이전 속도와 현재 속도 비교하여 감속 중인지 확인
+        speed_diff = self.prev_speed - self.speed
+        
+        # 임계값 이상 감속 중이라면 감속 상태로 설정하고 브레이크등 켜기
+        if speed_diff > self.deceleration_threshold:
+            self.is_decelerating = True
+            self.brake_lights_on = True
+        else:
+            self.is_decelerating = False
+            
+            # 브레이크/후효과 상태가 아니라면 브레이크등 끄기
+            if not self.is_braking and not self.brake_afterglow:
+                self.brake_lights_on = False
+
+    def update_lane_position(self, road_left, road_right, dt=1/60):
+        """차선 내에서 좌우 움직임 업데이트"""
+        road_center = (road_left + road_right) // 2
+        
+        # 새로운 목표 위치 설정
+        if self.lane_change_due:
+            self.lane_change_due = False
+            self.lane_change_interval = self.rng.uniform(1.0, 2.5)  # 더 자주 움직이도록 변경 (1.5-3 → 1.0-2.5)
+            self.timers.start("front.lane_change", self.lane_change_interval)
+            
+            # 차선 내에서 랜덤한 x 위치 선택
+            max_deviation = min(self.max_lane_deviation, (road_right - road_left) // 2 - self.width // 2 - 5)
+            self.target_x = road_center + self.rng.uniform(-max_deviation, max_deviation)
+        
+        # 부드럽게 목표 위치로 이동 (move_speed는 60fps 한 프레임당 이동량)
+        move_step = self.move_speed * (dt * 60)
+        if abs(self.x - self.target_x) > move_step:
+            if self.x < self.target_x:
+                self.x += move_step
+            else:
+                self.x -= move_step
+        
+        # 도로 경계 확인 및 수정
+        half_width = self.width // 2
+        if self.x - half_width < road_left + 5:
+            self.x = road_left + half_width + 5
+            self.target_x = self.x + self.rng.uniform(15, 30)  # 경계에 닿으면 안쪽으로 방향 전환 (10-20 → 15-30)
+        elif self.x + half_width > road_right - 5:
+            self.x = road_right - half_width - 5
+            self.target_x = self.x - self.rng.uniform(15, 30)  # 경계에 닿으면 안쪽으로 방향 전환 (10-20 → 15-30)
+
+    def apply_brake(self):
+        """브레이크 적용"""
+        # 100km/h 미만에서는 브레이크를 적용하지 않음
+        if self.speed < 100:
+            return
+            
+        self.is_braking = True
+        # 브레이크 단계를 1 또는 2로 설정 (70% 확률로 강한 브레이크) - 더 극적인 감속을 위해 강한 브레이크 확률 증가 (60% → 70%)
+        self.brake_intensity = self.rng.choices([1, 2], weights=[30, 70], k=1)[0]
+        
+        # 브레이크 강도에 따라 브레이크 지속 시간 차별화
+        if self.brake_intensity == 1:  # 약한 브레이크는 짧게
+            self.brake_duration = self.rng.uniform(1.5, 2.0)  # 더 짧게 (1.5-2.5 → 1.5-2.0)
+        else:  # 강한 브레이크는 길게
+            self.brake_duration = self.rng.uniform(2.5, 4.0)  # 더 길게 (2.0-3.5 → 2.5-4.0)
+        
+        # 브레이크 종료 예약, 다음 브레이크 시간은 지금부터 다시 계산
+        self.brake_end_due = False
+        self.timers.start("front.brake_end", self.brake_duration)
+        self.brake_due = False
+        self.timers.start("front.brake", self.next_brake_time)
+        
+        # 브레이크 적용 시 목표 속도 감소 (이징을 통해 점진적으로 적용)
+        brake_amount = 60 if self.brake_intensity == 1 else 130  # 브레이크 효과 차이
+        target_brake_speed = max(self.min_speed, self.speed - brake_amount)
+        
+        # 브레이크 강도에 따라 적절한 지속 시간과 이징 유형 선택
+        if self.brake_intensity == 1:
+            self.start_speed_transition(target_brake_speed, "ease-out", 1.2)  # 약한 브레이크는 짧게
+        else:
+            self.start_speed_transition(target_brake_speed, "ease-out", 1.8)  # 강한 브레이크는 길게
+        
+        # 브레이크등 켜기
+        self.brake_lights_on = True
+    
+    def release_brake(self):
+        """브레이크 해제"""
+        self.is_braking = False
+        
+        # 브레이크 해제 시 목표 속도 증가 - 브레이크 강도에 따라 가속 정도 차별화 (순항 속도 기준으로 조정)
+        if self.brake_intensity == 1:  # 약한 브레이크 후 복귀
+            # 현재 속도와 순항 속도 사이의 차이를 고려한 목표 설정
+            if self.speed < self.cruise_speed:
+                # 순항 속도보다 느릴 경우 순항 속도까지 가속
+                target_speed = min(self.cruise_speed + 10, self.speed + self.rng.uniform(20, 30))
+            else:
+                # 순항 속도보다 빠를 경우 현재 속도 유지 또는 약간 감속
+                target_speed = max(self.cruise_speed, self.speed - self.rng.uniform(5, 15))
+                
+            # 속도 제한 적용
+            target_speed = max(self.min_speed, min(self.max_speed, target_speed))
+                
+            # 가속은 빠르게 (0.8초 내외)
+            self.start_speed_transition(target_speed, "ease-in", 0.8)
+        else:  # 강한 브레이크 후 강한 가속
+            if self.speed < self.cruise_speed - 30:
+                # 많이 감속된 경우 순항 속도까지 빠르게 복귀
+                target_speed = min(self.cruise_speed + 20, self.speed + self.rng.uniform(40, 60))
+                self.start_speed_transition(target_speed, "ease-in", 1.2)  # 빠른 가속
+            else:
+                # 적당히 감속된 경우 순항 속도 근처로 복귀
+                target_speed = min(self.max_speed, self.cruise_speed + self.rng.uniform(-10, 20))
+                self.start_speed_transition(target_speed, "ease-in-out", 1.5)
+        
+        # 감속 중이 아니라면 브레이크등 끄기
+        if not self.is_decelerating:
+            self.brake_lights_on = False
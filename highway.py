@@ -0,0 +1,34 @@
+import pygame
+from highway_model import HighwayModel
+from profiler import frame_profiler
+
+class Highway(HighwayModel):
+    """화면에 그려지는 여러 차선의 주변 차량 (원근감으로 보이는 차량만 그림)"""
+    color = (200, 120, 0)  # 주황색 (앞 차량, 대열과 구분)
+    view_distance = 350  # 이보다 먼 차량은 지평선에 겹치므로 그리지 않음 (원근감 계산의 최대 거리)
+
+    def update(self, dt=1/60, obstacles=()):
+        """주변 차량 상태 업데이트 (실행 시간 측정)"""
+        with frame_profiler.phase("Highway.update"):
+            super().update(dt, obstacles)
+
+    def draw(self, screen, simulation):
+        """플레이어 앞 view_distance m 안의 차량을 먼 차량부터 그리고 그린 영역 목록 반환"""
+        rects = []
+        viewer = simulation.traveled_distance
+        ids = self.visible(viewer, self.view_distance)
+        for position, x, brake_lights_on in zip(self.position[ids].tolist(), self.x[ids].tolist(),
+                                                self.brake_lights_on[ids].tolist()):
+            distance = position - viewer
+            size = max(0.3, simulation._size_ratio_for_distance(distance))
+            body = pygame.draw.rect(screen, self.color, simulation._traffic_rect(x, distance))
+
+            # 브레이크등 (FrontCar와 같은 차체 폭 90%의 긴 등)
+            if brake_lights_on:
+                light_width = int(body.width * 0.9)
+                light_height = max(3, int(8 * size))
+                pygame.draw.rect(screen, (255, 0, 0),
+                                 (body.centerx - light_width // 2, body.bottom - max(5, int(10 * size)),
+                                  light_width, light_height))
+            rects.append(body)
+        return rects
@@ -0,0 +1,256 @@
+import numpy as np
+from batch_engine import FrontCarBatch
+from platoon_model import GapKeeping
+
+# 차선 번호를 위치보다 큰 자리에 두어 (차선, 위치) 순서를 실수 하나로 비교하기 위한 간격 (m)
+LANE_KEY = 1e9
+
+def sweep_and_prune(low_s, high_s, low_x, high_x):
+    """축 정렬 상자 목록에서 서로 겹치는 쌍 (i, j) 배열 반환 (스윕 앤 프룬 광역 단계)
+
+    상자를 진행 방향 시작 좌표로 정렬하고, 각 상자의 끝 좌표를 이분 탐색해 진행 방향으로 겹치는 후보만 만든 뒤
+    좌우 방향도 겹치는 쌍만 남긴다. 상자 수 n, 후보 수 k일 때 O(n log n + k)이다.
+    겹침 판정은 CarSimulation._rects_overlap과 같이 경계가 맞닿는 경우를 제외한다 (크기가 양수인 상자 기준).
+    """
+    n = len(low_s)
+    order = np.argsort(low_s, kind="stable")
+    rank = np.arange(n)
+    end = np.searchsorted(low_s[order], high_s[order], "left")
+    count = np.maximum(end - rank - 1, 0)
+    total = int(count.sum())
+    if total == 0:
+        return np.empty((0, 2), dtype=np.intp)
+
+    # 정렬 순위 r의 후보는 r+1 ~ end-1 순위 (구간별 연번을 한 번에 생성)
+    first = np.repeat(rank, count)
+    second = first + 1 + np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+    i = order[first]
+    j = order[second]
+    overlap = (low_x[i] < high_x[j]) & (low_x[j] < high_x[i])
+    return np.stack((i[overlap], j[overlap]), axis=1)
+
+class LaneIndex:
+    """차선별로 진행 방향 순서를 유지하는 정렬 색인
+
+    (차선, 위치)를 실수 키 하나(차선 × LANE_KEY + 위치)로 만들어 정렬해 두므로 같은 차선의 차량은 연속된 구간에
+    위치 순으로 놓인다. 매 단계 위치가 조금씩만 바뀌므로 이전 순서에서 안정 정렬(timsort)을 다시 하면
+    거의 선형 시간에 끝나고, 순서가 그대로면 정렬을 건너뛴다. 임의 위치의 앞/뒤 차량은 이분 탐색(O(log n))으로 찾는다.
+    """
+
+    def __init__(self, lane, position):
+        self.order = np.argsort(lane * LANE_KEY + position, kind="stable")  # 정렬 순서의 차량 번호
+        self.update(lane, position)
+
+    def update(self, lane, position):
+        """바뀐 차선과 위치로 순서 갱신 (이미 정렬돼 있으면 정렬하지 않음)"""
+        keys = (lane * LANE_KEY + position)[self.order]
+        if np.any(keys[1:] < keys[:-1]):
+            resort = np.argsort(keys, kind="stable")
+            self.order = self.order[resort]
+            keys = keys[resort]
+        self.keys = keys
+        self.sorted_lane = lane[self.order]
+
+    def neighbours(self):
+        """모든 차량의 같은 차선 앞 차량과 뒤 차량 번호 배열 (없으면 -1)"""
+        n = len(self.order)
+        leader = np.full(n, -1, dtype=np.intp)
+        follower = np.full(n, -1, dtype=np.intp)
+        same = self.sorted_lane[1:] == self.sorted_lane[:-1]
+        leader[self.order[:-1][same]] = self.order[1:][same]
+        follower[self.order[1:][same]] = self.order[:-1][same]
+        return leader, follower
+
+    def lookup(self, lane, position):
+        """차선 lane의 위치 position 바로 앞 차량과 뒤(같은 위치 포함) 차량 번호 (배열 가능, 없으면 -1)"""
+        lane = np.asarray(lane)
+        k = np.searchsorted(self.keys, lane * LANE_KEY + position, "right")
+        n = len(self.order)
+        ahead = np.minimum(k, n - 1)
+        behind = np.maximum(k - 1, 0)
+        leader = np.where((k < n) & (self.sorted_lane[ahead] == lane), self.order[ahead], -1)
+        follower = np.where((k > 0) & (self.sorted_lane[behind] == lane), self.order[behind], -1)
+        return leader, follower
+
+    def range(self, lane, low, high):
+        """차선 lane에서 위치가 low 초과 high 이하인 차량 번호 (위치 오름차순)"""
+        start = np.searchsorted(self.keys, lane * LANE_KEY + low, "right")
+        end = np.searchsorted(self.keys, lane * LANE_KEY + high, "right")
+        return self.order[start:end]
+
+class HighwayModel:
+    """K개 차선을 달리는 N대의 주변 차량 (구조체 배열, pygame 없이 동작)
+
+    운전자별 희망 속도와 브레이크는 FrontCarBatch가 앞 차량 규칙으로 정하고, 실제 속도는 추종 모델이
+    같은 차선 앞차와의 간격에 맞춰 정한다. 앞차 때문에 희망 속도를 내지 못하면 옆 차선의 앞 간격이 충분히 넓고
+    뒤차와의 간격이 안전할 때 차선을 바꾼다. 같은 차선의 앞/뒤 차량은 LaneIndex로 찾고,
+    차량끼리의 충돌은 스윕 앤 프룬으로 찾는다. position은 진행 방향 위치 (m), x는 화면 가로 위치 (픽셀)이다.
+    """
+    min_gap = 8  # 같은 차선 최소 간격 (CarSimulation.min_car_distance와 같음)
+    headway = 1.0  # 추종 모델과 뒤따르는 차량이 유지할 시간 간격 (초)
+    length = 5  # 차량 길이 (m, 충돌 판정용)
+    width = 60  # 차량 폭 (픽셀, 앞 차량과 같음)
+    lane_change_duration = 1.5  # 차선 변경에 걸리는 시간 (초)
+    lane_change_cooldown = 3.0  # 차선 변경 후 다시 바꿀 수 있을 때까지의 시간 (초)
+    lane_change_advantage = 20  # 옆 차선 앞 간격이 지금보다 이만큼 넓어야 바꿈 (m)
+    deceleration_threshold = 1.0  # 브레이크등을 켜는 감속량 (60fps 한 프레임 기준)
+
+    def __init__(self, n, lanes, road_left, road_width, start_position=0, spacing=60, rng=None, model=None):
+        self.n = n
+        self.lanes = lanes
+        self.road_left = road_left
+        self.road_right = road_left + road_width
+        self.lane_width = road_width / lanes
+        self.lane_centers = road_left + self.lane_width * (np.arange(lanes) + 0.5)
+        self.drivers = FrontCarBatch(n, x=road_left + road_width // 2, rng=rng)
+        self.model = model if model is not None else GapKeeping(self.headway, self.min_gap)
+
+        # 차량별 상태 (구조체 배열): 차선마다 spacing 간격으로 배치하고 조금씩 어긋나게 함
+        self.lane = np.arange(n) % lanes
+        self.position = (start_position + spacing * (np.arange(n) // lanes + 1) +
+                         self.drivers.rng.uniform(0, spacing / 2, n))
+        self.speed = self.drivers.speed.copy()
+        self.x = self.lane_centers[self.lane]
+        self.from_x = self.x.copy()  # 차선 변경을 시작한 가로 위치
+        self.change_timer = np.full(n, self.lane_change_cooldown)  # 마지막 차선 변경 후 경과 시간
+        self.brake_lights_on = np.zeros(n, dtype=bool)
+        self.lane_changes = 0  # 누적 차선 변경 횟수
+        self.collision_count = 0  # 누적 차량 간 충돌 횟수
+        self.index = LaneIndex(self.lane, self.position)
+
+    def lane_of(self, x):
+        """화면 가로 위치가 속한 차선 번호"""
+        return min(self.lanes - 1, max(0, int((x - self.road_left) // self.lane_width)))
+
+    def update(self, dt=1/60, obstacles=()):
+        """모든 차량을 dt초만큼 진행 (obstacles: 추종 대상이 되는 외부 차량 (차선, 위치, 속도) 목록)"""
+        # 운전자별 희망 속도와 브레이크 (좌우 움직임은 차선 위치를 따르므로 사용하지 않음)
+        self.drivers.update(self.road_left, self.road_right, dt)
+
+        # 앞차 간격을 보고 차선 변경 후 색인 갱신
+        self.index.update(self.lane, self.position)
+        gap, leader_speed = self._leader_gaps(obstacles)
+        if self._change_lanes(gap, leader_speed):
+            self.index.update(self.lane, self.position)
+            gap, leader_speed = self._leader_gaps(obstacles)
+
+        # 같은 차선 앞차와의 간격에 맞춘 실제 속도
+        new_speed = self.model.follow(self.drivers.speed, self.speed, gap, leader_speed, dt)
+        self.brake_lights_on = self.drivers.brake_lights_on | (self.speed - new_speed > self.deceleration_threshold * dt * 60)
+        self.speed = new_speed
+        self.position += self.speed * dt
+
+        # 차선 변경 중인 차량의 가로 위치
+        self.change_timer += dt
+        progress = np.minimum(1.0, self.change_timer / self.lane_change_duration)
+        self.x = self.from_x + (self.lane_centers[self.lane] - self.from_x) * progress
+
+        self._resolve_collisions()
+
+    def _leader_gaps(self, obstacles):
+        """차량별 같은 차선 앞차와의 간격과 앞차 속도 (외부 차량 포함, 앞차가 없으면 무한대와 자기 속도)"""
+        leader, _ = self.index.neighbours()
+        has_leader = leader >= 0
+        gap = np.where(has_leader, self.position[leader] - self.position, np.inf)
+        leader_speed = np.where(has_leader, self.speed[leader], self.speed)
+
+        # 외부 차량은 그 바로 뒤 차량의 앞차로 취급
+        for lane, position, speed in obstacles:
+            _, behind = self.index.lookup(lane, position)
+            if behind >= 0 and position - self.position[behind] < gap[behind]:
+                gap[behind] = position - self.position[behind]
+                leader_speed[behind] = speed
+        return gap, leader_speed
+
+    def _change_lanes(self, gap, leader_speed):
+        """앞차에 막힌 차량 중 옆 차선으로 옮겨 갈 수 있는 차량의 차선 변경 (바꾼 차량 수 반환)"""
+        blocked = ((self.change_timer >= self.lane_change_cooldown) &
+                   (gap < self.speed * self.headway * 2 + self.min_gap) &
+                   (leader_speed < self.drivers.speed - 5))
+        candidates = np.flatnonzero(blocked)
+        if candidates.size == 0:
+            return 0
+
+        position = self.position[candidates]
+        best_lane = np.full(candidates.size, -1)
+        best_gain = np.full(candidates.size, float(self.lane_change_advantage))
+        for direction in (-1, 1):
+            target = self.lane[candidates] + direction
+            valid = (target >= 0) & (target < self.lanes)
+            target = np.clip(target, 0, self.lanes - 1)
+            ahead, behind = self.index.lookup(target, position)
+            ahead_gap = np.where(ahead >= 0, self.position[ahead] - position, np.inf)
+            behind_gap = np.where(behind >= 0, position - self.position[behind], np.inf)
+            behind_speed = np.where(behind >= 0, self.speed[behind], 0.0)
+
+            # 옆 차선 앞 간격이 넓고, 뒤차가 시간 간격의 절반 안에 닿지 않을 때만
+            gain = ahead_gap - gap[candidates]
+            ok = (valid & (gain > best_gain) & (ahead_gap > self.min_gap + self.length) &
+                  (behind_gap > self.min_gap + self.length + behind_speed * self.headway * 0.5))
+            best_lane = np.where(ok, target, best_lane)
+            best_gain = np.where(ok, gain, best_gain)
+
+        chosen = best_lane >= 0
+        ids = candidates[chosen]
+        self.from_x[ids] = self.x[ids]
+        self.lane[ids] = best_lane[chosen]
+        self.change_timer[ids] = 0
+        self.lane_changes += ids.size
+        return ids.size
+
+    def boxes(self):
+        """차량별 충돌 상자 (진행 방향 시작/끝 m, 가로 시작/끝 픽셀)"""
+        half_length = self.length / 2
+        half_width = self.width / 2
+        return (self.position - half_length, self.position + half_length,
+                self.x - half_width, self.x + half_width)
+
+    def _resolve_collisions(self):
+        """겹친 차량 쌍을 세고, 뒤 차량을 앞 차량 뒤로 물리고 속도를 맞춤"""
+        pairs = sweep_and_prune(*self.boxes())
+        if len(pairs) == 0:
+            return
+        self.collision_count += len(pairs)
+        i, j = pairs[:, 0], pairs[:, 1]
+        rear = np.where(self.position[i] <= self.position[j], i, j)
+        front = np.where(self.position[i] <= self.position[j], j, i)
+        self.position[rear] = np.minimum(self.position[rear], self.position[front] - self.length)
+        self.speed[rear] = np.minimum(self.speed[rear], self.speed[front])
+
+    def follower_speed(self, lane, position, speed):
+        """차선 lane의 위치 position에서 따라가는 외부 차량 속도를 앞차와의 간격이 허용하는 만큼으로 제한"""
+        leader, _ = self.index.lookup(lane, position)
+        if leader < 0:
+            return speed
+        gap = self.position[leader] - position
+        return min(speed, max(0.0, (gap - self.min_gap) / self.headway))
+
+    def push(self, ids, position, speed):
+        """외부 차량(위치 position, 속도 speed)에 밀린 차량들을 최소 간격만큼 앞으로 밀어냄"""
+        self.position[ids] = np.maximum(self.position[ids], position + self.min_gap)
+        self.speed[ids] = np.maximum(self.speed[ids], speed)
+
+    def visible(self, viewer_position, max_distance):
+        """viewer_position 앞 max_distance m 안에 있는 차량 번호 (먼 차량부터, 차선마다 이분 탐색)"""
+        ids = np.concatenate([self.index.range(lane, viewer_position, viewer_position + max_distance)
+                              for lane in range(self.lanes)])
+        return ids[np.argsort(-self.position[ids], kind="stable")]
+
+    def snapshot(self):
+        """주변 차량 상태를 튜플로 저장 (배열 복사본, 누적 횟수, 난수 생성기 상태)"""
+        arrays = {name: value.copy() for name, value in vars(self).items() if isinstance(value, np.ndarray)}
+        drivers = {name: value.copy() for name, value in vars(self.drivers).items() if isinstance(value, np.ndarray)}
+        return (arrays, self.index.order.copy(), self.lane_changes, self.collision_count,
+                self.drivers.time, drivers, self.drivers.rng.bit_generator.state)
+
+    def restore(self, state):
+        """snapshot()으로 저장한 주변 차량 상태로 되돌림"""
+        arrays, order, self.lane_changes, self.collision_count, time, drivers, rng_state = state
+        for name, value in arrays.items():
+            setattr(self, name, value.copy())
+        self.index.order = order.copy()
+        self.index.update(self.lane, self.position)
+        self.drivers.time = time
+        for name, value in drivers.items():
+            setattr(self.drivers, name, value.copy())
+        self.drivers.rng.bit_generator.state = rng_state
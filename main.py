@@ -1,16 +1,56 @@
+import argparse
 import pygame
 from car_game import CarGame
+from telemetry import telemetry, DEBUG, INFO, WARNING
+from trajectory_recorder import TrajectoryRecorder
+
+TELEMETRY_LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING}
 
 def main():
-    # 게임 초기화
-    pygame.init()
+    # 실행 옵션
+    parser = argparse.ArgumentParser(description="자동차 안전거리 교육 게임")
+    parser.add_argument("--dirty-rects", action="store_true", help="바뀐 영역만 화면에 반영 (느린 컴퓨터용)")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="실제 1초당 진행할 시뮬레이션 시간 (빨리 감기)")
+    parser.add_argument("--fps", type=int, default=60, help="화면 최대 주기 (0이면 제한 없음, 시뮬레이션은 항상 60Hz)")
+    parser.add_argument("--draw-budget", type=float, default=8.0,
+                        help="한 프레임 그리기 목표 시간 (밀리초, 넘으면 효과를 단계별로 줄임, 0이면 항상 전체 효과)")
+    parser.add_argument("--telemetry", choices=sorted(TELEMETRY_LEVELS), help="주행 기록 수준 (지정하지 않으면 기록하지 않음)")
+    parser.add_argument("--telemetry-file", help="주행 기록을 저장할 파일 (.bin이면 이진 기록, 없으면 stderr)")
+    parser.add_argument("--record", help="매 단계 주행 궤적을 기록할 .npy 파일")
+    parser.add_argument("--seed", type=int, help="세션 난수 시드 (지정하지 않으면 무작위)")
+    parser.add_argument("--record-input", help="재생용 조작 입력 기록을 저장할 JSON 파일")
+    parser.add_argument("--platoon", type=int, default=0, help="대열 주행 모드: 앞 차량 앞에 늘어설 선행 차량 수")
+    parser.add_argument("--lanes", type=int, default=1, help="도로의 차선 수 (차선 폭이 차량 폭보다 넓도록 6 이하)")
+    parser.add_argument("--traffic", type=int, default=0, help="여러 차선을 함께 달리는 주변 차량 수")
+    args = parser.parse_args()
+    if not 1 <= args.lanes <= 6:
+        parser.error("--lanes는 1~6 사이여야 합니다")
+    
+    # 주행 기록 시작
+    if args.telemetry:
+        telemetry.start(TELEMETRY_LEVELS[args.telemetry], path=args.telemetry_file)
+    
+    # 주행 궤적 기록기
+    recorder = TrajectoryRecorder(args.record) if args.record else None
     
     # 게임 객체 생성 및 실행
-    game = CarGame()
-    game.run()
+    game = CarGame(time_scale=args.time_scale, dirty_rects=args.dirty_rects, recorder=recorder,
+                   seed=args.seed, record_input=args.record_input is not None, platoon_size=args.platoon,
+                   lanes=args.lanes, traffic_size=args.traffic, max_fps=args.fps,
+                   draw_budget=args.draw_budget)
+    try:
+        game.run()
+    finally:
+        # 재생용 입력 기록 저장 (재시작했다면 마지막 세션)
+        if args.record_input:
+            game.finish_input_log().save(args.record_input)
+        # 남은 기록 내보내기
+        telemetry.stop()
+        if recorder is not None:
+            recorder.close()
     
     # 게임 종료
     pygame.quit()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
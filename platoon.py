@@ -0,0 +1,39 @@
+import pygame
+from platoon_model import PlatoonModel
+from profiler import frame_profiler
+
+class Platoon(PlatoonModel):
+    """화면에 그려지는 선행 차량 대열 (원근감으로 보이는 차량만 그림)"""
+    color = (0, 0, 160)  # 앞 차량보다 조금 어두운 파란색
+    view_distance = 350  # 이보다 먼 차량은 지평선에 겹치므로 그리지 않음 (원근감 계산의 최대 거리)
+
+    def update(self, road_left, road_right, dt=1/60):
+        """대열 상태 업데이트 (실행 시간 측정)"""
+        with frame_profiler.phase("Platoon.update"):
+            super().update(road_left, road_right, dt)
+
+    def draw(self, screen, simulation):
+        """플레이어 앞 view_distance m 안의 차량을 먼 차량부터 그리고 그린 영역 목록 반환"""
+        rects = []
+        viewer = simulation.traveled_distance
+        visible = self.visible(viewer, self.view_distance)
+        window = slice(visible.start, visible.stop)
+        # 보이는 구간만 파이썬 값으로 꺼내 그림 (배열 원소를 하나씩 읽는 것보다 빠름)
+        for position, x, brake_lights_on in zip(self.position[window].tolist(), self.drivers.x[window].tolist(),
+                                                self.brake_lights_on[window].tolist()):
+            distance = position - viewer
+            size = max(0.3, simulation._size_ratio_for_distance(distance))
+            width = int(60 * size)
+            height = int(100 * size)
+            y = simulation._visual_position_for_distance(distance)
+            body = pygame.draw.rect(screen, self.color, (x - width // 2, y - height // 2, width, height))
+
+            # 브레이크등 (FrontCar와 같은 차체 폭 90%의 긴 등)
+            if brake_lights_on:
+                light_width = int(width * 0.9)
+                light_height = max(3, int(8 * size))
+                pygame.draw.rect(screen, (255, 0, 0),
+                                 (x - light_width // 2, y + height // 2 - max(5, int(10 * size)),
+                                  light_width, light_height))
+            rects.append(body)
+        return rects
@@ -0,0 +1,131 @@
+import numpy as np
+from batch_engine import FrontCarBatch
+
+class GapKeeping:
+    """앞 차량 규칙이 정한 희망 속도를 따르되 앞차와의 간격이 허용하는 속도로 제한하는 추종 모델
+
+    허용 속도 (간격 - 최소 간격) / 시간 간격을 넘지 않으므로 앞차가 멈추면 최소 간격까지 다가가 함께 멈춘다.
+    """
+
+    def __init__(self, headway=1.0, min_gap=8):
+        self.headway = headway  # 유지할 시간 간격 (초)
+        self.min_gap = min_gap  # 정지 시 최소 간격 (m)
+
+    def follow(self, desired, speed, gap, leader_speed, dt):
+        """다음 속도 배열 반환 (desired: 희망 속도, speed: 현재 속도, gap: 앞차와의 간격, leader_speed: 앞차 속도)"""
+        return np.minimum(desired, np.maximum(0.0, (gap - self.min_gap) / self.headway))
+
+class IntelligentDriverModel:
+    """지능형 운전자 모델(IDM) 추종 모델 - 희망 속도는 앞 차량 규칙에서 받음
+
+    가속도 = 최대 가속도 × (1 - (속도/희망 속도)^delta - (희망 간격/간격)^2)이며,
+    희망 간격은 최소 간격 + 속도 × 시간 간격 + 속도 × 접근 속도 / (2√(최대 가속도 × 편안한 감속도))이다.
+    반응이 한 박자 늦어 대열 뒤쪽으로 갈수록 감속이 커지는 정체파(stop-and-go)가 나타난다.
+    기본값은 표준 IDM 값(1.5초, 1 m/s², 1.5 m/s²)을 이 게임의 속도 수치(고속도로 약 120)에 맞춰 4배로 키운 것이다.
+    """
+
+    def __init__(self, headway=1.5, min_gap=8, max_accel=4.0, comfort_decel=6.0, delta=4):
+        self.headway = headway
+        self.min_gap = min_gap
+        self.max_accel = max_accel  # 최대 가속도 (속도 단위/초)
+        self.comfort_decel = comfort_decel  # 편안한 감속도 (속도 단위/초)
+        self.delta = delta
+
+    def follow(self, desired, speed, gap, leader_speed, dt):
+        """다음 속도 배열 반환 (GapKeeping.follow와 같은 인자)"""
+        closing = speed - leader_speed
+        desired_gap = self.min_gap + np.maximum(
+            0.0, speed * self.headway + speed * closing / (2 * np.sqrt(self.max_accel * self.comfort_decel)))
+        accel = self.max_accel * (1 - (speed / np.maximum(desired, 1e-6)) ** self.delta -
+                                  (desired_gap / np.maximum(gap, 1e-6)) ** 2)
+        return np.maximum(0.0, speed + accel * dt)
+
+class PlatoonModel:
+    """한 차선에 늘어선 N대의 선행 차량 (구조체 배열, pygame 없이 동작)
+
+    0번이 맨 앞 차량이고 번호가 클수록 뒤에 있다. 각 운전자의 희망 속도, 브레이크, 좌우 움직임은
+    FrontCarBatch가 앞 차량 규칙으로 정하고, 실제 속도는 추종 모델(follow 메서드)이 앞차와의 간격에 맞춰 정한다.
+    position은 도로를 따라 잰 위치 (m, 플레이어 이동 거리와 같은 기준)이다.
+    """
+    min_gap = 8  # 차량 사이 최소 간격 (CarSimulation.min_car_distance와 같음)
+    headway = 1.0  # 대열 맨 뒤 차량을 따라가는 차량이 유지할 시간 간격 (초)
+    deceleration_threshold = 1.0  # 브레이크등을 켜는 감속량 (60fps 한 프레임 기준)
+
+    def __init__(self, n, start_position, spacing=150, x=400, rng=None, model=None):
+        self.n = n
+        self.drivers = FrontCarBatch(n, x=x, rng=rng)
+        self.model = model if model is not None else GapKeeping(self.headway, self.min_gap)
+
+        # 차량별 상태 (구조체 배열)
+        self.position = start_position + spacing * np.arange(n, 0, -1, dtype=np.float64)
+        self.speed = self.drivers.speed.copy()
+        self.gap = np.full(n, np.inf)  # 앞차와의 간격 (맨 앞 차량은 무한대)
+        self.leader_speed = self.speed.copy()  # 앞차 속도 (맨 앞 차량은 자기 속도)
+        self.brake_lights_on = np.zeros(n, dtype=bool)
+        self.offsets = self.min_gap * np.arange(n, dtype=np.float64)  # 최소 간격 제한용
+
+    @property
+    def x(self):
+        """좌우 위치 (앞 차량 규칙의 차선 내 움직임)"""
+        return self.drivers.x
+
+    def update(self, road_left, road_right, dt=1/60):
+        """모든 차량을 dt초만큼 진행"""
+        # 운전자별 희망 속도, 브레이크, 좌우 움직임
+        self.drivers.update(road_left, road_right, dt)
+
+        # 앞차와의 간격에 맞춘 실제 속도
+        np.subtract(self.position[:-1], self.position[1:], out=self.gap[1:])
+        self.leader_speed[0] = self.speed[0]
+        self.leader_speed[1:] = self.speed[:-1]
+        new_speed = self.model.follow(self.drivers.speed, self.speed, self.gap, self.leader_speed, dt)
+
+        # 브레이크등: 운전자가 브레이크를 밟았거나 간격 때문에 감속 중
+        self.brake_lights_on = self.drivers.brake_lights_on | (self.speed - new_speed > self.deceleration_threshold * dt * 60)
+        self.speed = new_speed
+        self.position += self.speed * dt
+
+        # 한 차선이므로 앞차와 최소 간격 유지 (pos[i] + i*g의 누적 최솟값으로 한 번에 계산)
+        self.position = np.minimum.accumulate(self.position + self.offsets) - self.offsets
+
+    def follower_speed(self, position, speed):
+        """대열 맨 뒤 차량을 따라가는 차량(위치 position)의 속도를 간격이 허용하는 만큼으로 제한"""
+        gap = self.position[-1] - position
+        return min(speed, max(0.0, (gap - self.min_gap) / self.headway))
+
+    def push(self, position, speed):
+        """뒤따르는 차량(위치 position, 속도 speed)에 밀린 차량들을 최소 간격만큼 앞으로 밀어냄
+
+        밀린 차량은 미는 차량보다 느리지 않게 한다. 뒤에서부터 i번째 차량은 position + i × 최소 간격보다
+        앞에 있어야 하므로 요소별 최댓값 한 번으로 계산된다 (차량 순서와 간격 조건은 그대로 유지).
+        """
+        if self.position[-1] - position >= self.min_gap:
+            return
+        required = position + self.n * self.min_gap - self.offsets
+        pushed = required > self.position
+        self.position = np.where(pushed, required, self.position)
+        self.speed = np.where(pushed, np.maximum(self.speed, speed), self.speed)
+
+    def visible(self, viewer_position, max_distance):
+        """viewer_position 앞 max_distance m 안에 있는 차량 번호 (먼 차량부터, 위치가 내림차순이므로 이분 탐색)"""
+        ahead = -self.position  # 오름차순
+        start = np.searchsorted(ahead, -(viewer_position + max_distance), "left")
+        end = np.searchsorted(ahead, -viewer_position, "left")
+        return range(start, end)
+
+    def snapshot(self):
+        """대열 상태를 튜플로 저장 (배열 복사본과 난수 생성기 상태)"""
+        drivers = {name: value.copy() for name, value in vars(self.drivers).items() if isinstance(value, np.ndarray)}
+        return (self.position.copy(), self.speed.copy(), self.brake_lights_on.copy(),
+                self.drivers.time, drivers, self.drivers.rng.bit_generator.state)
+
+    def restore(self, state):
+        """snapshot()으로 저장한 대열 상태로 되돌림"""
+        position, speed, brake_lights_on, time, drivers, rng_state = state
+        self.position = position.copy()
+        self.speed = speed.copy()
+        self.brake_lights_on = brake_lights_on.copy()
+        self.drivers.time = time
+        for name, value in drivers.items():
+            setattr(self.drivers, name, value.copy())
+        self.drivers.rng.bit_generator.state = rng_state
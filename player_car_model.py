@@ -0,0 +1,225 @@
+from operator import attrgetter
+
+class PlayerCarModel:
+    """플레이어 차량의 주행 로직 (pygame 없이 동작하는 시뮬레이션 코어)"""
+    # snapshot()/restore()로 저장하는 주행 상태 (나머지 속성은 생성 후 바뀌지 않는 설정 값)
+    state_fields = ("x", "y", "speed", "target_speed", "left_moving", "right_moving",
+                    "acceleration_progress", "acceleration_duration", "acceleration_timer",
+                    "is_accelerating", "prev_target_speed", "brake_lights_on", "is_down_key_pressed")
+    __slots__ = state_fields + ("width", "height", "color", "min_speed", "max_speed", "speed_change",
+                                "acceleration_factor", "lateral_speed", "speed_smoothing",
+                                "key_press_timer", "key_press_interval")
+    _get_state = attrgetter(*state_fields)
+
+    def __init__(self, x, y):
+        self.width = 60
+        self.height = 100
+        self.color = (200, 0, 0)  # 빨간색
+        
+        # 속도 관련 변수 (km/h)
+        self.min_speed = 10
+        self.max_speed = 180  # 최대 속도 증가 (150 → 180)
+        self.speed_change = 5  # 키 입력당 속도 변화량 크게 증가 (10 → 18)
+        self.acceleration_factor = 2.5  # 가속 계수 크게 증가 (2.0 → 3.5)
+        
+        # 좌우 이동 관련 변수
+        self.lateral_speed = 8  # 좌우 이동 속도 증가 (7 → 8)
+        
+        # 속도 변화 부드럽게 하기 위한 변수
+        self.speed_smoothing = 0.3  # 속도 변화 계수 감소 (0.8 → 0.3) - 더 부드러운 변화를 위해
+        
+        # 연속 키 입력을 위한 타이머
+        self.key_press_interval = 0.03  # 연속 입력 간격 감소 (0.05 → 0.03)
+        
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """(x, y)에서 출발하는 처음 주행 상태로 되돌림 (설정 값은 그대로)"""
+        self.x = x
+        self.y = y
+        self.speed = 60  # 초기 속도
+        self.left_moving = False
+        self.right_moving = False
+        self.target_speed = self.speed
+        
+        # 이징(easing) 관련 변수
+        self.acceleration_progress = 0  # 현재 가속/감속 진행 상태 (0~1)
+        self.acceleration_duration = 1.0  # 가속/감속 완료까지 걸리는 시간 (초)
+        self.acceleration_timer = 0  # 가속/감속 진행 시간
+        self.is_accelerating = False  # 가속/감속 진행 여부
+        self.prev_target_speed = self.speed  # 이전 목표 속도
+        
+        # 연속 키 입력을 위한 타이머
+        self.key_press_timer = {
+            "up": 0,
+            "down": 0
+        }
+        
+        # 브레이크 등 관련 변수
+        self.brake_lights_on = False  # 브레이크 등 상태
+        self.is_down_key_pressed = False  # 아래 방향키 누름 상태
+    
+    def update(self, road_left, road_right, dt=1/60):
+        """플레이어 차량 상태 업데이트 (dt: 시뮬레이션 시간 간격, 초)"""
+        # 좌우 이동 (lateral_speed는 60fps 한 프레임당 이동량)
+        if self.left_moving:
+            self.move_left(dt * 60)
+        if self.right_moving:
+            self.move_right(dt * 60)
+            
+        # 연속 키 입력 처리
+        for key in self.key_press_timer:
+            if self.key_press_timer[key] > 0:
+                self.key_press_timer[key] -= dt
+                if self.key_press_timer[key] <= 0:
+                    # 긴 시간 간격에서는 그 사이에 발생했을 반복 입력을 모두 적용
+                    repeats = 1 + int(-self.key_press_timer[key] / self.key_press_interval)
+                    self.key_press_timer[key] = self.key_press_interval
+                    for _ in range(repeats):
+                        if key == "up":
+                            self.accelerate()
+                        elif key == "down":
+                            self.decelerate()
+            
+        # 차선을 벗어나지 않도록 제한
+        half_width = self.width // 2
+        if self.x - half_width < road_left + 5:
+            self.x = road_left + half_width + 5
+        elif self.x + half_width > road_right - 5:
+            self.x = road_right - half_width - 5
+        
+        # 이징(easing) 방식으로 속도 업데이트
+        self.update_speed_with_easing(dt)
+    
+    def update_speed_with_easing(self, dt=1/60):
+        """이징(easing) 방식으로 속도 업데이트"""
+        # 목표 속도와 현재 속도가 다를 때만 처리
+        if abs(self.speed - self.target_speed) > 0.5:
+            
+            # 새로운 목표 속도로 바뀌었다면 이징 과정 재시작
+            if not self.is_accelerating or abs(self.target_speed - self.prev_target_speed) > 0.5:
+                self.is_accelerating = True
+                self.acceleration_timer = 0
+                self.prev_target_speed = self.target_speed
+                
+                # 가속, 감속에 따라 다른 지속 시간 적용
+                if self.target_speed > self.speed:
+                    # 가속 - 속도 차이가 클수록 오래 걸림 (최소 0.5초 ~ 최대
+                    speed_diff = abs(self.target_speed - self.speed)
+                    speed_ratio = speed_diff / self.max_speed
+                    self.acceleration_duration = max(0.5, min(2.0, 0.5 + speed_ratio * 1.5))
+                else:
+                    # 감속 - 속도 차이가 클수록 오래 걸림 (최소 0.3초 ~ 최대
+                    speed_diff = abs(self.target_speed - self.speed)
+                    speed_ratio = speed_diff / self.max_speed
+                    self.acceleration_duration = max(0.3, min(1.5, 0.3 + speed_ratio * 1.2))
+            
+            # 이징 타이머 업데이트
+            self.acceleration_timer += dt
+            
+            # 진행 비율 계산 (0~1)
+            progress = min(1.0, self.acceleration_timer / self.acceleration_duration)
+            
+            # 이징 함수 적용 (Cubic easing - 점진적 변화)
+            if self.target_speed > self.speed:  # 가속
+                eased_progress = self.ease_in_out_cubic(progress)
+            else:  # 감속
+                eased_progress = self.ease_in_out_quad(progress)
+                
+            # 이징된 속도 계산
+            start_speed = self.speed
+            speed_diff = self.target_speed - start_speed
+            self.speed = start_speed + speed_diff * eased_progress
+            
+            # 이징 완료 확인
+            if progress >= 1.0:
+                self.is_accelerating = False
+                self.speed = self.target_speed
+        else:
+            self.is_accelerating = False
+            self.speed = self.target_speed
+    
+    def ease_in_out_cubic(self, t):
+        """Cubic 이징 함수 (In/Out)"""
+        if t < 0.5:
+            return 4 * t * t * t
+        else:
+            return 1 - pow(-2 * t + 2, 3) / 2
+    
+    def ease_in_out_quad(self, t):
+        """Quadratic 이징 함수 (In/Out)"""
+        if t < 0.5:
+            return 2 * t * t
+        else:
+            return 1 - pow(-2 * t + 2, 2) / 2
+            
+    def move_left(self, frames=1):
+        """왼쪽으로 이동 (frames: 60fps 기준 프레임 수)"""
+        self.x -= self.lateral_speed * frames
+        
+    def move_right(self, frames=1):
+        """오른쪽으로 이동 (frames: 60fps 기준 프레임 수)"""
+        self.x += self.lateral_speed * frames
+    
+    def accelerate(self):
+        """가속"""
+        # 현재 속도에서 점점 더 빠르게 가속 (급격한 변화)
+        acceleration = self.speed_change * (1 + (self.speed / self.max_speed) * self.acceleration_factor)
+        
+        # 낮은 속도에서는 더 빠르게 가속
+        if self.speed < 80:
+            acceleration *= 1.5
+            
+        self.target_speed = min(self.max_speed, self.target_speed + acceleration)
+    
+    def decelerate(self):
+        """감속"""
+        # 현재 속도에서 점점 더 빠르게 감속 (급격한 변화)
+        deceleration = self.speed_change * (1 + (1 - self.speed / self.max_speed) * self.acceleration_factor)
+        
+        # 높은 속도에서는 더 빠르게 감속
+        if self.speed > 120:
+            deceleration *= 1.5
+            
+        self.target_speed = max(self.min_speed, self.target_speed - deceleration)
+    
+    def press(self, action):
+        """조작 입력 시작 처리 (action: "up", "down", "left", "right")"""
+        if action == "left":
+            self.left_moving = True
+        elif action == "right":
+            self.right_moving = True
+        # 속도 변경을 즉시 적용
+        elif action == "up":
+            self.accelerate()
+            self.key_press_timer["up"] = self.key_press_interval
+        elif action == "down":
+            self.decelerate()
+            self.key_press_timer["down"] = self.key_press_interval
+            self.is_down_key_pressed = True  # 아래 방향키 누름 상태 설정
+            self.brake_lights_on = True  # 브레이크 등 켜기
+    
+    def release(self, action):
+        """조작 입력 해제 처리"""
+        if action == "left":
+            self.left_moving = False
+        elif action == "right":
+            self.right_moving = False
+        # 키 해제 시 타이머 중지
+        elif action == "up":
+            self.key_press_timer["up"] = 0
+        elif action == "down":
+            self.key_press_timer["down"] = 0
+            self.is_down_key_pressed = False  # 아래 방향키 누름 상태 해제
+            # 여기서는 브레이크 등을 끄지 않음 (감속 중일 때 계속 유지)
+    
+    def snapshot(self):
+        """주행 상태를 튜플로 저장 (restore()로 되돌림)"""
+        return self._get_state(self), (self.key_press_timer["up"], self.key_press_timer["down"])
+    
+    def restore(self, state):
+        """snapshot()으로 저장한 주행 상태로 되돌림"""
+        values, (up, down) = state
+        for name, value in zip(self.state_fields, values):
+            setattr(self, name, value)
+        self.key_press_timer = {"up": up, "down": down}
@@ -0,0 +1,99 @@
+import bisect
+import csv
+import time
+from array import array
+
+# 누적 히스토그램 구간 경계 (나노초): 1µs부터 약 1초까지 2배마다 4구간
+BUCKET_EDGES = [int(1000 * 2 ** (i / 4)) for i in range(81)]
+
+class PhaseTimer:
+    """한 구간의 실행 시간 측정기 (with 문으로 사용)
+
+    최근 window개의 측정값은 링 버퍼에 보관해 백분위수를 계산하고,
+    전체 측정값은 로그 간격 히스토그램에 누적한다.
+    """
+
+    def __init__(self, name, window=600):
+        self.name = name
+        self.window = window
+        self.samples = array("q", bytes(8 * window))  # 최근 측정값 (나노초)
+        self.index = 0  # 다음에 쓸 위치
+        self.count = 0  # 전체 측정 횟수
+        self.histogram = [0] * (len(BUCKET_EDGES) + 1)
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.add(time.perf_counter_ns() - self.start)
+
+    def add(self, elapsed_ns):
+        """측정값 하나 추가"""
+        self.samples[self.index] = elapsed_ns
+        self.index = (self.index + 1) % self.window
+        self.count += 1
+        self.histogram[bisect.bisect_right(BUCKET_EDGES, elapsed_ns)] += 1
+
+    def percentiles(self, quantiles=(50, 95, 99)):
+        """최근 측정값의 백분위수 (나노초, 측정값이 없으면 None)"""
+        recent = sorted(self.samples[:min(self.count, self.window)])
+        if not recent:
+            return [None for _ in quantiles]
+        return [recent[min(len(recent) - 1, int(len(recent) * q / 100))] for q in quantiles]
+
+class FrameProfiler:
+    """게임 루프 구간별 실행 시간을 perf_counter_ns로 측정하는 프로파일러
+
+    각 구간은 처음 phase(name)을 호출할 때 만들어지며 측정 순서대로 표시된다.
+    summary()는 화면 표시용으로 refresh_interval초마다만 백분위수를 다시 계산한다.
+    """
+
+    def __init__(self, window=600, refresh_interval=0.5):
+        self.window = window
+        self.refresh_interval = refresh_interval
+        self.phases = {}  # 이름 -> PhaseTimer
+        self.cached_summary = []
+        self.last_refresh = 0.0
+
+    def phase(self, name):
+        """구간 측정기 반환 (with frame_profiler.phase("draw"): ...)"""
+        timer = self.phases.get(name)
+        if timer is None:
+            timer = self.phases[name] = PhaseTimer(name, self.window)
+        return timer
+
+    def summary(self):
+        """측정값이 있는 구간별 (이름, p50, p95, p99) 목록 (밀리초)"""
+        now = time.perf_counter()
+        if now - self.last_refresh >= self.refresh_interval:
+            self.cached_summary = [
+                (timer.name,) + tuple(value / 1e6 for value in timer.percentiles())
+                for timer in self.phases.values() if timer.count > 0
+            ]
+            self.last_refresh = now
+        return self.cached_summary
+
+    def dump_csv(self, path):
+        """구간별 누적 히스토그램을 CSV로 저장 (구간, 하한/상한 µs, 횟수)"""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["phase", "lower_us", "upper_us", "count"])
+            for timer in self.phases.values():
+                for bucket, count in enumerate(timer.histogram):
+                    if count == 0:
+                        continue
+                    lower = BUCKET_EDGES[bucket - 1] / 1000 if bucket > 0 else 0
+                    upper = BUCKET_EDGES[bucket] / 1000 if bucket < len(BUCKET_EDGES) else ""
+                    writer.writerow([timer.name, lower, upper, count])
+        return path
+
+    def reset(self):
+        """모든 측정값 지우기"""
+        self.phases.clear()
+        self.cached_summary = []
+        self.last_refresh = 0.0
+
+# 게임 전체에서 함께 쓰는 프로파일러
+frame_profiler = FrameProfiler()
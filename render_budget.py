@@ -0,0 +1,84 @@
+import time
+
+# 그리기 상세도 단계 (숫자가 클수록 많이 생략)
+FULL_DETAIL = 0  # 모든 효과
+NO_GLOW = 1  # 앞 차량 브레이크등 발광 생략
+NO_TEXT_BOX = 2  # 플레이어 속도 표시의 배경 상자 생략
+SIMPLE_HUD = 3  # 게임 정보를 한 줄로 줄이고 조작 안내 생략
+HALF_RESOLUTION = 4  # 도로 배경과 충돌 번쩍임을 절반 해상도로 그려 확대
+LEVEL_NAMES = ("전체", "발광 생략", "속도 배경 생략", "간단한 정보 표시", "절반 해상도")
+
+class RenderBudget:
+    """그리기 시간이 목표를 넘으면 상세도를 한 단계씩 낮추고, 여유가 생기면 다시 올리는 조절기 (with 문으로 측정)
+
+    측정값은 지수 이동 평균으로 다듬고, 평균이 target_ms를 patience 프레임 연속으로 넘으면 한 단계 낮춘다.
+    평균이 target_ms × headroom 아래로 recovery 프레임 연속 머무르면 한 단계 올린다.
+    낮출 때보다 올릴 때 오래 기다리므로 두 단계 사이를 매 프레임 오가지 않는다.
+    target_ms가 0이면 측정만 하고 상세도는 바꾸지 않는다.
+    """
+
+    def __init__(self, target_ms=8.0, headroom=0.5, smoothing=0.2, patience=10, recovery=120):
+        self.target_ms = target_ms
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self.patience = patience
+        self.recovery = recovery
+        self.level = FULL_DETAIL
+        self.average_ms = 0.0  # 그리기 시간의 지수 이동 평균 (밀리초)
+        self.over = 0  # 목표를 넘은 연속 프레임 수
+        self.under = 0  # 여유가 있던 연속 프레임 수
+        self.level_changes = 0
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.add((time.perf_counter_ns() - self.start) / 1e6)
+
+    def add(self, elapsed_ms):
+        """그리기 시간 측정값 하나 추가 (밀리초) 후 상세도 조절"""
+        self.average_ms += (elapsed_ms - self.average_ms) * self.smoothing
+        if self.target_ms <= 0:
+            return
+        if self.average_ms > self.target_ms:
+            self.over += 1
+            self.under = 0
+            if self.over >= self.patience and self.level < HALF_RESOLUTION:
+                self.set_level(self.level + 1)
+        elif self.average_ms < self.target_ms * self.headroom:
+            self.under += 1
+            self.over = 0
+            if self.under >= self.recovery and self.level > FULL_DETAIL:
+                self.set_level(self.level - 1)
+        else:
+            self.over = 0
+            self.under = 0
+
+    def set_level(self, level):
+        """상세도 단계 변경 (연속 프레임 수는 새 단계에서 다시 셈)"""
+        self.level = level
+        self.over = 0
+        self.under = 0
+        self.level_changes += 1
+
+    @property
+    def glow(self):
+        return self.level < NO_GLOW
+
+    @property
+    def text_box(self):
+        return self.level < NO_TEXT_BOX
+
+    @property
+    def full_hud(self):
+        return self.level < SIMPLE_HUD
+
+    @property
+    def half_resolution(self):
+        return self.level >= HALF_RESOLUTION
+
+    @property
+    def level_name(self):
+        return LEVEL_NAMES[self.level]
\ No newline at end of file
@@ -0,0 +1,198 @@
+import argparse
+import json
+import multiprocessing
+import random
+import struct
+import sys
+import zlib
+from car_simulation import CarSimulation, FRAME_DT
+from session_stats import GOAL_DISTANCE
+
+# 체크섬에 넣는 상태 값 (프레임 번호, 충돌 횟수, 두 차량의 속도/목표 속도/x 위치, 차간 거리, 이동 거리)
+STATE_RECORD = struct.Struct("<qq8d")
+
+class ReplayDivergence(Exception):
+    """재생한 상태가 기록된 체크섬과 다를 때 발생"""
+
+    def __init__(self, frame, expected, actual):
+        super().__init__(f"{frame} 프레임에서 재생 결과가 기록과 다릅니다 (기록 {expected:08x}, 재생 {actual:08x})")
+        self.frame = frame
+        self.expected = expected
+        self.actual = actual
+
+def state_checksum(simulation, previous=0):
+    """차량 상태를 이전 체크섬에 이어서 해시 (CRC32, 매 프레임 누적)"""
+    player = simulation.player_car
+    front = simulation.front_car
+    data = STATE_RECORD.pack(simulation.frame_count, simulation.crash_count,
+                             player.speed, player.target_speed, player.x,
+                             front.speed, front.target_speed, front.x,
+                             simulation.car_distance, simulation.traveled_distance)
+    return zlib.crc32(data, previous)
+
+class InputLog:
+    """한 세션의 재생 기록: 난수 시드, 세션 설정, 프레임 번호가 붙은 조작 입력, 주기적인 상태 체크섬"""
+
+    version = 1
+
+    def __init__(self, seed, dt=FRAME_DT, checksum_interval=60, platoon_size=0, lanes=1, traffic_size=0):
+        self.seed = seed
+        self.dt = dt
+        self.checksum_interval = checksum_interval  # 체크섬을 저장할 프레임 간격
+        self.platoon_size = platoon_size  # 대열 주행 모드의 선행 차량 수 (CarSimulation 인자)
+        self.lanes = lanes  # 차선 수
+        self.traffic_size = traffic_size  # 여러 차선 모드의 주변 차량 수
+        self.events = []  # (프레임, action, pressed)
+        self.checksums = []  # (프레임, 누적 체크섬)
+        self.frames = 0  # 기록한 전체 프레임 수
+
+    def save(self, path):
+        """JSON 파일로 저장"""
+        data = {
+            "version": self.version,
+            "seed": self.seed,
+            "dt": self.dt,
+            "checksum_interval": self.checksum_interval,
+            "platoon_size": self.platoon_size,
+            "lanes": self.lanes,
+            "traffic_size": self.traffic_size,
+            "frames": self.frames,
+            "events": [[frame, action, int(pressed)] for frame, action, pressed in self.events],
+            "checksums": self.checksums
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """JSON 파일에서 읽기"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        log = cls(data["seed"], data["dt"], data["checksum_interval"],
+                  platoon_size=data.get("platoon_size", 0), lanes=data.get("lanes", 1),
+                  traffic_size=data.get("traffic_size", 0))  # 설정이 없는 예전 기록은 기본 세션
+        log.events = [(frame, action, bool(pressed)) for frame, action, pressed in data["events"]]
+        log.checksums = [tuple(entry) for entry in data["checksums"]]
+        log.frames = data["frames"]
+        return log
+
+class RecordingInput:
+    """다른 입력 소스를 감싸 조작 입력과 상태 체크섬을 InputLog에 기록하는 입력 소스
+
+    poll()은 프레임이 시작될 때 불리므로, 그 시점에 직전 프레임이 끝난 상태를 체크섬에 누적한다.
+    """
+
+    def __init__(self, source, log):
+        self.source = source
+        self.log = log
+        self.checksum = 0
+
+    def _track(self, simulation, frame):
+        """frame 프레임이 끝난 상태를 누적하고 간격마다 저장"""
+        self.checksum = state_checksum(simulation, self.checksum)
+        if frame % self.log.checksum_interval == 0:
+            self.log.checksums.append((frame, self.checksum))
+
+    def poll(self, simulation):
+        frame = simulation.frame_count
+        self._track(simulation, frame - 1)
+        events = self.source.poll(simulation)
+        for action, pressed in events:
+            self.log.events.append((frame, action, pressed))
+        self.log.frames = frame
+        return events
+
+    def finish(self, simulation):
+        """마지막 프레임의 상태 체크섬을 저장하고 기록 반환"""
+        frame = simulation.frame_count
+        if not self.log.checksums or self.log.checksums[-1][0] != frame:
+            self.checksum = state_checksum(simulation, self.checksum)
+            self.log.checksums.append((frame, self.checksum))
+        self.log.frames = frame
+        return self.log
+
+class ReplayInput:
+    """InputLog의 조작 입력을 기록된 프레임에 다시 넣고 체크섬을 확인하는 입력 소스"""
+
+    def __init__(self, log, verify=True):
+        self.log = log
+        self.verify = verify
+        self.events = {}  # 프레임 -> [(action, pressed)]
+        for frame, action, pressed in log.events:
+            self.events.setdefault(frame, []).append((action, pressed))
+        self.expected = dict(log.checksums)
+        self.checksum = 0
+
+    def _check(self, simulation, frame):
+        self.checksum = state_checksum(simulation, self.checksum)
+        if self.verify:
+            expected = self.expected.get(frame)
+            if expected is not None and expected != self.checksum:
+                raise ReplayDivergence(frame, expected, self.checksum)
+
+    def poll(self, simulation):
+        frame = simulation.frame_count
+        self._check(simulation, frame - 1)
+        return self.events.get(frame, ())
+
+def replay(log, verify=True, simulation_class=CarSimulation):
+    """기록된 세션을 화면 없이 다시 시뮬레이션하고 결과 사전 반환
+
+    verify가 참이면 상태가 기록과 달라지는 즉시 ReplayDivergence를 발생시킨다.
+    규칙을 바꾼 뒤 다시 채점할 때는 verify=False로 실행한다.
+    """
+    source = ReplayInput(log, verify)
+    sim = simulation_class(rng=random.Random(log.seed), input_source=source, platoon_size=log.platoon_size,
+                           lanes=log.lanes, traffic_size=log.traffic_size)
+    goal_time = None
+    while sim.frame_count < log.frames:
+        sim.update(log.dt)
+        if goal_time is None and sim.traveled_distance >= GOAL_DISTANCE:
+            goal_time = sim.sim_time
+    source._check(sim, sim.frame_count)
+
+    return {
+        "frames": sim.frame_count,
+        "sim_time": sim.sim_time,
+        "crashes": sim.crash_count,
+        "traveled_distance": sim.traveled_distance,
+        "goal_time": goal_time
+    }
+
+def replay_file(task):
+    """기록 파일 하나를 재생 (프로세스 풀 작업 단위)"""
+    path, verify = task
+    result = {"path": path}
+    try:
+        result.update(replay(InputLog.load(path), verify))
+        result["verified"] = verify
+    except ReplayDivergence as e:
+        result["verified"] = False
+        result["diverged_at"] = e.frame
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기록된 세션을 화면 없이 다시 시뮬레이션해 채점합니다.")
+    parser.add_argument("logs", nargs="+", help="재생할 기록 파일 (InputLog JSON)")
+    parser.add_argument("-j", "--workers", type=int, default=multiprocessing.cpu_count(), help="작업 프로세스 수")
+    parser.add_argument("--no-verify", action="store_true", help="체크섬 확인 없이 재생 (규칙을 바꾼 뒤 다시 채점할 때)")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일 (없으면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    tasks = [(path, not args.no_verify) for path in args.logs]
+    if args.workers <= 1 or len(tasks) == 1:
+        results = [replay_file(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(args.workers) as pool:
+            results = pool.map(replay_file, tasks)
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 1 if any(r.get("diverged_at") is not None for r in results) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import pygame
+
+class RoadLayer:
+    """도로 배경과 중앙선을 미리 그려 두고 매 프레임 몇 번의 blit으로 그리는 레이어
+
+    잔디, 도로 면, 경계선은 한 장의 서피스로 합성해 두고,
+    중앙선 점선은 세로 띠 서피스 하나를 주행 거리에 따른 오프셋만큼 밀어서 그린다.
+    차선이 여러 개면 같은 띠를 차선 경계마다 한 번씩 그린다.
+    화면 크기나 도로 폭이 바뀌면 두 캐시를 자동으로 다시 만든다.
+    """
+    grass_color = (100, 180, 100)  # 연한 초록색 (잔디)
+    road_color = (80, 80, 80)
+    border_color = (255, 255, 255)
+    center_line_color = (255, 255, 0)
+    line_length = 30  # 점선 길이
+    gap_length = 20  # 점선 간격
+    line_width = 2
+    strip_margin = 4  # 띠 서피스에서 선 좌우 여백
+
+    def __init__(self):
+        self.cache_key = None
+        self.background = None
+        self.center_strip = None
+
+    def _rebuild(self, size, road_left, road_width):
+        """배경 서피스와 중앙선 띠 서피스 다시 만들기"""
+        width, height = size
+        road_right = road_left + road_width
+
+        # 잔디, 도로, 경계선을 한 장에 합성
+        background = pygame.Surface(size)
+        background.fill(self.grass_color)
+        pygame.draw.rect(background, self.road_color, (road_left, 0, road_width, height))
+        pygame.draw.line(background, self.border_color, (road_left, 0), (road_left, height), 5)
+        pygame.draw.line(background, self.border_color, (road_right, 0), (road_right, height), 5)
+
+        # 점선이 일정 간격으로 반복되는 세로 띠 (검은색은 투명 처리)
+        period = self.line_length + self.gap_length
+        strip = pygame.Surface((self.strip_margin * 2, height + period))
+        strip.fill((0, 0, 0))
+        strip.set_colorkey((0, 0, 0))
+        for line_y in range(0, height + period - self.line_length, period):
+            pygame.draw.line(strip, self.center_line_color,
+                             (self.strip_margin, line_y),
+                             (self.strip_margin, line_y + self.line_length), self.line_width)
+
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+            strip = strip.convert()
+        self.background = background
+        self.center_strip = strip
+        self.cache_key = (size, road_left, road_width)
+
+    def draw(self, screen, road_left, road_width, scroll_distance, lanes=1):
+        """도로 그리기 (scroll_distance: 중앙선을 밀어낼 거리, 픽셀, lanes: 차선 수)
+        
+        중앙선이 그려진 영역을 반환한다 (그린 점선이 없으면 None).
+        차선이 하나면 화면 가운데에 중앙선을, 여러 개면 차선 경계마다 점선을 그린다.
+        """
+        size = screen.get_size()
+        if self.cache_key != (size, road_left, road_width):
+            self._rebuild(size, road_left, road_width)
+        screen.blit(self.background, (0, 0))
+
+        # 화면 안에 온전히 들어오는 점선만 그림 (위/아래로 잘리는 점선은 생략)
+        height = size[1]
+        period = self.line_length + self.gap_length
+        offset = int(scroll_distance) % period
+        first = 0 if offset == 0 else 1
+        last = min((height - 1) // period,
+                   (height - self.line_length - 1 + offset) // period)
+        if last < first:
+            return None
+        top = first * period - offset
+        visible_height = (last - first) * period + self.line_length + self.line_width
+        if lanes <= 1:
+            lines_x = [size[0] // 2]
+        else:
+            lines_x = [road_left + road_width * lane // lanes for lane in range(1, lanes)]
+        drawn = None
+        for line_x in lines_x:
+            rect = screen.blit(self.center_strip, (line_x - self.strip_margin, top),
+                               (0, 0, self.strip_margin * 2, visible_height))
+            drawn = rect if drawn is None else drawn.union(rect)
+        return drawn
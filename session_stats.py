@@ -0,0 +1,164 @@
+import bisect
+import math
+
+GOAL_DISTANCE = 5000  # 목표 지점 (m)
+SAFE_GAP_MIN = 20  # 안전거리 하한 (m)
+SAFE_GAP_MAX = 60  # 안전거리 상한 (m)
+
+class RunningStats:
+    """값을 저장하지 않고 평균과 분산을 누적하는 가중 Welford 누적기
+
+    합과 제곱합을 따로 더하는 방식과 달리 값이 크고 분산이 작아도 자릿수가 사라지지 않는다.
+    가중치로 단계 길이(초)를 주면 단계 크기와 상관없는 시간 평균이 된다.
+    """
+
+    def __init__(self):
+        self.weight = 0.0  # 가중치 합
+        self.mean = 0.0
+        self.m2 = 0.0  # 평균과의 차이 제곱의 가중 합
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value, weight=1.0):
+        """값 하나를 가중치와 함께 누적"""
+        if weight <= 0:
+            return
+        self.weight += weight
+        delta = value - self.mean
+        self.mean += delta * weight / self.weight
+        self.m2 += weight * delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """다른 누적기의 값을 합침 (따로 누적한 구간이나 에피소드를 하나로, Chan의 병렬 결합)"""
+        if other.weight <= 0:
+            return
+        weight = self.weight + other.weight
+        delta = other.mean - self.mean
+        self.mean += delta * other.weight / weight
+        self.m2 += other.m2 + delta * delta * self.weight * other.weight / weight
+        self.weight = weight
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self):
+        """모분산 (누적한 값이 없으면 0)"""
+        return self.m2 / self.weight if self.weight > 0 else 0.0
+
+    def std(self):
+        return math.sqrt(self.variance())
+
+class QuantileSketch:
+    """로그 간격 구간에 가중치를 누적해 분위수를 어림하는 스케치 (메모리는 구간 수만큼 고정)
+
+    구간 경계는 low부터 high까지 두 배마다 per_doubling개이고, 분위수는 그 분위가 들어 있는 구간의
+    기하 중앙값으로 돌려준다 (상대 오차 약 2^(1/(2 × per_doubling)) - 1, 기본 4%). 범위를 벗어난 값은
+    양 끝 구간에 모이며, 결과는 정확히 기록한 최솟값과 최댓값 사이로 제한한다.
+    """
+
+    def __init__(self, low=0.01, high=10000.0, per_doubling=8):
+        count = math.ceil(math.log2(high / low) * per_doubling)
+        self.edges = [low * 2 ** (i / per_doubling) for i in range(count + 1)]
+        self.weights = [0.0] * (count + 2)
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value, weight=1.0):
+        """값 하나를 가중치와 함께 누적"""
+        self.weights[bisect.bisect_right(self.edges, value)] += weight
+        self.total += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """q 백분위수 어림값 (q: 0~100, 누적한 값이 없으면 None)"""
+        if self.total <= 0:
+            return None
+        target = self.total * q / 100
+        cumulative = 0.0
+        for index, weight in enumerate(self.weights):
+            cumulative += weight
+            if weight > 0 and cumulative >= target:
+                break
+        if index == 0:
+            estimate = self.edges[0]
+        elif index > len(self.edges) - 1:
+            estimate = self.edges[-1]
+        else:
+            estimate = math.sqrt(self.edges[index - 1] * self.edges[index])
+        return min(max(estimate, self.min), self.max)
+
+class SessionStats:
+    """한 세션의 주행 통계를 매 단계 O(1) 시간과 고정 메모리로 누적 (결과 화면용)
+
+    update(simulation, dt)를 시뮬레이션 단계마다 부르면 차간 거리의 시간 가중 평균/표준편차,
+    안전거리 구간(20~60m) 안팎에 머문 시간, 충돌까지 남은 시간(TTC)의 최솟값과 분위수,
+    감속 조작 횟수, 목표 지점 도달 시각을 누적한다. 프레임별 값은 저장하지 않으므로 빨리 감기로
+    아무리 긴 세션을 진행해도 메모리는 늘지 않는다.
+
+    TTC는 플레이어가 앞차보다 빠를 때만 차간 거리 / 접근 속도로 계산한다 (시뮬레이션의 차간 거리 변화와 같은 단위).
+    감속 조작은 아래 방향키를 새로 누른 횟수이다 (누르고 있는 동안의 반복 감속은 세지 않음).
+    """
+
+    def __init__(self, goal_distance=GOAL_DISTANCE):
+        self.goal_distance = goal_distance
+        self.gap = RunningStats()  # 차간 거리 (단계 길이 가중)
+        self.ttc = QuantileSketch()  # 접근 중일 때의 TTC (단계 길이 가중)
+        self.elapsed = 0.0  # 누적한 시뮬레이션 시간 (초)
+        self.safe_time = 0.0  # 안전거리 구간 안에 있던 시간
+        self.close_time = 0.0  # 안전거리 하한보다 가까웠던 시간
+        self.far_time = 0.0  # 안전거리 상한보다 멀었던 시간
+        self.decelerations = 0  # 감속 조작 횟수
+        self.down_pressed = False  # 직전 단계에 아래 방향키를 누르고 있었는지
+        self.crashes = 0
+        self.traveled_distance = 0.0
+        self.goal_time = None  # 목표 지점 도달 시각 (초, 도달하지 못했으면 None)
+
+    def update(self, simulation, dt):
+        """시뮬레이션 한 단계(dt초)가 끝난 상태를 누적하고 목표 지점 도달 여부 반환"""
+        gap = simulation.car_distance
+        self.elapsed += dt
+        self.gap.add(gap, dt)
+        if gap < SAFE_GAP_MIN:
+            self.close_time += dt
+        elif gap > SAFE_GAP_MAX:
+            self.far_time += dt
+        else:
+            self.safe_time += dt
+
+        player = simulation.player_car
+        closing = player.speed - simulation.front_car.speed
+        if closing > 0:
+            self.ttc.add(gap / closing, dt)
+
+        if player.is_down_key_pressed and not self.down_pressed:
+            self.decelerations += 1
+        self.down_pressed = player.is_down_key_pressed
+
+        self.crashes = simulation.crash_count
+        self.traveled_distance = simulation.traveled_distance
+        if self.goal_time is None and self.traveled_distance >= self.goal_distance:
+            self.goal_time = simulation.sim_time
+        return self.goal_time is not None
+
+    def report(self):
+        """결과 요약 사전 (TTC 값은 접근한 적이 없으면 None)"""
+        return {
+            "sim_time": self.elapsed,
+            "traveled_distance": self.traveled_distance,
+            "goal_time": self.goal_time,
+            "gap_mean": self.gap.mean,
+            "gap_std": self.gap.std(),
+            "gap_min": self.gap.min if self.gap.weight > 0 else None,
+            "safe_time": self.safe_time,
+            "safe_ratio": self.safe_time / self.elapsed if self.elapsed > 0 else 0.0,
+            "close_time": self.close_time,
+            "far_time": self.far_time,
+            "ttc_min": self.ttc.min if self.ttc.total > 0 else None,
+            "ttc_p5": self.ttc.quantile(5),
+            "ttc_p50": self.ttc.quantile(50),
+            "decelerations": self.decelerations,
+            "crashes": self.crashes
+        }
@@ -0,0 +1,170 @@
+import struct
+import sys
+import threading
+import time
+
+# 기록 수준
+DEBUG = 10
+INFO = 20
+WARNING = 30
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING"}
+
+# 이벤트 종류 (코드 -> (이름, 출력 형식))
+SPEED = 1
+ACCELERATE = 2
+DECELERATE = 3
+CRASH = 4
+FONT_FALLBACK = 5
+
+EVENTS = {
+    SPEED: ("speed", "Target Speed: {a:.1f}, Current Speed: {b:.1f}"),
+    ACCELERATE: ("accelerate", "Accelerating: Target speed = {a:.1f} km/h"),
+    DECELERATE: ("decelerate", "Decelerating: Target speed = {a:.1f} km/h"),
+    CRASH: ("crash", "충돌 발생! (총 {a:.0f}회, 접근 속도 {b:.1f} km/h)"),
+    FONT_FALLBACK: ("font", "한글 폰트를 찾지 못해 기본 폰트를 사용합니다 (후보 파일 {a:.0f}개 중 {b:.0f}개 열기 실패)")
+}
+
+# 고정 크기 기록: 시간(초), 수준, 이벤트 코드, 값 두 개
+RECORD = struct.Struct("<dHHdd")
+
+class Telemetry:
+    """고정 크기 기록을 미리 할당한 링 버퍼에 쓰고, 별도 스레드에서 내보내는 기록 채널
+
+    게임 루프에서는 struct.pack_into로 버퍼에 쓰기만 하고, 출력(stderr 또는 파일)은
+    drain 스레드가 모아서 처리한다. 버퍼가 가득 차면 가장 오래된 기록을 덮어쓰고
+    버린 개수를 dropped에 센다. 수준이 OFF이면 log()는 비교 한 번으로 끝난다.
+    """
+
+    def __init__(self, capacity=4096, level=OFF):
+        self.capacity = capacity
+        self.level = level
+        self.buffer = bytearray(capacity * RECORD.size)
+        self.write_count = 0  # 지금까지 쓴 기록 수
+        self.read_count = 0  # 지금까지 내보낸 기록 수
+        self.dropped = 0  # 내보내기 전에 덮어써진 기록 수
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()  # 기록 시간의 기준점
+
+        # 이벤트별 최소 기록 간격 (초)
+        self.min_intervals = {}
+        self.last_logged = {}
+
+        # 내보내기 설정
+        self.stream = None
+        self.owns_stream = False  # 직접 연 파일인지 여부
+        self.binary = False
+        self.drain_interval = 0.2
+        self.drain_thread = None
+        self.stop_event = threading.Event()
+
+    def enabled_for(self, level):
+        """해당 수준의 기록이 켜져 있는지 확인"""
+        return level >= self.level
+
+    def set_rate_limit(self, event, max_per_second):
+        """이벤트의 초당 최대 기록 횟수 설정 (None이면 제한 없음)"""
+        if max_per_second is None:
+            self.min_intervals.pop(event, None)
+        else:
+            self.min_intervals[event] = 1.0 / max_per_second
+
+    def log(self, level, event, a=0.0, b=0.0):
+        """기록 하나를 링 버퍼에 쓰기"""
+        if level < self.level:
+            return
+        now = time.perf_counter()
+
+        # 이벤트별 속도 제한
+        interval = self.min_intervals.get(event)
+        if interval is not None:
+            if now - self.last_logged.get(event, -interval) < interval:
+                return
+            self.last_logged[event] = now
+
+        with self.lock:
+            offset = (self.write_count % self.capacity) * RECORD.size
+            RECORD.pack_into(self.buffer, offset, now, level, event, a, b)
+            self.write_count += 1
+
+    def debug(self, event, a=0.0, b=0.0):
+        if DEBUG >= self.level:
+            self.log(DEBUG, event, a, b)
+
+    def info(self, event, a=0.0, b=0.0):
+        if INFO >= self.level:
+            self.log(INFO, event, a, b)
+
+    def warning(self, event, a=0.0, b=0.0):
+        if WARNING >= self.level:
+            self.log(WARNING, event, a, b)
+
+    def read(self):
+        """아직 내보내지 않은 기록을 (시간, 수준, 이벤트, a, b) 목록으로 꺼내기"""
+        with self.lock:
+            count = self.write_count
+            start = self.read_count
+            if count - start > self.capacity:
+                self.dropped += count - start - self.capacity
+                start = count - self.capacity
+            data = bytes(self.buffer)
+            self.read_count = count
+        return [RECORD.unpack_from(data, (index % self.capacity) * RECORD.size) for index in range(start, count)]
+
+    def format_record(self, record):
+        """기록 하나를 사람이 읽을 수 있는 한 줄로 변환"""
+        timestamp, level, event, a, b = record
+        name, template = EVENTS.get(event, (str(event), "{a} {b}"))
+        return f"{timestamp - self.origin:.3f} {LEVEL_NAMES.get(level, level)} {name}: {template.format(a=a, b=b)}"
+
+    def drain(self):
+        """쌓인 기록을 출력 대상에 쓰기"""
+        records = self.read()
+        if not records or self.stream is None:
+            return len(records)
+        if self.binary:
+            self.stream.write(b"".join(RECORD.pack(*record) for record in records))
+        else:
+            self.stream.write("".join(self.format_record(record) + "\n" for record in records))
+        self.stream.flush()
+        return len(records)
+
+    def start(self, level=DEBUG, stream=None, path=None, interval=0.2):
+        """기록을 켜고 drain 스레드 시작 (path가 .bin으로 끝나면 이진 기록 그대로 저장)"""
+        self.stop()
+        if path is not None:
+            self.binary = path.endswith(".bin")
+            self.stream = open(path, "wb") if self.binary else open(path, "w", encoding="utf-8")
+            self.owns_stream = True
+        else:
+            self.binary = False
+            self.stream = stream if stream is not None else sys.stderr
+            self.owns_stream = False
+        self.level = level
+        self.origin = time.perf_counter()
+        self.drain_interval = interval
+        self.stop_event.clear()
+        self.drain_thread = threading.Thread(target=self._drain_loop, name="telemetry-drain", daemon=True)
+        self.drain_thread.start()
+
+    def _drain_loop(self):
+        while not self.stop_event.wait(self.drain_interval):
+            self.drain()
+
+    def stop(self):
+        """drain 스레드를 멈추고 남은 기록을 모두 내보내기"""
+        if self.drain_thread is not None:
+            self.stop_event.set()
+            self.drain_thread.join()
+            self.drain_thread = None
+            self.drain()
+            if self.owns_stream:
+                self.stream.close()
+            self.stream = None
+        self.level = OFF
+
+# 게임 전체에서 함께 쓰는 기록 채널 (기본값: 꺼짐)
+telemetry = Telemetry()
+# 매 프레임 나오는 속도 기록은 초당 10번까지만
+telemetry.set_rate_limit(SPEED, 10)
@@ -0,0 +1,43 @@
+import os
+import random
+
+# 디스플레이 없이 실행 (pygame import 전에 설정해야 함)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from car_game import CarGame
+from replay import InputLog, replay
+
+def record_session(path, frames=900, **options):
+    """무작위 키 입력으로 세션 하나를 기록해 저장하고 기록 반환"""
+    game = CarGame(seed=1234, record_input=True, **options)
+    rng = random.Random(5)
+    held = set()
+    for _ in range(frames):
+        if rng.random() < 0.05:
+            action = rng.choice(("up", "down", "left", "right"))
+            game.keyboard.pending.append((action, action not in held))
+            held ^= {action}
+        game.update()
+    log = game.finish_input_log()
+    log.save(path)
+    return game
+
+def test_replay_platoon_session(tmp_path):
+    """대열 주행 세션의 기록을 저장/읽기 후 재생하면 체크섬이 모두 일치"""
+    path = tmp_path / "platoon.json"
+    game = record_session(path, platoon_size=20)
+    log = InputLog.load(path)
+    assert log.platoon_size == 20
+    result = replay(log)
+    assert result["frames"] == game.frame_count
+    assert result["traveled_distance"] == game.traveled_distance
+
+def test_replay_traffic_session(tmp_path):
+    """여러 차선과 주변 차량이 있는 세션도 기록 설정으로 그대로 재생"""
+    path = tmp_path / "traffic.json"
+    game = record_session(path, lanes=3, traffic_size=30)
+    log = InputLog.load(path)
+    assert (log.lanes, log.traffic_size) == (3, 30)
+    result = replay(log)
+    assert result["frames"] == game.frame_count
+    assert result["traveled_distance"] == game.traveled_distance
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from font_cache import shared_fonts
+
+class TextCache:
+    """렌더링된 텍스트 서피스 캐시 (폰트, 문자열, 색상 기준, LRU 방식으로 제거)
+
+    같은 값이 계속 표시되는 동안에는 다시 렌더링하지 않고 저장된 서피스를 재사용한다.
+    항목 수와 서피스 메모리 합계가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 버린다.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=4 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # 키 -> (서피스, 바이트 수)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """font.render와 같은 결과를 캐시에서 찾아 반환 (없으면 렌더링 후 저장)"""
+        key = (font, text, tuple(color), antialias, None if background is None else tuple(background))
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self.entries[key] = (surface, size)
+        self.total_bytes += size
+        self._evict()
+        return surface
+
+    def _evict(self):
+        """한도를 넘는 동안 가장 오래된 항목 제거 (방금 넣은 항목은 남김)"""
+        while len(self.entries) > 1 and (len(self.entries) > self.max_entries or
+                                         self.total_bytes > self.max_bytes):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.total_bytes -= size
+
+    def clear(self):
+        """캐시 비우기"""
+        self.entries.clear()
+        self.total_bytes = 0
+
+# 게임 전체에서 함께 쓰는 텍스트 캐시
+shared_text_cache = TextCache()
+
+def get_sys_font(name, size, bold=False):
+    """pygame.font.SysFont와 같은 시스템 폰트를 이름/크기/굵기별로 한 번만 만들어 반환 (찾은 경로는 디스크에 캐시)"""
+    return shared_fonts.get(name, size, bold)
+
+def render_text(font, text, antialias, color, background=None):
+    """공용 캐시를 통해 텍스트 렌더링 (font.render와 같은 인자 순서)"""
+    return shared_text_cache.render(font, text, antialias, color, background)
@@ -0,0 +1,91 @@
+import heapq
+
+# 부동소수점 누적 오차로 만료 시각을 한 단계 놓치지 않도록 두는 여유 (초)
+TIME_EPSILON = 1e-9
+
+class TimerScheduler:
+    """시뮬레이션 시간 기준으로 이름 붙은 타이머를 관리하는 스케줄러 (이진 힙)
+
+    각 객체는 register()로 타이머 이름과 만료 시 호출할 콜백을 등록하고, start()로 예약한다.
+    이름마다 예약은 하나뿐이라 다시 start()하거나 cancel()하면 이전 예약은 무시된다
+    (힙에서는 꺼낼 때 버리는 지연 삭제). advance()는 만료된 타이머의 콜백만 만료 시각 순서로 호출하므로,
+    아무 타이머도 만료되지 않은 단계에서는 힙의 맨 앞을 한 번 확인하는 것 외에 하는 일이 없다.
+    """
+    __slots__ = ("now", "heap", "active", "paused", "callbacks", "counter")
+
+    def __init__(self, now=0.0):
+        self.now = now  # 현재 시뮬레이션 시간 (초)
+        self.heap = []  # (만료 시각, 예약 번호, 이름)
+        self.active = {}  # 이름 -> (만료 시각, 예약 번호)
+        self.paused = {}  # 이름 -> 멈춘 시점에 남아 있던 시간
+        self.callbacks = {}  # 이름 -> 콜백
+        self.counter = 0  # 예약 번호 (같은 시각에는 먼저 예약한 타이머가 먼저 만료)
+
+    def reset(self, now=0.0):
+        """모든 예약을 지우고 시간을 now로 되돌림 (등록된 콜백은 유지)"""
+        self.now = now
+        self.heap = []
+        self.active = {}
+        self.paused = {}
+        self.counter = 0
+
+    def register(self, name, callback):
+        """타이머 이름과 만료 시 호출할 콜백 등록"""
+        self.callbacks[name] = callback
+
+    def start(self, name, delay):
+        """지금부터 delay초 뒤에 만료되도록 타이머 예약 (이미 예약돼 있으면 다시 예약)"""
+        due = self.now + delay
+        self.counter += 1
+        self.active[name] = (due, self.counter)
+        heapq.heappush(self.heap, (due, self.counter, name))
+
+    def cancel(self, name):
+        """타이머 예약 취소"""
+        self.active.pop(name, None)
+
+    def pause(self, name):
+        """타이머를 멈추고 남은 시간을 보관 (예약돼 있지 않거나 이미 멈췄으면 무시)"""
+        entry = self.active.pop(name, None)
+        if entry is not None:
+            self.paused[name] = entry[0] - self.now
+
+    def resume(self, name):
+        """pause()로 멈춘 타이머를 남은 시간부터 다시 예약"""
+        delay = self.paused.pop(name, None)
+        if delay is not None:
+            self.start(name, delay)
+
+    def pending(self, name):
+        """타이머가 예약돼 있고 아직 만료되지 않았는지"""
+        return name in self.active
+
+    def remaining(self, name):
+        """만료까지 남은 시간 (예약돼 있지 않으면 None)"""
+        entry = self.active.get(name)
+        return None if entry is None else entry[0] - self.now
+
+    def advance(self, now):
+        """현재 시간을 now로 옮기고 만료된 타이머의 콜백 호출"""
+        self.now = now
+        heap = self.heap
+        limit = now + TIME_EPSILON
+        while heap and heap[0][0] <= limit:
+            due, number, name = heapq.heappop(heap)
+            entry = self.active.get(name)
+            if entry is None or entry[1] != number:
+                continue  # 취소되었거나 다시 예약된 타이머
+            del self.active[name]
+            self.callbacks[name]()
+
+    def snapshot(self):
+        """예약 상태를 튜플로 저장 (콜백은 포함하지 않음, 힙은 restore()에서 다시 만듦)"""
+        return self.now, self.counter, tuple(self.active.items()), tuple(self.paused.items())
+
+    def restore(self, state):
+        """snapshot()으로 저장한 예약 상태로 되돌림 (등록된 콜백은 그대로 유지)"""
+        self.now, self.counter, active, paused = state
+        self.active = dict(active)
+        self.paused = dict(paused)
+        self.heap = [(due, number, name) for name, (due, number) in active]
+        heapq.heapify(self.heap)
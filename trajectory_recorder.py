@@ -0,0 +1,164 @@
+import queue
+import threading
+import numpy as np
+
+# 한 행(시뮬레이션 한 단계)에 기록하는 값
+TRAJECTORY_DTYPE = np.dtype([
+    ("frame", "<i8"),  # 시뮬레이션 프레임 번호
+    ("sim_time", "<f8"),  # 시뮬레이션 시간 (초)
+    ("player_speed", "<f8"),
+    ("player_target_speed", "<f8"),
+    ("player_x", "<f8"),
+    ("front_speed", "<f8"),
+    ("front_target_speed", "<f8"),
+    ("front_x", "<f8"),
+    ("car_distance", "<f8"),
+    ("traveled_distance", "<f8"),
+    ("brake_intensity", "<u1"),  # 0: 없음, 1: 약한 브레이크, 2: 강한 브레이크
+    ("driving_mode", "<u1"),  # DRIVING_MODES의 인덱스
+    ("crashed", "?"),  # 이번 단계에 새 충돌이 기록되었는지
+    ("crash_effect", "?"),  # 충돌 효과 표시 중인지
+    ("recovering", "?")  # 충돌 후 회복 중인지
+])
+
+DRIVING_MODES = ("normal", "aggressive", "cautious")
+
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+def _npy_header(dtype, rows, header_size):
+    """행 수만 바꿔 제자리에 다시 쓸 수 있도록 고정 길이로 채운 .npy 헤더 (버전 1.0)"""
+    header = repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (rows,)})
+    header = header.ljust(header_size - len(NPY_MAGIC) - 2 - 1) + "\n"
+    return NPY_MAGIC + (len(header)).to_bytes(2, "little") + header.encode("latin1")
+
+def _npy_header_size(dtype):
+    """가장 긴 행 수로 만든 헤더가 들어가는 크기 (64바이트 정렬)"""
+    longest = repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (2 ** 63,)})
+    size = len(NPY_MAGIC) + 2 + len(longest) + 1
+    return (size + 63) // 64 * 64
+
+class TrajectoryRecorder:
+    """시뮬레이션 매 단계를 메모리 맵 .npy 파일에 행 단위로 기록하는 기록기
+
+    record()는 미리 할당한 구조화 배열(chunk_rows행)에 한 행을 채우기만 하고,
+    배열이 가득 차면 flush 스레드에 넘긴 뒤 새 배열로 바꾼다. flush 스레드는
+    파일을 grow_rows행 단위로 늘려 가며 메모리 맵에 복사하고, 복사가 끝나면
+    헤더의 행 수를 갱신한다. 따라서 기록 중에도 np.load(path, mmap_mode="r")로
+    지금까지 내보낸 행을 복사 없이 읽을 수 있다. close()는 남은 행을 쓰고 파일을
+    정확한 크기로 잘라 일반 .npy 파일로 마무리한다.
+    """
+
+    def __init__(self, path, chunk_rows=1024, grow_rows=65536):
+        self.path = path
+        self.dtype = TRAJECTORY_DTYPE
+        self.chunk_rows = chunk_rows
+        self.grow_rows = max(grow_rows, chunk_rows)
+        self.header_size = _npy_header_size(self.dtype)
+
+        # 메인 루프 쪽 버퍼
+        self.buffer = np.empty(chunk_rows, dtype=self.dtype)
+        self.buffer_rows = 0  # 버퍼에 채운 행 수
+        self.rows = 0  # 지금까지 기록한 전체 행 수
+        self.last_crash_count = 0  # 새 충돌 감지용
+
+        # flush 스레드 쪽 파일 상태 (flush 스레드만 접근)
+        self.file = open(path, "w+b")
+        self.file.write(_npy_header(self.dtype, 0, self.header_size))
+        self.file.flush()
+        self.capacity = 0  # 파일에 확보한 행 수
+        self.mapped = None
+        self.flushed_rows = 0  # 파일에 써서 읽을 수 있는 행 수
+
+        self.pending = queue.Queue()
+        self.flush_thread = threading.Thread(target=self._flush_loop, name="trajectory-flush", daemon=True)
+        self.flush_thread.start()
+
+    def record(self, simulation):
+        """시뮬레이션의 현재 상태를 한 행으로 기록"""
+        player = simulation.player_car
+        front = simulation.front_car
+        crashed = simulation.crash_count > self.last_crash_count
+        self.last_crash_count = simulation.crash_count
+        self.buffer[self.buffer_rows] = (
+            simulation.frame_count,
+            simulation.sim_time,
+            player.speed,
+            player.target_speed,
+            player.x,
+            front.speed,
+            front.target_speed,
+            front.x,
+            simulation.car_distance,
+            simulation.traveled_distance,
+            front.brake_intensity,
+            DRIVING_MODES.index(simulation.current_driving_mode),
+            crashed,
+            simulation.show_crash_effect,
+            simulation.collision_recovery
+        )
+        self.buffer_rows += 1
+        self.rows += 1
+        if self.buffer_rows == self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """버퍼에 모인 행을 flush 스레드로 넘기기"""
+        if self.buffer_rows == 0:
+            return
+        self.pending.put(self.buffer[:self.buffer_rows])
+        self.buffer = np.empty(self.chunk_rows, dtype=self.dtype)
+        self.buffer_rows = 0
+
+    def _flush_loop(self):
+        while True:
+            rows = self.pending.get()
+            if rows is None:
+                break
+            self._write_rows(rows)
+
+    def _write_rows(self, rows):
+        """행들을 파일 끝에 쓰고 헤더의 행 수 갱신 (flush 스레드)"""
+        end = self.flushed_rows + len(rows)
+        if end > self.capacity:
+            # 파일을 grow_rows 단위로 늘리고 다시 매핑
+            self.capacity = (end + self.grow_rows - 1) // self.grow_rows * self.grow_rows
+            if self.mapped is not None:
+                self.mapped.flush()
+                self.mapped = None
+            self.file.truncate(self.header_size + self.capacity * self.dtype.itemsize)
+            self.mapped = np.memmap(self.file, dtype=self.dtype, mode="r+",
+                                    offset=self.header_size, shape=(self.capacity,))
+        self.mapped[self.flushed_rows:end] = rows
+        self.mapped.flush()
+        self.flushed_rows = end
+        self._write_header(end)
+
+    def _write_header(self, rows):
+        self.file.seek(0)
+        self.file.write(_npy_header(self.dtype, rows, self.header_size))
+        self.file.flush()
+
+    def close(self):
+        """남은 행을 모두 쓰고 파일을 기록한 행 수에 맞게 잘라 닫기"""
+        if self.file is None:
+            return
+        self.flush()
+        self.pending.put(None)
+        self.flush_thread.join()
+        if self.mapped is not None:
+            self.mapped.flush()
+            self.mapped = None
+        self.file.truncate(self.header_size + self.flushed_rows * self.dtype.itemsize)
+        self._write_header(self.flushed_rows)
+        self.file.close()
+        self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def load_trajectory(path):
+    """기록 파일을 복사 없이 읽기 전용 메모리 맵으로 열기 (기록 중인 파일도 가능)"""
+    return np.load(path, mmap_mode="r")
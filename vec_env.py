@@ -0,0 +1,133 @@
+import random
+import numpy as np
+from batch_engine import CarPairBatch
+from session_stats import GOAL_DISTANCE, SAFE_GAP_MIN, SAFE_GAP_MAX
+from car_simulation import CarSimulation, FRAME_DT
+
+# 행동 코드 - PlayerCar 조작 입력("up", "down", "left", "right")에 대응
+NOOP = 0
+ACCELERATE = 1
+DECELERATE = 2
+LEFT = 3
+RIGHT = 4
+ACTION_NAMES = (None, "up", "down", "left", "right")
+
+# 관측 배열의 열 (차간 거리 m, 속도 km/h, 좌우 간격 픽셀, 브레이크등 0/1)
+OBSERVATION_FIELDS = ("car_distance", "player_speed", "player_target_speed", "front_speed",
+                      "lateral_offset", "front_brake_lights")
+
+class CarFollowingVecEnv:
+    """CarGame 규칙으로 N개 세션을 한 번에 진행하는 학습용 벡터 환경 (gym VectorEnv와 비슷한 인터페이스)
+
+    앞 차량과 플레이어 속도는 CarPairBatch로 진행하고, 키를 누르고 있는 동안의 반복 가속/감속과 좌우 이동은
+    PlayerCarModel과 같은 규칙을 배열로 적용한다. 행동은 이번 단계에 누르고 있을 키(행동 코드)이고,
+    관측/보상/종료는 모두 길이 N의 배열이다. 충돌은 CarSimulation과 같이 두 차량의 사각형이 겹치는 것으로 판정하며
+    (차간 거리가 contact_distance보다 가깝고 좌우로도 겹침), 충돌이나 목표 지점 도달, 시간 제한으로 끝난 세션은
+    그 자리에서 새 세션으로 바뀐다 (끝난 순간의 관측은 info["final_observation"]).
+
+    보상은 안전거리 구간(20~60m) 안에서 초당 +1, 20m보다 가까우면 초당 -1, 충돌하면 -crash_penalty이다.
+    """
+    crash_penalty = 10.0
+    max_time = 600  # 세션 최대 시뮬레이션 시간 (초, 넘으면 중단)
+
+    def __init__(self, n=1, seed=None, dt=FRAME_DT):
+        self.dt = dt
+        self.seed = seed
+        # 두 차량이 세로로 겹치기 시작하는 차간 거리 (화면 크기와 원근감 규칙은 CarSimulation과 같음)
+        probe = CarSimulation(rng=random.Random(0))
+        self.contact_distance = probe.contact_distance
+        self.player_width = probe.player_car.width
+        self.front_width = probe.front_car.orig_width
+        self.lateral_speed = probe.player_car.lateral_speed
+        self.key_press_interval = probe.player_car.key_press_interval
+        self.reset(n, seed)
+
+    def reset(self, n=None, seed=None):
+        """N개(생략하면 지금 개수)의 새 세션을 시작하고 관측 배열 반환"""
+        if n is not None:
+            self.n = n
+        if seed is not None:
+            self.seed = seed
+        self.pairs = CarPairBatch(self.n, rng=self.seed)
+        self.player_x = np.full(self.n, (self.pairs.road_left + self.pairs.road_right) / 2)
+        self.held = np.zeros(self.n, dtype=np.int8)  # 지난 단계에 누르고 있던 키 (행동 코드)
+        self.key_timer = np.zeros(self.n)  # 가속/감속 키 반복 입력 타이머 (PlayerCarModel.key_press_timer)
+        self.elapsed = np.zeros(self.n)  # 세션별 경과 시간 (초)
+        return self.observe()
+
+    def observe(self):
+        """관측 배열 (N × len(OBSERVATION_FIELDS), float32)"""
+        pairs = self.pairs
+        return np.stack((pairs.car_distance, pairs.speed, pairs.target_speed, pairs.front.speed,
+                         self.player_x - pairs.front.x, pairs.front.brake_lights_on), axis=1).astype(np.float32)
+
+    def _press(self, actions):
+        """행동을 키 누름/해제로 바꿔 적용 (PlayerCarModel.press/release와 같은 규칙)"""
+        changed = actions != self.held
+        up = changed & (actions == ACCELERATE)
+        down = changed & (actions == DECELERATE)
+        self.pairs.accelerate(up)
+        self.pairs.decelerate(down)
+        self.key_timer = np.where(up | down, self.key_press_interval, np.where(changed, 0.0, self.key_timer))
+        self.held = actions
+
+    def _hold(self, dt):
+        """누르고 있는 키의 좌우 이동과 반복 가속/감속 (PlayerCarModel.update와 같은 순서)"""
+        road_left, road_right = self.pairs.road_left, self.pairs.road_right
+        self.player_x -= np.where(self.held == LEFT, self.lateral_speed * dt * 60, 0.0)
+        self.player_x += np.where(self.held == RIGHT, self.lateral_speed * dt * 60, 0.0)
+
+        # 긴 시간 간격에서는 그 사이에 발생했을 반복 입력을 모두 적용
+        running = self.key_timer > 0
+        self.key_timer = np.where(running, self.key_timer - dt, self.key_timer)
+        fired = running & (self.key_timer <= 0)
+        repeats = np.where(fired, 1 + (-self.key_timer / self.key_press_interval).astype(np.int64), 0)
+        self.key_timer = np.where(fired, self.key_press_interval, self.key_timer)
+        for count in range(1, int(repeats.max(initial=0)) + 1):
+            remaining = repeats >= count
+            self.pairs.accelerate(remaining & (self.held == ACCELERATE))
+            self.pairs.decelerate(remaining & (self.held == DECELERATE))
+
+        half_width = self.player_width // 2
+        np.clip(self.player_x, road_left + half_width + 5, road_right - half_width - 5, out=self.player_x)
+
+    def step(self, actions):
+        """모든 세션을 한 단계 진행하고 (관측, 보상, 종료, info) 반환
+
+        info는 배열 사전이다: crashed(충돌), goal(목표 지점 도달), truncated(시간 제한), final_observation.
+        """
+        actions = np.asarray(actions, dtype=np.int8)
+        dt = self.dt
+        pairs = self.pairs
+        self._press(actions)
+        self._hold(dt)
+        pairs.update(dt)
+        self.elapsed += dt
+
+        # 충돌 판정: 세로로 겹치는 거리 안에서 좌우 간격이 두 차량 폭의 절반 합보다 좁으면 충돌
+        gap = pairs.car_distance
+        size = np.maximum(0.3, 1.0 - np.minimum(1.0, gap / 350) * 0.75)  # CarSimulation._size_ratio_for_distance
+        half_widths = (self.player_width + (self.front_width * size).astype(np.int64)) / 2
+        crashed = (gap < self.contact_distance) & (np.abs(self.player_x - pairs.front.x) < half_widths)
+
+        safe = (gap >= SAFE_GAP_MIN) & (gap <= SAFE_GAP_MAX)
+        reward = np.where(safe, dt, np.where(gap < SAFE_GAP_MIN, -dt, 0.0)) - self.crash_penalty * crashed
+        goal = pairs.traveled_distance >= GOAL_DISTANCE
+        truncated = self.elapsed >= self.max_time
+        done = crashed | goal | truncated
+
+        observation = self.observe()
+        info = {"crashed": crashed, "goal": goal, "truncated": truncated & ~crashed & ~goal,
+                "final_observation": observation.copy()}
+        if done.any():
+            self._reset_where(done)
+            observation[done] = self.observe()[done]
+        return observation, reward.astype(np.float32), done, info
+
+    def _reset_where(self, mask):
+        """끝난 세션만 새 세션으로 바꿈"""
+        self.pairs.reset(mask)
+        self.player_x[mask] = (self.pairs.road_left + self.pairs.road_right) / 2
+        self.held[mask] = NOOP
+        self.key_timer[mask] = 0.0
+        self.elapsed[mask] = 0.0